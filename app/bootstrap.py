@@ -0,0 +1,76 @@
+import os
+from typing import Any, Dict, Optional
+
+from app.core.browser_service import (BrowserService, RealBrowserService, MockBrowserService,
+                                      CachingBrowserService)
+from app.core.rate_limiter import AdaptiveRateLimiter
+from app.core.repository import PersonRepository
+from app.infra.storage.excel_storage import ExcelRepository
+from app.infra.storage.sqlite_storage import SqliteRepository
+from app.infra.storage.profile_cache import SqliteProfileCache
+from app.infra.storage.html_snapshots import HtmlSnapshotStore
+from app.scraper.routing import RoutingPolicy
+
+# Composition commune à l'IHM (main.py) et au crawl sans IHM (crawl.py)
+
+def build_storage(config: Dict[str, Any]) -> PersonRepository:
+    """
+    Construit le stockage configuré : base SQLite (session complète) ou fichier Excel.
+    """
+    excel_path = config['settings']['export_path']
+    storage_cfg = config.get('storage', {})
+
+    if storage_cfg.get('backend', 'excel') == 'sqlite':
+        db_path = storage_cfg.get('sqlite_path', 'data/linkedin.db')
+        is_new = not os.path.exists(db_path)
+        storage = SqliteRepository(db_path)
+        if is_new and os.path.exists(excel_path):
+            # Première utilisation : reprise des profils intéressants de l'export Excel existant
+            print("Import de l'export Excel existant dans la base SQLite...")
+            excel = ExcelRepository(excel_path, journal=True)
+            storage.save_all(excel.load_existing_persons())
+            excel.close()
+        return storage
+
+    return ExcelRepository(excel_path,
+                           journal=storage_cfg.get('journal', False),
+                           compaction_threshold=storage_cfg.get('compaction_threshold', 200),
+                           idle_delay=storage_cfg.get('idle_compaction_delay', 30))
+
+def build_browser_service(config: Dict[str, Any], headless: Optional[bool] = None,
+                          workers: int = 1, defer_navigation: bool = False) -> BrowserService:
+    """
+    Construit le service navigateur (mock ou Playwright), avec le cache de profils si activé.
+    `headless` remplace `settings.headless` (réglage propre au crawl sans IHM).
+    `workers` : nombre de processus partageant le compte, entre lesquels le débit `delays` est réparti.
+    `defer_navigation` : un profil servi par le cache n'est affiché qu'à la lecture de ses relations
+    (crawl sans IHM ; l'IHM garde la page visible sur la personne sélectionnée).
+    """
+    if config['settings'].get('mock', False):
+        print("Démarrage en mode MOCK")
+        browser_service = MockBrowserService.from_config(config)
+    else:
+        print("Démarrage en mode PLAYWRIGHT")
+        browser_cfg = config.get('browser', {})
+        snapshots_cfg = config.get('snapshots', {})
+        snapshots = HtmlSnapshotStore(snapshots_cfg.get('directory', 'data/snapshots')) \
+            if snapshots_cfg.get('enabled', False) else None
+        browser_service = RealBrowserService(headless=config['settings']['headless'] if headless is None else headless,
+                                             pool_size=browser_cfg.get('pool_size', 2),
+                                             page_recycle_after=browser_cfg.get('page_recycle_after', 50),
+                                             snapshots=snapshots,
+                                             profile_timeout=browser_cfg.get('profile_timeout', 5.0),
+                                             field_timeout=browser_cfg.get('field_timeout', 1.0),
+                                             routing=RoutingPolicy.from_config(config),
+                                             limiter=AdaptiveRateLimiter.from_config(config, workers),
+                                             har_mode=browser_cfg.get('har', {}).get('mode', 'off'),
+                                             har_path=browser_cfg.get('har', {}).get('path'))
+
+    cache_cfg = config.get('profile_cache', {})
+    if cache_cfg.get('enabled', False):
+        # Les profils déjà extraits (cette session ou une précédente) ne sont pas rechargés
+        cache = SqliteProfileCache(cache_cfg.get('path', 'data/profile_cache.db'),
+                                   ttl=cache_cfg.get('ttl_days', 30) * 86400,
+                                   max_entries=cache_cfg.get('max_entries', 5000))
+        browser_service = CachingBrowserService(browser_service, cache, defer_navigation=defer_navigation)
+    return browser_service
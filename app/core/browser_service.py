@@ -4,6 +4,10 @@ import asyncio
 import random
 from app.scraper.browser import LinkedInBrowser
 from app.scraper.parsers import LinkedInParser
+from app.scraper.synthetic_graph import SyntheticGraph, FaultInjector
+from app.core.profile_cache import ProfileCache
+from app.core.navigation import NavigationScheduler
+from app.core.metrics import metrics
 
 class BrowserService(ABC):
     """Abstract interface for browser interactions."""
@@ -28,6 +32,16 @@ class BrowserService(ABC):
         """Navigates to a profile and extracts data."""
         pass
 
+    @abstractmethod
+    async def fetch_profile_data(self, url: str) -> Dict:
+        """Extracts profile data without touching the visible page (prefetch)."""
+        pass
+
+    @abstractmethod
+    async def open_profile(self, url: str):
+        """Shows a profile in the visible page, without extracting it."""
+        pass
+
     @abstractmethod
     async def get_relations(self) -> List[Dict]:
         """Opens the 'show all' modal and extracts suggestions."""
@@ -42,9 +56,17 @@ class BrowserService(ABC):
 class RealBrowserService(BrowserService):
     """Implementation using real Playwright browser."""
 
-    def __init__(self, headless: bool = False):
-        self.browser = LinkedInBrowser(headless=headless)
+    def __init__(self, headless: bool = False, pool_size: int = 2, page_recycle_after: int = 50,
+                 snapshots=None, profile_timeout: float = 5.0, field_timeout: float = 1.0, routing=None,
+                 limiter=None, har_mode: str = "off", har_path: Optional[str] = None):
+        self.browser = LinkedInBrowser(headless=headless, pool_size=pool_size,
+                                       page_recycle_after=page_recycle_after, routing=routing,
+                                       limiter=limiter, har_mode=har_mode, har_path=har_path)
         self.parser = LinkedInParser()
+        self.snapshots = snapshots # HtmlSnapshotStore optionnel (HTML brut des profils visités)
+        # Budget d'extraction : attente du nom, puis délai par champ manquant (secondes)
+        self.profile_timeout = profile_timeout
+        self.field_timeout = field_timeout
 
     async def start(self):
         await self.browser.start()
@@ -57,11 +79,39 @@ class RealBrowserService(BrowserService):
 
     async def get_profile_data(self, url: str) -> Dict:
         await self.browser.go_to_profile(url)
-        return await self.parser.extract_main_profile(self.browser.page, url)
+        await self._snapshot(self.browser.page, url)
+        return await self._extract(self.browser.page, url)
+
+    async def fetch_profile_data(self, url: str) -> Dict:
+        # Page secondaire empruntée au pool : la page visible reste sur la personne en cours d'analyse
+        async with self.browser.lease() as page:
+            await self.browser.go_to_profile(url, page=page)
+            await self._snapshot(page, url)
+            return await self._extract(page, url)
+
+    async def _extract(self, page, url: str) -> Dict:
+        with metrics.timer("parser.profile"):
+            return await self.parser.extract_main_profile(page, url, timeout=self.profile_timeout,
+                                                          field_timeout=self.field_timeout)
+
+    async def _snapshot(self, page, url: str):
+        """Conserve le HTML de la page (avant extraction : utile justement si le parser échoue)."""
+        if not self.snapshots:
+            return
+        try:
+            html = await page.content()
+            # Compression et écriture hors de la boucle d'événements
+            await asyncio.to_thread(self.snapshots.save, url, html)
+        except Exception as e:
+            print(f"Erreur instantané HTML pour {url}: {e}")
+
+    async def open_profile(self, url: str):
+        await self.browser.go_to_profile(url)
 
     async def get_relations(self) -> List[Dict]:
         await self.browser.open_show_all_modal()
-        suggestions = await self.parser.extract_modal_suggestions(self.browser.page)
+        with metrics.timer("parser.relations"):
+            suggestions = await self.parser.extract_modal_suggestions(self.browser.page)
         # Close the modal
         try:
             await self.browser.page.click('button[aria-label="Dismiss"]', timeout=2000)
@@ -74,10 +124,24 @@ class RealBrowserService(BrowserService):
 
 
 class MockBrowserService(BrowserService):
-    """Implementation using mock data."""
+    """Implementation using mock data.
+
+    Les profils et relations viennent d'un graphe social synthétique déterministe (SyntheticGraph) ;
+    latences, erreurs et expirations sont simulées selon la section `mock` de la configuration.
+    """
 
-    def __init__(self):
+    def __init__(self, graph: Optional[SyntheticGraph] = None, faults: Optional[FaultInjector] = None,
+                 verbose: bool = True):
         self.on_close_callback = None
+        self.graph = graph or SyntheticGraph()
+        self.faults = faults or FaultInjector()
+        self.verbose = verbose
+        self._current_url: Optional[str] = None # Profil affiché dans la "page visible"
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "MockBrowserService":
+        return cls(SyntheticGraph.from_config(config), FaultInjector.from_config(config),
+                   verbose=config.get('mock', {}).get('verbose', True))
 
     async def start(self):
         print("Mock Browser started.")
@@ -88,28 +152,151 @@ class MockBrowserService(BrowserService):
     async def login_manual(self):
         print("Mock Login successful.")
 
+    async def _simulate(self, latency, what: str):
+        delay, incident = self.faults.draw(latency)
+        await asyncio.sleep(delay) # Simulate network delay
+        if incident == "timeout":
+            raise asyncio.TimeoutError(f"Mock timeout ({what})")
+        if incident == "error":
+            raise RuntimeError(f"Mock error ({what})")
+
     async def get_profile_data(self, url: str) -> Dict:
-        print(f"Mock navigating to {url}...")
-        await asyncio.sleep(0.1) # Simulate network delay
-        return {
-            "nom": "Jean Dupont (Mock)",
-            "titre": "Développeur Python Senior",
-            "societe": "Mock Corp",
-            "lieu": "Paris, France",
-            "url": url
-        }
+        await self.open_profile(url)
+        return await self.fetch_profile_data(url)
+
+    async def fetch_profile_data(self, url: str) -> Dict:
+        await self._simulate(self.faults.profile_latency, url)
+        data = self.graph.profile(self.graph.node_of(url))
+        data["url"] = url
+        data["missing"] = []
+        return data
+
+    async def open_profile(self, url: str):
+        if self.verbose:
+            print(f"Mock navigating to {url}...")
+        self._current_url = url
 
     async def get_relations(self) -> List[Dict]:
-        print("Mock fetching relations...")
-        await asyncio.sleep(0.1) # Simulate network delay
-        return [
-            {
-                "nom": f"Relation Mock {i}",
-                "titre": "Ingenieur Mock",
-                "url": f"https://www.linkedin.com/in/mock-relation-{i}/"
-            }
-            for i in range(1, 6)
-        ]
+        if self.verbose:
+            print("Mock fetching relations...")
+        await self._simulate(self.faults.relations_latency, "relations")
+        if not self._current_url:
+            return []
+        return self.graph.suggestions(self.graph.node_of(self._current_url))
 
     def set_on_close_callback(self, callback):
         self.on_close_callback = callback
+
+
+class CachingBrowserService(BrowserService):
+    """Décorateur ajoutant un cache de profils (TTL, LRU) à n'importe quel BrowserService.
+
+    Sur un profil en cache, la page visible est ouverte sur ce profil (l'IHM l'affiche). Avec
+    `defer_navigation` (crawl sans IHM), la navigation est différée jusqu'à `get_relations` :
+    les profils dont on ne lit pas les relations ne sont jamais chargés.
+    """
+
+    def __init__(self, inner: BrowserService, cache: ProfileCache, defer_navigation: bool = False):
+        self.inner = inner
+        self.cache = cache
+        self.defer_navigation = defer_navigation
+        # Profil servi depuis le cache sans navigation : la page visible n'y est pas encore
+        self._unvisited_url: Optional[str] = None
+
+    async def start(self):
+        await self.inner.start()
+
+    async def stop(self):
+        stats = self.cache.stats()
+        if stats:
+            print(f"Cache profils : {stats.get('hits', 0)} hits, {stats.get('misses', 0)} misses, "
+                  f"{stats.get('evictions', 0)} évictions")
+        self.cache.close()
+        await self.inner.stop()
+
+    async def login_manual(self):
+        await self.inner.login_manual()
+
+    async def get_profile_data(self, url: str) -> Dict:
+        cached = self.cache.get(url)
+        if cached is not None:
+            metrics.increment("cache.hits")
+            if self.defer_navigation:
+                self._unvisited_url = url
+            else:
+                self._unvisited_url = None
+                await self.inner.open_profile(url)
+            return cached
+        metrics.increment("cache.misses")
+        self._unvisited_url = None
+        data = await self.inner.get_profile_data(url)
+        self._remember(url, data)
+        return data
+
+    async def fetch_profile_data(self, url: str) -> Dict:
+        cached = self.cache.get(url)
+        if cached is not None:
+            metrics.increment("cache.hits")
+            return cached
+        metrics.increment("cache.misses")
+        data = await self.inner.fetch_profile_data(url)
+        self._remember(url, data)
+        return data
+
+    def _remember(self, url: str, data: Dict):
+        # Une page sans nom (hors profil, chargement incomplet) n'est pas mise en cache
+        if data and data.get('nom'):
+            self.cache.put(url, data)
+
+    async def open_profile(self, url: str):
+        self._unvisited_url = None
+        await self.inner.open_profile(url)
+
+    async def get_relations(self) -> List[Dict]:
+        # Les relations sont lues sur la page visible : navigation différée jusqu'ici
+        if self._unvisited_url:
+            url, self._unvisited_url = self._unvisited_url, None
+            await self.inner.open_profile(url)
+        return await self.inner.get_relations()
+
+    def set_on_close_callback(self, callback):
+        self.inner.set_on_close_callback(callback)
+
+
+class ScheduledBrowserService(BrowserService):
+    """Décorateur ordonnançant les opérations d'un BrowserService sur la page visible.
+
+    Les opérations sur la page visible sont sérialisées ; un nouveau chargement de profil annule
+    le précédent (SupersededError pour l'appelant remplacé), la page converge donc vers la dernière
+    personne sélectionnée. Les demandes identiques en cours (même URL) sont partagées.
+    """
+
+    def __init__(self, inner: BrowserService):
+        self.inner = inner
+        self.visible = NavigationScheduler()
+        self.background = NavigationScheduler() # Déduplication des extractions sur pages secondaires
+
+    async def start(self):
+        await self.inner.start()
+
+    async def stop(self):
+        await self.inner.stop()
+
+    async def login_manual(self):
+        await self.visible.run(self.inner.login_manual)
+
+    async def get_profile_data(self, url: str) -> Dict:
+        return await self.visible.load(("profile", url), lambda: self.inner.get_profile_data(url))
+
+    async def fetch_profile_data(self, url: str) -> Dict:
+        return await self.background.share(url, lambda: self.inner.fetch_profile_data(url))
+
+    async def open_profile(self, url: str):
+        await self.visible.load(("open", url), lambda: self.inner.open_profile(url))
+
+    async def get_relations(self) -> List[Dict]:
+        # Jamais annulé : attend la fin du chargement en cours sur la page visible
+        return await self.visible.run(self.inner.get_relations)
+
+    def set_on_close_callback(self, callback):
+        self.inner.set_on_close_callback(callback)
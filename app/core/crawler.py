@@ -0,0 +1,302 @@
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from app.core.matcher import KeywordMatcher
+from app.core.metrics import metrics
+from app.core.models import Personne
+from app.core.profile_cache import canonical_url
+from app.core.services import WorkflowManager
+from app.core.work_queue import WorkItem, WorkQueue
+
+CHECKPOINT_VERSION = 1
+
+@dataclass
+class CrawlStats:
+    visited: int = 0
+    interesting: int = 0
+    failures: int = 0
+    discovered: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def rate_per_hour(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.visited * 3600.0 / elapsed if elapsed > 0 else 0.0
+
+class BatchCrawler:
+    """Exploration automatique sans IHM, à partir d'URLs de départ.
+
+    Le crawler prend la tête de la file du workflow (l'ordre dépend des fonctions de score :
+    distance au départ seule pour un parcours en largeur, `scheduler.weights` pour un parcours
+    par priorité), extrait le profil, le qualifie avec les mots-clés et ajoute toutes ses relations
+    à la file, jusqu'à `max_persons` profils visités ou `max_depth` sauts depuis le départ.
+    Les décisions passent par le workflow et partent donc au stockage au fil de l'eau.
+
+    Le point de reprise (JSON) conserve les URLs découvertes (avec la source de chaque suggestion)
+    et les décisions prises : un crawl interrompu reprend là où il s'est arrêté, même avec un
+    stockage Excel qui ne conserve que les profils intéressants.
+    """
+    def __init__(self, workflow: WorkflowManager, browser, matcher: KeywordMatcher,
+                 max_persons: int = 100, max_depth: Optional[int] = None,
+                 checkpoint_path: Optional[str] = None, checkpoint_every: int = 10, retries: int = 1):
+        self.workflow = workflow
+        self.browser = browser
+        self.matcher = matcher
+        self.max_persons = max_persons
+        self.max_depth = max_depth
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.retries = retries
+        self.stats = CrawlStats()
+        self._discovered: List[list] = []       # [url, source_url, nom, titre], dans l'ordre d'ajout
+        self._decisions: Dict[str, bool] = {}   # URL visitée -> intéressante
+        self._failed: List[str] = []
+        self._stopping = False
+
+    # --- File et reprise ---
+
+    def add_seeds(self, urls: Iterable[str]) -> None:
+        for url in urls:
+            self._discover(url)
+
+    def _discover(self, url: str, source_url: Optional[str] = None,
+                  nom: Optional[str] = None, titre: Optional[str] = None) -> None:
+        added = self.workflow.add_person(url, source_url=source_url, nom=nom, titre=titre)
+        # Les suggestions en doublon sont aussi journalisées : elles comptent pour le score par sources
+        if added or source_url:
+            self._discovered.append([url, source_url, nom, titre])
+        if added:
+            self.stats.discovered += 1
+
+    def resume(self) -> bool:
+        """Recharge le point de reprise dans le workflow. Retourne False s'il n'existe pas."""
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return False
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"Erreur lecture du point de reprise {self.checkpoint_path}: {e}")
+            return False
+        if state.get("version") != CHECKPOINT_VERSION:
+            print(f"Point de reprise ignoré (version {state.get('version')})")
+            return False
+
+        for url, source_url, nom, titre in state.get("discovered", []):
+            self._discover(url, source_url, nom, titre)
+        for url, interesting in state.get("decisions", {}).items():
+            person = self.workflow.all_persons.get(url)
+            if person is not None:
+                # Déjà à jour si le stockage restitue la session complète (SQLite)
+                if not person.analyzed or person.interesting != interesting:
+                    self._qualify(person, interesting)
+                self._decisions[url] = interesting
+        self._failed = list(state.get("failed", []))
+        self.stats.visited = state.get("visited", len(self._decisions))
+        self.stats.interesting = sum(self._decisions.values())
+        self.stats.failures = len(self._failed)
+        print(f"Reprise : {self.stats.visited} profils déjà visités, "
+              f"{self.workflow.counters.pending} en attente")
+        return True
+
+    def save_checkpoint(self) -> None:
+        """Écrit le point de reprise de façon atomique (fichier temporaire puis remplacement)."""
+        if not self.checkpoint_path:
+            return
+        state = {"version": CHECKPOINT_VERSION, "visited": self.stats.visited,
+                 "discovered": self._discovered, "decisions": self._decisions, "failed": self._failed}
+        try:
+            directory = os.path.dirname(self.checkpoint_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = self.checkpoint_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp, self.checkpoint_path)
+        except Exception as e:
+            print(f"Erreur écriture du point de reprise : {e}")
+
+    # --- Exploration ---
+
+    def stop(self) -> None:
+        """Demande l'arrêt après le profil en cours."""
+        self._stopping = True
+
+    async def run(self) -> CrawlStats:
+        try:
+            while not self._stopping and self.stats.visited < self.max_persons:
+                person = self.workflow.get_next_person()
+                if person is None:
+                    print("File vide : exploration terminée.")
+                    break
+                await self._visit(person)
+                if self.stats.visited % self.checkpoint_every == 0:
+                    self.save_checkpoint()
+        finally:
+            # Interruption (Ctrl+C, erreur) comprise : la reprise repart du dernier profil terminé
+            self.save_checkpoint()
+        return self.stats
+
+    async def _visit(self, person: Personne) -> None:
+        infos = await self._fetch(person.url)
+        if infos is None:
+            self.stats.visited += 1
+            self.stats.failures += 1
+            self._failed.append(person.url)
+            self._qualify(person, False)
+            return
+        self.workflow.update_person_info(person, infos)
+
+        # Relations avant la décision : un crawl interrompu ici revisite le profil à la reprise
+        if self.max_depth is None or self.workflow.hops.get(person.url, 0) < self.max_depth:
+            try:
+                suggestions = await self.browser.get_relations()
+            except Exception as e:
+                print(f"Erreur lors du chargement des relations de {person.url}: {e}")
+                suggestions = []
+            for s in suggestions:
+                self._discover(s['url'], person.url, s.get('nom'), s.get('titre'))
+
+        interesting = self.matcher.matches(person.titre)
+        self._qualify(person, interesting)
+        self.stats.visited += 1
+        if interesting:
+            self.stats.interesting += 1
+        print(f"[{self.stats.visited}/{self.max_persons}] {person.nom} - {person.titre or ''}"
+              f"{' -> intéressant' if interesting else ''}")
+
+    async def _fetch(self, url: str) -> Optional[Dict]:
+        """Extrait le profil ; None après `retries` nouvelles tentatives infructueuses."""
+        for attempt in range(self.retries + 1):
+            try:
+                infos = await self.browser.get_profile_data(url)
+                if infos.get('nom'):
+                    return infos
+                print(f"Profil illisible (tentative {attempt + 1}) : {url}")
+            except Exception as e:
+                print(f"Erreur extraction {url} (tentative {attempt + 1}): {e}")
+        return None
+
+    def _qualify(self, person: Personne, interesting: bool) -> None:
+        apply_decision(self.workflow, person, interesting)
+        self._decisions[person.url] = interesting
+
+def apply_decision(workflow: WorkflowManager, person: Personne, interesting: bool) -> None:
+    """Décision automatique, appliquée comme un clic dans l'IHM (persistée par le workflow)."""
+    workflow.mark_analyzed(person)
+    workflow.set_current_person(person)
+    workflow.set_current_person_decision(interesting)
+    metrics.increment("crawl.interesting" if interesting else "crawl.rejected")
+
+class QueueWorker:
+    """Worker d'un crawl multi-processus : même parcours que BatchCrawler, mais la frontière
+    et le dédoublonnage sont portés par une WorkQueue partagée.
+
+    Chaque processus a son propre navigateur et emprunte une URL à la fois. Les résultats restent
+    dans la file : le processus coordinateur est le seul à écrire dans le stockage (`report_results`).
+    L'ordre est donné par la priorité calculée à la découverte : distance au départ (parcours en
+    largeur), éventuellement complétée par le score mots-clés du titre suggéré.
+    """
+    def __init__(self, queue: WorkQueue, browser, matcher: KeywordMatcher, worker: str,
+                 max_persons: int = 100, max_depth: Optional[int] = None, keyword_weight: float = 0.0,
+                 hop_weight: float = 1.0, retries: int = 1, poll_interval: float = 1.0):
+        self.queue = queue
+        self.browser = browser
+        self.matcher = matcher
+        self.worker = worker
+        self.max_persons = max_persons
+        self.max_depth = max_depth
+        self.keyword_weight = keyword_weight
+        self.hop_weight = hop_weight
+        self.retries = retries
+        self.poll_interval = poll_interval
+        self.stats = CrawlStats()
+
+    def priority(self, hops: int, titre: Optional[str]) -> float:
+        return self.keyword_weight * self.matcher.score(titre) - self.hop_weight * hops
+
+    async def run(self) -> CrawlStats:
+        while True:
+            item = self.queue.lease(self.worker, max_processed=self.max_persons)
+            if item is None:
+                counts = self.queue.stats()
+                # Des URLs empruntées par d'autres workers peuvent encore alimenter la file
+                if counts["leased"] == 0 or counts["done"] + counts["failed"] + counts["leased"] >= self.max_persons:
+                    break
+                await asyncio.sleep(self.poll_interval)
+                continue
+            await self._process(item)
+        return self.stats
+
+    async def _process(self, item: WorkItem) -> None:
+        try:
+            infos = await self.browser.get_profile_data(item.url)
+            if not infos.get('nom'):
+                raise ValueError("profil illisible")
+        except Exception as e:
+            print(f"[{self.worker}] Erreur extraction {item.url} (tentative {item.attempts}): {e}")
+            self.queue.fail(item.url, self.worker, max_attempts=self.retries + 1)
+            if item.attempts > self.retries:
+                self.stats.failures += 1
+            return
+        self.queue.renew(item.url, self.worker)
+
+        if self.max_depth is None or item.hops < self.max_depth:
+            try:
+                suggestions = await self.browser.get_relations()
+            except Exception as e:
+                print(f"[{self.worker}] Erreur lors du chargement des relations de {item.url}: {e}")
+                suggestions = []
+            hops = item.hops + 1
+            self.stats.discovered += self.queue.add(
+                WorkItem(s['url'], item.url, s.get('nom'), s.get('titre'), hops, self.priority(hops, s.get('titre')))
+                for s in suggestions)
+
+        interesting = self.matcher.matches(infos.get('titre'))
+        if self.queue.complete(item.url, self.worker, infos, interesting):
+            self.stats.visited += 1
+            self.stats.interesting += int(interesting)
+            metrics.increment("profiles.analyzed")
+            print(f"[{self.worker}] {infos.get('nom')} - {infos.get('titre') or ''}"
+                  f"{' -> intéressant' if interesting else ''}")
+
+def prime_queue(queue: WorkQueue, workflow: WorkflowManager) -> Dict[str, str]:
+    """Prépare la file à partir du workflow chargé : les personnes déjà analysées (IHM, crawls
+    précédents) sont marquées connues et ne seront pas revisitées. Retourne l'index
+    URL canonique (clé de la file) -> URL du workflow, utilisé par `report_results`."""
+    index = {canonical_url(url): url for url in workflow.all_persons}
+    queue.mark_known(url for url, p in workflow.all_persons.items() if p.analyzed)
+    return index
+
+def report_results(queue: WorkQueue, workflow: WorkflowManager, index: Optional[Dict[str, str]] = None,
+                   limit: int = 500) -> int:
+    """Reporte les profils traités par les workers dans le workflow (et donc le stockage).
+    Appelé par le seul processus coordinateur ; retourne le nombre de résultats reportés.
+
+    Les URLs de la file sont canoniques : elles sont rapportées à la personne du workflow de même
+    URL canonique (`index`, complété au fil des ajouts). Une personne déjà analysée garde sa décision."""
+    if index is None:
+        index = {canonical_url(url): url for url in workflow.all_persons}
+    reported = 0
+    while True:
+        results = queue.results(limit)
+        if not results:
+            return reported
+        for r in results:
+            key = index.get(r.url)
+            person = workflow.all_persons.get(key) if key else None
+            if person is None:
+                source_url = index.get(r.source_url, r.source_url) if r.source_url else None
+                person = workflow.add_person(r.url, source_url=source_url, nom=r.nom, titre=r.titre) \
+                    or workflow.all_persons[r.url]
+                index[r.url] = person.url
+            elif person.analyzed:
+                continue
+            if r.data:
+                workflow.update_person_info(person, r.data)
+            apply_decision(workflow, person, r.interesting)
+        queue.acknowledge(r.url for r in results)
+        reported += len(results)
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, List, Tuple
+
+class ChangeKind(Enum):
+    """Types de changements publiés par le workflow."""
+    PERSON_ADDED = "person_added"          # Nouvelle(s) personne(s) dans all_persons
+    FIELDS_UPDATED = "fields_updated"      # Nom, titre, société ou lieu modifiés
+    DECISION_CHANGED = "decision_changed"  # État analysée / intéressante modifié
+    CURRENT_CHANGED = "current_changed"    # Personne en cours d'analyse (ancienne et nouvelle URL)
+    PRIORITY_CHANGED = "priority_changed"  # Score d'une personne en attente modifié (ordre de la file)
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Changement d'état, avec les URLs des personnes concernées."""
+    kind: ChangeKind
+    urls: Tuple[str, ...]
+
+ChangeListener = Callable[[ChangeEvent], None]
+
+class EventBus:
+    """Bus de notification synchrone : chaque abonné reçoit les événements dans l'ordre de publication."""
+    def __init__(self):
+        self._listeners: List[ChangeListener] = []
+
+    def subscribe(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ChangeListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def publish(self, kind: ChangeKind, *urls: str) -> None:
+        if not self._listeners:
+            return
+        event = ChangeEvent(kind, tuple(url for url in urls if url))
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                # Un abonné défaillant ne doit pas bloquer le workflow
+                print(f"Erreur abonné {kind.value}: {e}")
@@ -0,0 +1,125 @@
+import heapq
+import itertools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.core.models import Personne
+from app.core.matcher import KeywordMatcher
+
+# Fonction de score : (personne, workflow) -> score. Plus le score est élevé, plus la personne est prioritaire.
+Scorer = Callable[[Personne, Any], float]
+
+class Frontier:
+    """File de priorité (tas binaire) des URLs à explorer.
+
+    Insertion, mise à jour de score et suppression en O(log n) ; consultation de la tête en O(1) amorti.
+    À score égal, l'ordre de découverte est conservé (FIFO). Les entrées remplacées ou supprimées
+    sont invalidées sur place et purgées paresseusement.
+    """
+    def __init__(self):
+        self._heap: List[list] = []                 # [-score, ordre, url, valide]
+        self._entries: Dict[str, list] = {}         # URL -> entrée valide
+        self._order = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._entries
+
+    def score(self, url: str) -> Optional[float]:
+        entry = self._entries.get(url)
+        return -entry[0] if entry else None
+
+    def push(self, url: str, score: float = 0.0) -> None:
+        """Ajoute une URL ou met à jour son score (elle garde son rang de découverte)."""
+        previous = self._entries.get(url)
+        if previous:
+            if previous[0] == -score:
+                return
+            previous[3] = False
+            order = previous[1]
+        else:
+            order = next(self._order)
+        entry = [-score, order, url, True]
+        self._entries[url] = entry
+        heapq.heappush(self._heap, entry)
+        self._compact_if_needed()
+
+    def remove(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry:
+            entry[3] = False
+            self._compact_if_needed()
+
+    def peek(self) -> Optional[str]:
+        """Retourne l'URL la plus prioritaire sans la retirer."""
+        heap = self._heap
+        while heap and not heap[0][3]:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def pop(self) -> Optional[str]:
+        url = self.peek()
+        if url is not None:
+            heapq.heappop(self._heap)
+            del self._entries[url]
+        return url
+
+    def peek_many(self, n: int) -> List[str]:
+        """Retourne les n URLs les plus prioritaires, dans l'ordre, sans modifier la file.
+        Parcours du tas en meilleur d'abord : O(k log k) pour k entrées visitées."""
+        heap = self._heap
+        result: List[str] = []
+        candidates: List[Tuple[list, int]] = [(heap[0], 0)] if heap else []
+        while candidates and len(result) < n:
+            entry, index = heapq.heappop(candidates)
+            if entry[3]:
+                result.append(entry[2])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(candidates, (heap[child], child))
+        return result
+
+    def _compact_if_needed(self) -> None:
+        # Reconstruction quand les entrées invalides dominent, pour borner la taille du tas
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[3]]
+            heapq.heapify(self._heap)
+
+
+class KeywordScorer:
+    """Score = nombre de mots-clés (filters.keywords) distincts présents dans le titre."""
+    def __init__(self, matcher: KeywordMatcher):
+        self.matcher = matcher
+
+    def __call__(self, person: Personne, workflow) -> float:
+        return float(self.matcher.score(person.titre))
+
+
+class HopDistanceScorer:
+    """Score = -(nombre de sauts depuis le profil de départ) : les profils proches passent devant."""
+    def __call__(self, person: Personne, workflow) -> float:
+        return -float(workflow.hops.get(person.url, 0))
+
+
+class SourceCountScorer:
+    """Score = nombre de profils distincts ayant suggéré cette URL."""
+    def __call__(self, person: Personne, workflow) -> float:
+        return float(len(workflow.sources.get(person.url, ())))
+
+
+def build_scorers(config: Dict[str, Any]) -> List[Tuple[Scorer, float]]:
+    """Construit les fonctions de score pondérées à partir de la section `scheduler.weights`."""
+    weights = config.get('scheduler', {}).get('weights', {}) or {}
+    factories = {
+        'keywords': lambda: KeywordScorer(KeywordMatcher.from_config(config)),
+        'hops': HopDistanceScorer,
+        'sources': SourceCountScorer,
+    }
+    scorers = []
+    for name, weight in weights.items():
+        if name not in factories:
+            print(f"Fonction de score inconnue ignorée : {name}")
+            continue
+        if weight:
+            scorers.append((factories[name](), float(weight)))
+    return scorers
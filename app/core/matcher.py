@@ -0,0 +1,100 @@
+import re
+import unicodedata
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+def fold(text: str) -> str:
+    """Normalise un texte pour la comparaison : sans accents et insensible à la casse."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+class KeywordMatcher:
+    """Moteur de correspondance titre / mots-clés, compilé une seule fois.
+
+    Les mots-clés sont repliés (accents, casse) puis réunis dans une seule expression régulière
+    en alternance, bornée aux limites de mots ("Lead" ne correspond pas à "Leader").
+    Les résultats par titre sont mémorisés dans un cache LRU borné.
+    """
+    def __init__(self, keywords: Iterable[str], cache_size: int = 10000):
+        self.keywords = list(keywords)
+        folded = {fold(kw).strip() for kw in self.keywords}
+        # Les plus longs d'abord : "head of" est préféré à "head" à la même position
+        alternatives = sorted((kw for kw in folded if kw), key=len, reverse=True)
+        self._pattern = re.compile(r"(?<!\w)(?:" + "|".join(map(re.escape, alternatives)) + r")(?!\w)") \
+            if alternatives else None
+        self._cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self.cache_size = cache_size
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "KeywordMatcher":
+        """Retourne le moteur partagé correspondant à `filters.keywords` (compilé une seule fois)."""
+        return _shared_matcher(tuple(config.get('filters', {}).get('keywords', []) or []))
+
+    def hits(self, title: Optional[str]) -> FrozenSet[str]:
+        """Mots-clés (repliés) distincts trouvés dans le titre."""
+        if not title or self._pattern is None:
+            return frozenset()
+        cached = self._cache.get(title)
+        if cached is not None:
+            self._cache.move_to_end(title)
+            return cached
+        result = frozenset(self._pattern.findall(fold(title)))
+        self._remember(title, result)
+        return result
+
+    def matches(self, title: Optional[str]) -> bool:
+        return bool(self.hits(title))
+
+    def score(self, title: Optional[str]) -> int:
+        """Nombre de mots-clés distincts présents dans le titre."""
+        return len(self.hits(title))
+
+    def hits_many(self, titles: List[Optional[str]]) -> List[FrozenSet[str]]:
+        """Version par lot : les titres absents du cache sont analysés en un seul passage
+        de l'expression régulière sur leur concaténation."""
+        results: List[Optional[FrozenSet[str]]] = [None] * len(titles)
+        todo: Dict[str, List[int]] = {}
+        for i, title in enumerate(titles):
+            if not title or self._pattern is None:
+                results[i] = frozenset()
+            elif title in self._cache:
+                self._cache.move_to_end(title)
+                results[i] = self._cache[title]
+            else:
+                todo.setdefault(title, []).append(i)
+
+        if todo:
+            pending = list(todo)
+            # Les titres sont séparés par un saut de ligne : c'est une limite de mot pour le motif
+            folded = [fold(title).replace("\n", " ") for title in pending]
+            starts: List[int] = []
+            offset = 0
+            for text in folded:
+                starts.append(offset)
+                offset += len(text) + 1
+            found: List[set] = [set() for _ in pending]
+            for m in self._pattern.finditer("\n".join(folded)):
+                found[bisect_right(starts, m.start()) - 1].add(m.group(0))
+            for title, keywords in zip(pending, found):
+                result = frozenset(keywords)
+                self._remember(title, result)
+                for i in todo[title]:
+                    results[i] = result
+        return results
+
+    def match_many(self, titles: List[Optional[str]]) -> List[bool]:
+        return [bool(h) for h in self.hits_many(titles)]
+
+    def score_many(self, titles: List[Optional[str]]) -> List[int]:
+        return [len(h) for h in self.hits_many(titles)]
+
+    def _remember(self, title: str, result: FrozenSet[str]) -> None:
+        self._cache[title] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+@lru_cache(maxsize=8)
+def _shared_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
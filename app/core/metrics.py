@@ -0,0 +1,211 @@
+import csv
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+PERCENTILES = (50, 90, 99)
+
+class Histogram:
+    """Durées d'une étape : totaux depuis le démarrage et fenêtre glissante pour les percentiles."""
+    def __init__(self, window: int = 1000):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._window: Deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self._window.append(value)
+
+    def percentiles(self, ps: Iterable[int] = PERCENTILES) -> Dict[int, float]:
+        values = sorted(self._window)
+        if not values:
+            return {p: 0.0 for p in ps}
+        last = len(values) - 1
+        return {p: values[min(last, round(p / 100 * last))] for p in ps}
+
+class MetricsRegistry:
+    """Instrumentation légère des étapes critiques (chronomètres, compteurs, débit).
+
+    Une mesure coûte un appel à `perf_counter` et un ajout dans une deque ; le registre est
+    partagé entre la boucle asyncio et le thread d'écriture (verrou court).
+    """
+    def __init__(self, window: int = 1000, throughput_horizon: float = 3600.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.enabled = True
+        self.window = window
+        self.throughput_horizon = throughput_horizon
+        self._clock = clock
+        self._started = clock()
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._events: Dict[str, Deque[float]] = {}   # Horodatage des événements, pour le débit
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    # --- Mesures ---
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self.window)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Chronomètre un bloc : `with metrics.timer("browser.goto"): ...`."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.observe(name, self._clock() - start)
+
+    def timed(self, name: str):
+        """Décorateur chronométrant une fonction (synchrone ou coroutine)."""
+        def decorator(func):
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.timer(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def increment(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        now = self._clock()
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+            events = self._events.setdefault(name, deque())
+            events.extend([now] * n)
+            horizon = now - self.throughput_horizon
+            while events and events[0] < horizon:
+                events.popleft()
+
+    def per_hour(self, name: str) -> float:
+        """Débit de l'événement sur la fenêtre glissante (ou depuis le démarrage si plus court), par heure."""
+        now = self._clock()
+        with self._lock:
+            events = self._events.get(name)
+            if not events:
+                return 0.0
+            horizon = now - self.throughput_horizon
+            recent = sum(1 for t in events if t >= horizon)
+        elapsed = min(self.throughput_horizon, now - self._started)
+        return recent * 3600.0 / elapsed if elapsed > 0 else 0.0
+
+    # --- Restitution ---
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            timers = {
+                name: {"count": h.count, "total": h.total, "mean": h.total / h.count if h.count else 0.0,
+                       "max": h.max, **{f"p{p}": v for p, v in h.percentiles().items()}}
+                for name, h in self.histograms.items()
+            }
+            counters = dict(self.counters)
+        return {
+            "uptime": self._clock() - self._started,
+            "timers": timers,
+            "counters": counters,
+            "per_hour": {name: self.per_hour(name) for name in counters},
+        }
+
+    def status_line(self) -> str:
+        """Résumé pour la barre d'état : débit et latences principales."""
+        parts = [f"Débit : {self.per_hour('profiles.analyzed'):.0f} profils/h"]
+        with self._lock:
+            for name, label in (("browser.goto", "chargement"), ("parser.profile", "extraction")):
+                histogram = self.histograms.get(name)
+                if histogram and histogram.count:
+                    p = histogram.percentiles((50, 90))
+                    parts.append(f"{label} p50 {p[50]:.2f} s / p90 {p[90]:.2f} s")
+        return " | ".join(parts)
+
+    def dump(self, path: str) -> None:
+        """Écrit les métriques en JSON, ou en CSV (une ligne par chronomètre) si l'extension est .csv."""
+        snapshot = self.snapshot()
+        try:
+            if path.endswith(".csv"):
+                columns = ["count", "total", "mean", "max"] + [f"p{p}" for p in PERCENTILES]
+                with open(path, "w", newline="", encoding="utf-8") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["name"] + columns)
+                    for name, values in sorted(snapshot["timers"].items()):
+                        writer.writerow([name] + [values[c] for c in columns])
+                    for name, value in sorted(snapshot["counters"].items()):
+                        writer.writerow([name, value] + [""] * (len(columns) - 1))
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, indent=2)
+        except Exception as e:
+            print(f"Erreur export des métriques : {e}")
+
+    def prometheus_text(self) -> str:
+        """Format texte d'exposition Prometheus (résumés et compteurs)."""
+        snapshot = self.snapshot()
+        lines = []
+        for name, values in sorted(snapshot["timers"].items()):
+            metric = _prometheus_name(name) + "_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for p in PERCENTILES:
+                lines.append(f'{metric}{{quantile="{p / 100}"}} {values[f"p{p}"]}')
+            lines.append(f"{metric}_sum {values['total']}")
+            lines.append(f"{metric}_count {values['count']}")
+        for name, value in sorted(snapshot["counters"].items()):
+            metric = _prometheus_name(name) + "_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Expose `/metrics` (format Prometheus) sur un serveur HTTP local, dans un thread démon."""
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                found = self.path.startswith("/metrics")
+                body = registry.prometheus_text().encode("utf-8") if found else b""
+                self.send_response(200 if found else 404)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+        print(f"Métriques exposées sur http://{host}:{self._server.server_address[1]}/metrics")
+
+    def close(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+def _prometheus_name(name: str) -> str:
+    return "linkedin_explorer_" + "".join(c if c.isalnum() else "_" for c in name)
+
+# Registre partagé par les points d'instrumentation de l'application
+metrics = MetricsRegistry()
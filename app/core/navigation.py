@@ -0,0 +1,76 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+Operation = Callable[[], Awaitable[Any]]
+
+class SupersededError(Exception):
+    """Chargement abandonné : une sélection plus récente l'a remplacé."""
+
+class NavigationScheduler:
+    """Ordonnanceur des opérations d'une page : une seule opération à la fois, le dernier
+    chargement demandé l'emporte (les précédents sont annulés) et les demandes identiques
+    en cours sont partagées au lieu d'être relancées."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()                      # Sérialise les opérations sur la page
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._waiters: Dict[asyncio.Future, int] = {}    # Appelants en attente de chaque tâche
+        self._latest_key: Optional[Hashable] = None
+
+    async def load(self, key: Hashable, operation: Operation) -> Any:
+        """Chargement "dernier gagnant" : annule le chargement précédent s'il porte sur une autre clé.
+        Lève SupersededError si ce chargement est lui-même remplacé avant d'aboutir."""
+        task = self._inflight.get(key)
+        if task is None:
+            previous = self._inflight.pop(self._latest_key, None) if self._latest_key is not None else None
+            if previous is not None:
+                previous.cancel()
+            task = self._start(key, self.run(operation))
+            self._latest_key = key
+        return await self._wait(key, task)
+
+    async def share(self, key: Hashable, operation: Operation) -> Any:
+        """Déduplication seule : une demande identique déjà en cours est partagée (pas de sérialisation)."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start(key, operation())
+        return await self._wait(key, task)
+
+    async def run(self, operation: Operation) -> Any:
+        """Exécute une opération en exclusivité sur la page (après celles déjà en file)."""
+        async with self._lock:
+            return await operation()
+
+    def _start(self, key: Hashable, coroutine: Awaitable[Any]) -> asyncio.Future:
+        task = asyncio.ensure_future(coroutine)
+        self._inflight[key] = task
+
+        def forget(done: asyncio.Future):
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            if self._latest_key == key and key not in self._inflight:
+                self._latest_key = None
+
+        task.add_done_callback(forget)
+        return task
+
+    async def _wait(self, key: Hashable, task: asyncio.Future) -> Any:
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # shield : l'annulation d'un appelant n'annule pas la tâche partagée avec les autres
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if task.cancelled():
+                raise SupersededError(str(key)) from None
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():
+                    # Plus personne n'attend le résultat : l'opération est annulée (page, jetons de débit),
+                    # et l'appelant ne rend la main qu'une fois la page libérée
+                    if self._inflight.get(key) is task:
+                        del self._inflight[key]
+                    task.cancel()
+                    await asyncio.wait({task})
@@ -0,0 +1,88 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.events import ChangeEvent, ChangeKind
+
+class ProfilePrefetcher:
+    """Précharge en arrière-plan les profils des prochaines personnes de la file "A analyser".
+
+    Les `depth` premières personnes en attente sont extraites via `BrowserService.fetch_profile_data`
+    (pages secondaires, la page visible n'est pas touchée), avec au plus `concurrency` extractions
+    simultanées. Les résultats sont gardés dans un cache borné. Quand l'ordre de la file change,
+    les préchargements sortis du top N sont annulés et les nouveaux entrants sont lancés.
+    """
+    # Événements susceptibles de modifier la tête de file
+    RESCHEDULE_ON = (ChangeKind.PERSON_ADDED, ChangeKind.DECISION_CHANGED, ChangeKind.PRIORITY_CHANGED)
+
+    def __init__(self, workflow, browser, depth: int = 3, concurrency: int = 2,
+                 cache_size: int = 50):
+        self.workflow = workflow
+        self.browser = browser
+        self.depth = depth
+        self.cache_size = cache_size
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._scheduled = False
+        self.workflow.events.subscribe(self._on_workflow_change)
+
+    def _on_workflow_change(self, event: ChangeEvent):
+        # Plusieurs événements dans le même tour de boucle donnent une seule replanification
+        if event.kind in self.RESCHEDULE_ON and not self._scheduled:
+            self._scheduled = True
+            asyncio.get_event_loop().call_soon(self.reschedule)
+
+    def reschedule(self):
+        """Aligne les préchargements sur les `depth` premières personnes de la file."""
+        self._scheduled = False
+        targets = [p.url for p in self.workflow.peek_pending(self.depth)]
+        wanted = set(targets)
+        for url, task in list(self._tasks.items()):
+            if url not in wanted:
+                task.cancel()
+                del self._tasks[url]
+        # Lancement dans l'ordre de priorité : le sémaphore sert les tâches dans l'ordre d'attente
+        for url in targets:
+            if url not in self._tasks and url not in self._results:
+                self._tasks[url] = asyncio.create_task(self._prefetch(url))
+
+    async def _prefetch(self, url: str):
+        task = asyncio.current_task()
+        try:
+            async with self._semaphore:
+                infos = await self.browser.fetch_profile_data(url)
+            self._results[url] = infos
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+            return infos
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Erreur préchargement pour {url}: {e}")
+            return None
+        finally:
+            if self._tasks.get(url) is task:
+                del self._tasks[url]
+
+    def claim(self, url: str) -> Optional["asyncio.Future"]:
+        """Retire de la gestion du préchargeur le résultat (ou l'extraction en cours) d'une URL.
+
+        Retourne un awaitable donnant les données du profil, ou None si rien n'a été préchargé.
+        Une extraction réclamée n'est plus annulée par les replanifications suivantes."""
+        if url in self._results:
+            future = asyncio.get_event_loop().create_future()
+            future.set_result(self._results.pop(url))
+            return future
+        return self._tasks.pop(url, None)
+
+    def is_ready(self, url: str) -> bool:
+        return url in self._results
+
+    def stop(self):
+        """Annule les préchargements en cours et se désabonne du workflow."""
+        self.workflow.events.unsubscribe(self._on_workflow_change)
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+        self._results.clear()
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+def canonical_url(url: str) -> str:
+    """Forme canonique d'une URL de profil : https, hôte www.linkedin.com, sans paramètres,
+    ancre ni slash final (les variantes d'une même URL partagent ainsi la même clé de cache)."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        # Les identifiants de profil LinkedIn sont insensibles à la casse
+        host, path = "www.linkedin.com", path.lower()
+    return urlunsplit(("https", host, path, "", ""))
+
+class ProfileCache(ABC):
+    """Interface abstraite d'un cache des profils extraits (dictionnaire du parser par URL)."""
+    @abstractmethod
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Retourne le profil en cache s'il existe et n'est pas expiré, sinon None."""
+        pass
+
+    @abstractmethod
+    def put(self, url: str, data: Dict[str, Any]) -> None:
+        """Enregistre le profil extrait avec l'heure d'extraction."""
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs du cache (hits, misses, évictions...)."""
+        return {}
+
+    def close(self) -> None:
+        """Libère les ressources du cache."""
+        pass
@@ -0,0 +1,102 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+class AdaptiveRateLimiter:
+    """Limiteur de débit global des navigations : seau à jetons avec gigue, rythme adaptatif (AIMD).
+
+    L'intervalle entre deux navigations reste dans [min_interval, max_interval] (`delays.min_wait` /
+    `delays.max_wait`). Chaque succès rapide raccourcit l'intervalle (augmentation additive du débit),
+    une réponse lente le rallonge légèrement, une erreur le double (diminution multiplicative) et une
+    page de vérification (checkpoint, authwall) le ramène au maximum après une pause globale.
+    """
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 3.0, burst: int = 1,
+                 jitter: float = 0.3, additive_step: float = 0.05, backoff: float = 0.5,
+                 latency_target: float = 4.0, challenge_pause: float = 120.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+                 rng: Optional[random.Random] = None):
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.burst = max(1, burst)
+        self.jitter = jitter
+        self.additive_step = additive_step    # Gain de débit (navigations/s) par succès
+        self.backoff = backoff                # Facteur de débit après une erreur
+        self.latency_target = latency_target  # Au-delà (secondes), la réponse est jugée lente
+        self.challenge_pause = challenge_pause
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        # Départ prudent : rythme le plus lent, puis accélération au fil des succès
+        self._rate = 1.0 / self.max_interval
+        self._tokens = float(self.burst)
+        self._last = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.successes = 0
+        self.errors = 0
+        self.challenges = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], workers: int = 1) -> "AdaptiveRateLimiter":
+        """`workers` : nombre de processus naviguant sur le même compte. Chacun reçoit une part
+        égale du débit configuré (intervalles multipliés d'autant), le total restant celui de `delays`."""
+        delays = config.get('delays', {}) or {}
+        share = max(1, workers)
+        return cls(min_interval=float(delays.get('min_wait', 1.0)) * share,
+                   max_interval=float(delays.get('max_wait', 3.0)) * share,
+                   burst=int(delays.get('burst', 1)),
+                   jitter=float(delays.get('jitter', 0.3)),
+                   latency_target=float(delays.get('latency_target', 4.0)),
+                   challenge_pause=float(delays.get('challenge_pause', 120.0)))
+
+    @property
+    def interval(self) -> float:
+        """Intervalle courant entre deux navigations (secondes, hors gigue)."""
+        return 1.0 / self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(float(self.burst), self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    async def acquire(self) -> None:
+        """Attend l'autorisation de lancer une navigation (ordre d'arrivée respecté)."""
+        async with self._lock:
+            now = self._clock()
+            if self._paused_until > now:
+                await self._sleep(self._paused_until - now)
+                now = self._clock()
+            self._refill(now)
+            if self._tokens < 1.0:
+                wait = (1.0 - self._tokens) / self._rate
+                # Gigue : pas de rythme parfaitement régulier
+                await self._sleep(wait + self._rng.uniform(0.0, self.jitter * self.interval))
+                self._refill(self._clock())
+            self._tokens = max(0.0, self._tokens - 1.0)
+
+    def _set_rate(self, rate: float) -> None:
+        self._rate = min(1.0 / self.min_interval, max(1.0 / self.max_interval, rate))
+
+    def record_success(self, latency: float) -> None:
+        self.successes += 1
+        if latency > self.latency_target:
+            self._set_rate(self._rate * 0.9)
+        else:
+            self._set_rate(self._rate + self.additive_step)
+
+    def record_error(self) -> None:
+        self.errors += 1
+        self._set_rate(self._rate * self.backoff)
+
+    def record_challenge(self) -> None:
+        """Page de vérification LinkedIn : pause globale puis reprise au rythme le plus lent."""
+        self.challenges += 1
+        self._set_rate(1.0 / self.max_interval)
+        self._tokens = 0.0
+        self._paused_until = self._clock() + self.challenge_pause
+        print(f"Vérification LinkedIn détectée : pause de {self.challenge_pause:.0f} s")
+
+    def stats(self) -> Dict[str, float]:
+        return {"interval": self.interval, "successes": self.successes,
+                "errors": self.errors, "challenges": self.challenges}
@@ -28,3 +28,32 @@ class PersonRepository(ABC):
     def save_all(self, persons: List[Personne]) -> None:
         """Sauvegarde une liste complète de personnes."""
         pass
+
+    def record_state(self, person: Personne) -> None:
+        """Persiste l'état de session d'une personne (en attente, analysée, rejetée).
+        Les stockages limités aux profils intéressants l'ignorent."""
+        pass
+
+    def flush(self) -> None:
+        """Attend que toutes les écritures en attente soient appliquées."""
+        pass
+
+    async def save_person_async(self, person: Personne) -> None:
+        """Version awaitable de save_person (synchrone par défaut)."""
+        self.save_person(person)
+
+    async def remove_person_async(self, person: Personne) -> None:
+        """Version awaitable de remove_person (synchrone par défaut)."""
+        self.remove_person(person)
+
+    async def save_all_async(self, persons: List[Personne]) -> None:
+        """Version awaitable de save_all (synchrone par défaut)."""
+        self.save_all(persons)
+
+    async def flush_async(self) -> None:
+        """Version awaitable de flush : barrière à attendre avant l'arrêt."""
+        self.flush()
+
+    def close(self) -> None:
+        """Termine les écritures en attente et libère les ressources (appelé à l'arrêt)."""
+        pass
@@ -1,34 +1,118 @@
-from collections import deque
-from typing import List, Optional, Dict
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Set, Tuple
 from app.core.models import Personne
 from app.core.repository import PersonRepository
+from app.core.frontier import Frontier, Scorer
+from app.core.events import EventBus, ChangeKind
+from app.core.metrics import metrics
+
+@dataclass
+class WorkflowCounters:
+    """Compteurs maintenus à chaque transition d'état (lecture O(1) pour l'IHM)."""
+    total: int = 0
+    pending: int = 0
+    interesting: int = 0
+    analyzed: int = 0
 
 class WorkflowManager:
-    """Gère la logique métier du workflow de recrutement : file d'attente, états, et persistence."""
-    def __init__(self, repository: PersonRepository):
+    """Gère la logique métier du workflow de recrutement : file d'attente, états, et persistence.
+
+    Les changements d'état (analysée / intéressante) doivent passer par le workflow
+    (`mark_analyzed`, `set_current_person_decision`) pour garder l'index et les compteurs à jour.
+
+    La file A_TRAITER est une frontière à priorité : chaque personne en attente reçoit la somme
+    pondérée des fonctions de score fournies. Sans fonction de score, l'ordre de découverte s'applique.
+
+    Chaque changement est publié sur `events` avec les URLs concernées.
+    """
+    def __init__(self, repository: PersonRepository, scorers: Optional[List[Tuple[Scorer, float]]] = None):
         self.repository = repository
         self.all_persons: Dict[str, Personne] = {} # URL -> Personne (cache global)
         self.current_person: Optional[Personne] = None
+        self.scorers = scorers or []
+        self._pending = Frontier() # File A_TRAITER
+        self.counters = WorkflowCounters()
+        # Graphe d'exploration : distance au profil de départ et profils ayant suggéré chaque URL
+        self.hops: Dict[str, int] = {}
+        self.sources: Dict[str, Set[str]] = {}
+        self.events = EventBus()
 
     def load_initial_data(self):
         """Charge les données depuis le repo et initialise l'état."""
         loaded_persons = self.repository.load_existing_persons()
         for p in loaded_persons:
-            p.analyzed = True
-            p.interesting = True
-            self.all_persons[p.url] = p
-            # Ils sont déjà intéressants, donc pas dans la queue A_TRAITER
-            # Mais on les garde dans le cache pour affichage et dédoublonnage
+            # L'état (analysé / intéressant) vient du stockage : l'export Excel ne contient que
+            # des personnes intéressantes, la base SQLite restitue toute la session précédente.
+            # On les garde dans le cache pour affichage et dédoublonnage
+            self._register(p)
+        self.events.publish(ChangeKind.PERSON_ADDED, *(p.url for p in loaded_persons))
+
+    def _register(self, p: Personne):
+        """Ajoute une personne au cache global et met à jour l'index et les compteurs."""
+        self.all_persons[p.url] = p
+        self._record_edge(p.url, p.source_url)
+        self.counters.total += 1
+        if p.analyzed:
+            self.counters.analyzed += 1
+        else:
+            self._pending.push(p.url, self._score(p))
+            self.counters.pending += 1
+        if p.interesting:
+            self.counters.interesting += 1
+
+    def _set_state(self, p: Personne, analyzed: bool, interesting: bool):
+        """Applique une transition d'état en maintenant l'index A_TRAITER et les compteurs."""
+        if analyzed == p.analyzed and interesting == p.interesting:
+            return
+
+        if analyzed != p.analyzed:
+            p.analyzed = analyzed
+            if analyzed:
+                self._pending.remove(p.url)
+                self.counters.pending -= 1
+                self.counters.analyzed += 1
+            else:
+                self._pending.push(p.url, self._score(p))
+                self.counters.pending += 1
+                self.counters.analyzed -= 1
+
+        if interesting != p.interesting:
+            self.counters.interesting += 1 if interesting else -1
+            p.interesting = interesting
+
+        self.events.publish(ChangeKind.DECISION_CHANGED, p.url)
+
+    def _record_edge(self, url: str, source_url: Optional[str]) -> bool:
+        """Enregistre la suggestion de `url` par `source_url`. Retourne True si cela change
+        les données de score (nouvelle source distincte ou chemin plus court depuis le départ)."""
+        changed = False
+        if source_url and source_url != url:
+            sources = self.sources.setdefault(url, set())
+            if source_url not in sources:
+                sources.add(source_url)
+                changed = True
+        hops = self.hops.get(source_url, 0) + 1 if source_url else 0
+        if hops < self.hops.get(url, hops + 1):
+            self.hops[url] = hops
+            changed = True
+        return changed
+
+    def _score(self, p: Personne) -> float:
+        return sum(weight * scorer(p, self) for scorer, weight in self.scorers)
 
-    def add_person(self, url: str, source_url: Optional[str] = None, 
+    def add_person(self, url: str, source_url: Optional[str] = None,
                    nom: Optional[str] = None, titre: Optional[str] = None) -> Optional[Personne]:
-        """Ajoute une personne à la file si elle n'existe pas déjà."""
+        """Ajoute une personne à la file si elle n'existe pas déjà.
+        Une URL déjà connue et encore en attente voit seulement son score mis à jour (O(log n))."""
         # Nettoyage URL basique
         clean_url = url.split("?")[0]
-        
+
         if clean_url in self.all_persons:
+            if self._record_edge(clean_url, source_url) and clean_url in self._pending:
+                self._pending.push(clean_url, self._score(self.all_persons[clean_url]))
+                self.events.publish(ChangeKind.PRIORITY_CHANGED, clean_url)
             return None # Doublon
-        
+
         # Si le nom n'est pas fourni, on tente de l'extraire de l'URL
         if not nom:
             # ex: https://www.linkedin.com/in/christelle-b-a3b6242/ -> christelle-b-a3b6242
@@ -36,34 +120,52 @@ class WorkflowManager:
             nom = clean_url.rstrip("/").split("/")[-1]
 
         p = Personne(
-            url=clean_url, 
+            url=clean_url,
             source_url=source_url,
             nom=nom,
             titre=titre,
             analyzed=False,
             interesting=False
         )
-        self.all_persons[clean_url] = p
+        self._register(p)
+        self.repository.record_state(p)
+        self.events.publish(ChangeKind.PERSON_ADDED, p.url)
         return p
 
+    def mark_analyzed(self, person: Personne):
+        """Marque une personne comme analysée (elle quitte la file A_TRAITER)."""
+        if person.analyzed:
+            return
+        self._set_state(person, True, person.interesting)
+        self.repository.record_state(person)
+        metrics.increment("profiles.analyzed")
+
     def get_next_person(self) -> Optional[Personne]:
-        """Récupère la prochaine personne à traiter (première non analysée)."""
-        # On parcourt toutes les personnes. Comme c'est un dict (Python 3.7+), l'ordre d'insertion est préservé.
-        # Les personnes chargées sont déjà marquées 'analyzed', donc on tombera sur les nouvelles.
-        for p in self.all_persons.values():
-            if not p.analyzed:
-                # Note: On ne définit pas forcément current_person ici, c'est fait par l'appelant via _select_person
-                # mais pour cohérence on peut le faire.
-                self.current_person = p
-                return p
-        return None
+        """Récupère la prochaine personne à traiter (la plus prioritaire non analysée), en O(1) amorti."""
+        url = self._pending.peek()
+        p = self.all_persons[url] if url else None
+        if p:
+            # Note: On ne définit pas forcément current_person ici, c'est fait par l'appelant via _select_person
+            # mais pour cohérence on peut le faire.
+            self.set_current_person(p)
+        return p
+
+    def set_current_person(self, person: Optional[Personne]):
+        """Change la personne en cours d'analyse."""
+        previous = self.current_person
+        if person == previous:
+            return
+        self.current_person = person
+        self.events.publish(ChangeKind.CURRENT_CHANGED,
+                            previous.url if previous else None, person.url if person else None)
 
     def has_pending_persons(self) -> bool:
         """Vérifie s'il reste des personnes non analysées."""
-        for p in self.all_persons.values():
-            if not p.analyzed:
-                return True
-        return False
+        return len(self._pending) > 0
+
+    def peek_pending(self, n: int) -> List[Personne]:
+        """Retourne les n prochaines personnes à traiter, par ordre de priorité."""
+        return [self.all_persons[url] for url in self._pending.peek_many(n)]
 
     def _ensure_storage_integrity(self) -> bool:
         """Vérifie si le stockage existe, sinon le recrée avec toutes les données en mémoire.
@@ -79,9 +181,8 @@ class WorkflowManager:
         if not self.current_person:
             return
 
-        self.current_person.analyzed = True
-        self.current_person.interesting = is_interesting
-        
+        self._set_state(self.current_person, True, is_interesting)
+
         # Si le fichier n'existe plus, on le recrée completement avec le nouvel état
         if self._ensure_storage_integrity():
             return
@@ -95,14 +196,20 @@ class WorkflowManager:
         """Met à jour les infos de la personne courante après scraping."""
         if not self.current_person:
             return
-        
-        if 'nom' in info: self.current_person.nom = info['nom']
-        if 'titre' in info: self.current_person.titre = info['titre']
-        if 'societe' in info: self.current_person.societe = info['societe']
-        if 'lieu' in info: self.current_person.lieu = info['lieu']
-        
+        self.update_person_info(self.current_person, info)
+
+    def update_person_info(self, person: Personne, info: dict):
+        """Met à jour les infos d'une personne (ex: scraping terminé après un changement de sélection)."""
+        if 'nom' in info: person.nom = info['nom']
+        if 'titre' in info: person.titre = info['titre']
+        if 'societe' in info: person.societe = info['societe']
+        if 'lieu' in info: person.lieu = info['lieu']
+        self.events.publish(ChangeKind.FIELDS_UPDATED, person.url)
+
         # Si la personne était déjà marquée comme intéressante, on met à jour le fichier
-        if self.current_person.interesting:
+        if person.interesting:
              if self._ensure_storage_integrity():
                  return
-             self.repository.save_person(self.current_person)
+             self.repository.save_person(person)
+        else:
+             self.repository.record_state(person)
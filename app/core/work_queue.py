@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+@dataclass
+class WorkItem:
+    """URL de la frontière partagée, avec la suggestion qui l'a fait découvrir."""
+    url: str
+    source_url: Optional[str] = None
+    nom: Optional[str] = None
+    titre: Optional[str] = None
+    hops: int = 0
+    priority: float = 0.0
+    attempts: int = 0
+
+@dataclass
+class WorkResult:
+    """Profil traité par un worker, à reporter dans le workflow et le stockage."""
+    url: str
+    source_url: Optional[str]
+    nom: Optional[str]
+    titre: Optional[str]
+    data: Optional[Dict[str, Any]]   # None si l'extraction a échoué
+    interesting: bool
+
+class WorkQueue(ABC):
+    """Interface abstraite d'une file de travail partagée entre plusieurs processus crawler.
+
+    Une URL n'entre qu'une fois dans la file (dédoublonnage commun à tous les workers). Un worker
+    l'emprunte pour une durée limitée (bail) ; un bail expiré (worker planté) rend l'URL aux autres.
+    """
+    @abstractmethod
+    def add(self, items: Iterable[WorkItem]) -> int:
+        """Ajoute les URLs inconnues (une URL déjà en attente garde la meilleure priorité).
+        Retourne le nombre d'URLs nouvelles."""
+        pass
+
+    @abstractmethod
+    def mark_known(self, urls: Iterable[str]) -> None:
+        """Enregistre des URLs déjà traitées hors de la file (stockage existant) : elles ne seront
+        ni empruntées, ni reportées, et ne comptent pas dans `max_processed`."""
+        pass
+
+    @abstractmethod
+    def lease(self, worker: str, max_processed: Optional[int] = None) -> Optional[WorkItem]:
+        """Emprunte l'URL en attente la plus prioritaire. None si la file est vide, ou si
+        `max_processed` URLs sont déjà traitées ou en cours de traitement."""
+        pass
+
+    @abstractmethod
+    def complete(self, url: str, worker: str, data: Dict[str, Any], interesting: bool) -> bool:
+        """Enregistre le résultat. Retourne False si l'URL a déjà été traitée par un autre worker."""
+        pass
+
+    @abstractmethod
+    def fail(self, url: str, worker: str, max_attempts: int = 1) -> None:
+        """Rend l'URL à la file, ou l'abandonne après `max_attempts` emprunts."""
+        pass
+
+    def renew(self, url: str, worker: str) -> None:
+        """Prolonge le bail d'une URL en cours de traitement."""
+        pass
+
+    @abstractmethod
+    def reclaim_expired(self) -> int:
+        """Rend à la file les URLs dont le bail a expiré. Retourne leur nombre."""
+        pass
+
+    @abstractmethod
+    def results(self, limit: int = 500) -> List[WorkResult]:
+        """Résultats pas encore reportés dans le stockage, dans l'ordre de traitement."""
+        pass
+
+    @abstractmethod
+    def acknowledge(self, urls: Iterable[str]) -> None:
+        """Marque des résultats comme reportés dans le stockage."""
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        """Nombre d'URLs par état (pending, leased, done, failed, known)."""
+        return {}
+
+    def close(self) -> None:
+        """Libère les ressources de la file."""
+        pass
@@ -1,23 +1,119 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableWidget, 
-    QTableWidgetItem, QCheckBox, QAbstractItemView, QHeaderView, QWidget,
-    QLabel
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QTableView,
+    QAbstractItemView, QHeaderView, QLabel
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QColor, QBrush, QFont
 
 from app.core.services import WorkflowManager
+from app.core.matcher import KeywordMatcher
+
+class SuggestionsModel(QAbstractTableModel):
+    """Modèle des suggestions : la colonne "A Analyser" est une case à cocher native du modèle,
+    sans widget par ligne. États cochés, doublons et intérêt sont stockés dans des listes."""
+    HEADERS = ["Nom", "Titre", "A Analyser"]
+    CHECK_COLUMN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.suggestions: List[Dict] = []
+        self._checked: List[bool] = []
+        self._duplicate: List[bool] = []
+        self._interesting: List[bool] = []
+
+        self._bg_duplicate = QBrush(QColor("#F0F0F0"))
+        self._fg_duplicate = QBrush(QColor("gray"))
+        self._bg_interesting = QBrush(QColor("#E8F5E9")) # Vert très clair
+
+    def set_suggestions(self, suggestions: List[Dict], workflow: WorkflowManager, matcher: KeywordMatcher):
+        """Remplace les suggestions et calcule intérêt / doublons en une seule passe."""
+        self.beginResetModel()
+        self.suggestions = suggestions
+        self._interesting = matcher.match_many([s.get('titre', '') for s in suggestions])
+        # Logique doublon
+        self._duplicate = [s.get('url', '') in workflow.all_persons for s in suggestions]
+        # Logique d'intérêt : les profils intéressants non déjà connus sont cochés par défaut
+        self._checked = [interesting and not dup for interesting, dup in zip(self._interesting, self._duplicate)]
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.suggestions)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == self.CHECK_COLUMN:
+            if self._duplicate[index.row()]:
+                return Qt.ItemFlag.NoItemFlags # Doublon : case grisée
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole and col < self.CHECK_COLUMN:
+            return self.suggestions[row].get('nom' if col == 0 else 'titre', '')
+
+        if role == Qt.ItemDataRole.CheckStateRole and col == self.CHECK_COLUMN:
+            return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+
+        if col < self.CHECK_COLUMN:
+            # Griser la ligne si doublon, sinon mettre en avant les profils intéressants
+            if role == Qt.ItemDataRole.BackgroundRole:
+                if self._duplicate[row]:
+                    return self._bg_duplicate
+                if self._interesting[row] and col == 0:
+                    return self._bg_interesting
+            if role == Qt.ItemDataRole.ForegroundRole and self._duplicate[row]:
+                return self._fg_duplicate
+
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if role != Qt.ItemDataRole.CheckStateRole or index.column() != self.CHECK_COLUMN:
+            return False
+        if self._duplicate[index.row()]:
+            return False
+        self._checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def set_checked(self, checked: bool, only_interesting: bool = False):
+        """Coche/décoche toutes les lignes (éventuellement seulement celles qui correspondent aux
+        mots-clés) en une passe, puis un seul signal dataChanged sur la colonne."""
+        self._checked = [
+            (checked and (interesting or not only_interesting)) if not dup else False
+            for interesting, dup in zip(self._interesting, self._duplicate)
+        ]
+        if self.suggestions:
+            self.dataChanged.emit(self.index(0, self.CHECK_COLUMN),
+                                  self.index(len(self.suggestions) - 1, self.CHECK_COLUMN),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def selected(self) -> List[Dict]:
+        return [s for s, checked in zip(self.suggestions, self._checked) if checked]
+
 
 class SuggestionsDialog(QDialog):
     """Boîte de dialogue permettant de valider les suggestions de nouvelles relations."""
-    def __init__(self, suggestions: List[Dict], workflow: WorkflowManager, config: Dict[str, Any]):
+    def __init__(self, suggestions: Optional[List[Dict]], workflow: WorkflowManager, config: Dict[str, Any]):
         super().__init__()
         self.suggestions = suggestions if suggestions is not None else []
         self.workflow = workflow
         self.config = config
-        self.selected_items = []
-        
+        self.model = SuggestionsModel(self)
+
         self.setWindowTitle("Valider les nouvelles relations")
         self.resize(800, 600)
         self._init_ui()
@@ -26,6 +122,8 @@ class SuggestionsDialog(QDialog):
         """Active ou désactive l'état de chargement."""
         self.table.setVisible(not loading)
         self.btn_add.setEnabled(not loading)
+        for btn in self.bulk_buttons:
+            btn.setEnabled(not loading)
         if loading:
             self.loading_label.show()
         else:
@@ -40,19 +138,18 @@ class SuggestionsDialog(QDialog):
         layout = QVBoxLayout(self)
 
         # Tableau
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Nom", "Titre", "A Analyser"])
-        
-        # Permettre à l'utilisateur de modifier la largeur des colonnes
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
-        self.table.horizontalHeader().setStretchLastSection(False) # On évite stretch auto pour laisser la main
-        
+        self.table = QTableView()
+        self.table.setModel(self.model)
+
+        # "Nom" et "A Analyser" gardent leur largeur, "Titre" occupe la largeur restante
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         self.table.setColumnWidth(0, 200)
-        self.table.setColumnWidth(1, 400) # Largeur par défaut pour le titre
         self.table.setColumnWidth(2, 100)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
-        
+
         layout.addWidget(self.table)
 
         # Label de chargement
@@ -64,82 +161,39 @@ class SuggestionsDialog(QDialog):
         self.loading_label.setFont(font)
         layout.addWidget(self.loading_label)
         self.loading_label.hide() # Caché par défaut
-        
+
         # Remplissage
         self._populate_table()
 
+        # Actions groupées (une seule passe sur le modèle)
+        bulk_layout = QHBoxLayout()
+        btn_all = QPushButton("Tout cocher")
+        btn_all.clicked.connect(lambda: self.model.set_checked(True))
+        btn_none = QPushButton("Tout décocher")
+        btn_none.clicked.connect(lambda: self.model.set_checked(False))
+        btn_keywords = QPushButton("Cocher selon mots-clés")
+        btn_keywords.clicked.connect(lambda: self.model.set_checked(True, only_interesting=True))
+        self.bulk_buttons = [btn_all, btn_none, btn_keywords]
+        for btn in self.bulk_buttons:
+            bulk_layout.addWidget(btn)
+        bulk_layout.addStretch()
+        layout.addLayout(bulk_layout)
+
         # Boutons
         btn_layout = QHBoxLayout()
         self.btn_add = QPushButton("Ajouter à la liste")
         self.btn_add.clicked.connect(self.accept)
         self.btn_cancel = QPushButton("Annuler")
         self.btn_cancel.clicked.connect(self.reject)
-        
+
         btn_layout.addStretch()
         btn_layout.addWidget(self.btn_add)
         btn_layout.addWidget(self.btn_cancel)
         layout.addLayout(btn_layout)
 
     def _populate_table(self):
-        self.table.setRowCount(0)
-        if not self.suggestions:
-            return
-
-        self.table.setRowCount(len(self.suggestions))
-        keywords = self.config.get('filters', {}).get('keywords', [])
-
-        for i, s in enumerate(self.suggestions):
-            nom = s.get('nom', '')
-            titre = s.get('titre', '')
-            url = s.get('url', '') # Devrait être nettoyée
-            
-            # 1. Nom & Titre
-            item_nom = QTableWidgetItem(nom)
-            item_titre = QTableWidgetItem(titre)
-            
-            self.table.setItem(i, 0, item_nom)
-            self.table.setItem(i, 1, item_titre)
-            
-            # 2. Checkbox "A Analyser"
-            # Widget conteneur pour centrer la checkbox
-            chk_widget = QWidget()
-            chk_layout = QHBoxLayout(chk_widget)
-            chk_layout.setContentsMargins(0, 0, 0, 0)
-            chk_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            chk = QCheckBox()
-            chk_layout.addWidget(chk)
-            
-            # Logique d'intérêt
-            is_interesting = any(kw.lower() in titre.lower() for kw in keywords)
-            chk.setChecked(is_interesting)
-            
-            # Logique doublon
-            if url in self.workflow.all_persons:
-                chk.setChecked(False)
-                chk.setEnabled(False)
-                # Griser la ligne
-                item_nom.setBackground(QBrush(QColor("#F0F0F0")))
-                item_nom.setForeground(QBrush(QColor("gray")))
-                item_titre.setBackground(QBrush(QColor("#F0F0F0")))
-                item_titre.setForeground(QBrush(QColor("gray")))
-            else:
-                if is_interesting:
-                    item_nom.setBackground(QBrush(QColor("#E8F5E9"))) # Vert très clair
-            
-            self.table.setCellWidget(i, 2, chk_widget)
-            # On stocke la réf à la checkbox pour récupération
-            self.table.setItem(i, 2, QTableWidgetItem()) # Item vide pour la structure
-            self.table.item(i, 2).setData(Qt.ItemDataRole.UserRole, chk) # Hacky mais efficace
+        self.model.set_suggestions(self.suggestions, self.workflow, KeywordMatcher.from_config(self.config))
 
     def get_selected(self) -> List[Dict]:
         """Retourne la liste des suggestions cochées par l'utilisateur."""
-        selected = []
-        for i in range(self.table.rowCount()):
-            # Récupération de la checkbox via le widget cell
-            widget = self.table.cellWidget(i, 2)
-            if widget:
-                 # Le layout contient la checkbox à l'index 0
-                chk = widget.findChild(QCheckBox)
-                if chk and chk.isChecked():
-                    selected.append(self.suggestions[i])
-        return selected
\ No newline at end of file
+        return self.model.selected()
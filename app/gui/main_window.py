@@ -1,28 +1,47 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterable
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox,
-                             QTableWidget, QTableWidgetItem, QLabel, QLineEdit, QCheckBox, QSplitter,
+                             QTableView, QLabel, QLineEdit, QCheckBox, QSplitter,
                              QFormLayout, QFrame, QHeaderView, QAbstractItemView, QDialog)
-from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtGui import QColor, QBrush, QFont, QCloseEvent
+from PyQt6.QtCore import Qt, pyqtSlot, QModelIndex, QTimer
+from PyQt6.QtGui import QFont, QCloseEvent
 
 from app.gui.dialogs import AddProfileDialog
 from app.core.services import WorkflowManager
 from app.core.models import Personne
+from app.core.events import ChangeEvent, ChangeKind
 import qasync
 import asyncio
 from app.gui.dialog_suggestion_validate import SuggestionsDialog
+from app.gui.person_table_model import PersonTableModel
 
 from app.core.browser_service import BrowserService
+from app.core.prefetch import ProfilePrefetcher
+from app.core.navigation import SupersededError
+from app.core.metrics import metrics
 
 class MainWindow(QMainWindow):
     """Fenêtre principale combinant le tableau de bord et le navigateur de profils."""
-    def __init__(self, workflow: WorkflowManager, browser: BrowserService, config: Dict[str, Any]) -> None:
+    def __init__(self, workflow: WorkflowManager, browser: BrowserService, config: Dict[str, Any],
+                 prefetcher: Optional[ProfilePrefetcher] = None) -> None:
         super().__init__()
         self.workflow = workflow
         self.browser = browser
         self.config = config
+        self.prefetcher = prefetcher
+        self._shown_person: Optional[Personne] = None # Personne affichée dans le détail
+        # Changements publiés par le workflow, appliqués en une fois au prochain tour de boucle
+        self._pending_changes: Dict[ChangeKind, Dict[str, None]] = {}
+        self._changes_scheduled = False
         self._init_ui()
         self.refresh_table()
+        self.workflow.events.subscribe(self._on_workflow_change)
+
+        # Débit et latences dans la barre d'état
+        if metrics.enabled:
+            self._metrics_timer = QTimer(self)
+            self._metrics_timer.timeout.connect(self._update_status_bar)
+            self._metrics_timer.start(2000)
+            self._update_status_bar()
 
     def _init_ui(self) -> None:
         self.setWindowTitle("LinkedIn Explorer")
@@ -38,19 +57,29 @@ class MainWindow(QMainWindow):
         left_widget = QWidget()
         left_layout = QVBoxLayout(left_widget)
         
-        # Bouton Ajouter
+        # Compteurs + Bouton Ajouter sur la même ligne
+        header_layout = QHBoxLayout()
+        self.lbl_total = QLabel()
+        self.lbl_interesting = QLabel()
+        self.lbl_pending = QLabel()
+        header_layout.addWidget(self.lbl_total)
+        header_layout.addWidget(self.lbl_interesting)
+        header_layout.addWidget(self.lbl_pending)
+        header_layout.addStretch()
+
         self.btn_add = QPushButton("➕ Ajouter un profil")
         self.btn_add.clicked.connect(self._show_add_dialog)
-        left_layout.addWidget(self.btn_add)
+        header_layout.addWidget(self.btn_add)
+        left_layout.addLayout(header_layout)
 
-        # Tableau
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Nom", "Titre", "Région", "Société", "Intérêt"])
+        # Tableau (modèle/vue : pas d'item par cellule, seules les lignes visibles sont peintes)
+        self.table_model = PersonTableModel(self.workflow, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table.cellClicked.connect(self._on_table_click)
+        self.table.clicked.connect(self._on_table_click)
         left_layout.addWidget(self.table)
 
         splitter.addWidget(left_widget)
@@ -142,8 +171,6 @@ class MainWindow(QMainWindow):
         # Cela force l'utilisateur à recocher pour sauvegarder
         self.chk_interest.setChecked(False)
         self.workflow.set_current_person_decision(False)
-        
-        self.refresh_table()
 
     def _set_detail_enabled(self, enabled: bool):
         self.chk_interest.setEnabled(enabled)
@@ -155,55 +182,57 @@ class MainWindow(QMainWindow):
         # Url toujours read-only mais potentiellement disabled visuellement
         self.edit_url.setEnabled(enabled)
 
-    def refresh_table(self):
-        """Reconstruit le tableau de gauche avec les données courantes du workflow."""
-        self.table.setRowCount(0)
-        persons = list(self.workflow.all_persons.values())
-        self.table.setRowCount(len(persons))
-        
-        current_p = self.workflow.current_person
+    @metrics.timed("gui.refresh_table")
+    def refresh_table(self, urls: Optional[Iterable[str]] = None):
+        """Met à jour le tableau de gauche : ajoute les nouvelles personnes du workflow et
+        repeint les lignes indiquées (toutes si aucune URL n'est fournie)."""
+        self.table_model.sync()
+        if urls is None:
+            self.table_model.refresh_all()
+        else:
+            self.table_model.refresh_rows(urls)
+        self._update_counters()
+
+    def _on_workflow_change(self, event: ChangeEvent):
+        """Accumule les changements du workflow ; plusieurs événements dans le même tour de
+        boucle donnent une seule mise à jour de l'IHM."""
+        self._pending_changes.setdefault(event.kind, {}).update(dict.fromkeys(event.urls))
+        if not self._changes_scheduled:
+            self._changes_scheduled = True
+            QTimer.singleShot(0, self._apply_changes)
+
+    def _update_status_bar(self):
+        self.statusBar().showMessage(metrics.status_line())
+
+    @metrics.timed("gui.refresh")
+    def _apply_changes(self):
+        """Applique les changements accumulés sous forme de diff minimal sur le tableau et le détail."""
+        changes, self._pending_changes = self._pending_changes, {}
+        self._changes_scheduled = False
+
+        added = changes.get(ChangeKind.PERSON_ADDED, {})
+        self.table_model.add_rows(added)
+
+        touched = set()
+        for kind in (ChangeKind.FIELDS_UPDATED, ChangeKind.DECISION_CHANGED, ChangeKind.CURRENT_CHANGED):
+            touched.update(changes.get(kind, ()))
+        self.table_model.refresh_rows(touched.difference(added))
+
+        if added or ChangeKind.DECISION_CHANGED in changes:
+            self._update_counters()
+
+        current = self.workflow.current_person
+        if ChangeKind.CURRENT_CHANGED in changes or \
+                (current and current.url in changes.get(ChangeKind.FIELDS_UPDATED, ())):
+            self._update_detail_view()
+
+    def _update_counters(self):
+        """Met à jour les compteurs et le bouton "Personne suivante" (lecture O(1) des compteurs du workflow)."""
+        counters = self.workflow.counters
+        self.lbl_total.setText(f"Profils : {counters.total}")
+        self.lbl_interesting.setText(f"PoI : {counters.interesting}")
+        self.lbl_pending.setText(f"A analyser : {counters.pending}")
 
-        for i, p in enumerate(persons):
-            self.table.setItem(i, 0, QTableWidgetItem(p.nom or ""))
-            self.table.setItem(i, 1, QTableWidgetItem(p.titre or ""))
-            self.table.setItem(i, 2, QTableWidgetItem(p.lieu or ""))
-            self.table.setItem(i, 3, QTableWidgetItem(p.societe or ""))
-            
-            interet_str = "OUI" if p.interesting else "NON"
-            self.table.setItem(i, 4, QTableWidgetItem(interet_str))
-            
-            # Styling
-            color = Qt.GlobalColor.white
-            text_color = Qt.GlobalColor.black
-            font = QFont()
-
-            # Gestion des couleurs par état (analysed / interesting)
-            if p.analyzed:
-                if p.interesting:
-                    color = QColor("#D1E7DD") # Vert clair
-                else:
-                    color = QColor("#F0F0F0") # Gris clair
-                    text_color = QColor("gray")
-            else:
-                color = Qt.GlobalColor.white
-
-            # Gestion de la mise en avant de la personne courante (UI state)
-            if p == current_p:
-                font.setBold(True)
-                # On peut aussi changer la couleur de fond pour surligner la ligne active
-                # si elle n'a pas encore de couleur spécifique (ou on mixe ?)
-                if color == Qt.GlobalColor.white:
-                     color = QColor("#E0F7FA") # Cyan clair pour la sélection courante
-
-            for col in range(5):
-                item = self.table.item(i, col)
-                item.setBackground(QBrush(color))
-                item.setForeground(QBrush(text_color))
-                item.setFont(font)
-                # Stocker l'URL dans le premier item pour retrouver la personne
-                if col == 0:
-                    item.setData(Qt.ItemDataRole.UserRole, p.url)
-        
         # Mise à jour de l'état du bouton "Personne suivante"
         self.btn_next.setEnabled(self.workflow.has_pending_persons())
 
@@ -233,17 +262,13 @@ class MainWindow(QMainWindow):
             url = dialog.get_url()
             if url:
                 added_p = self.workflow.add_person(url)
-                if added_p:
-                    self.refresh_table()
-                else:
+                if not added_p:
                     QMessageBox.information(self, "Doublon", "Ce profil est déjà dans la liste.")
 
-    @qasync.asyncSlot(int, int)
-    async def _on_table_click(self, row, col):
+    @pyqtSlot(QModelIndex)
+    def _on_table_click(self, index: QModelIndex):
         """Gère le clic sur une ligne du tableau : charge le profil associé."""
-        item = self.table.item(row, 0)
-        url = item.data(Qt.ItemDataRole.UserRole)
-        new_person = self.workflow.all_persons.get(url)
+        new_person = self.table_model.person_at(index.row())
         
         if new_person:
             self._select_person(new_person)
@@ -251,36 +276,43 @@ class MainWindow(QMainWindow):
     def _select_person(self, person: Personne):
         """Sélectionne une personne, met à jour l'UI et lance le traitement background."""
         # Quand une personne devient active, elle est considérée comme analysée
-        if not person.analyzed:
-            person.analyzed = True
-            
-        if person != self.workflow.current_person:
-             self.workflow.current_person = person
+        self.workflow.mark_analyzed(person)
+
+        # Comparaison avec la personne affichée : get_next_person a déjà pu la rendre courante
+        if person != self._shown_person:
+             self._shown_person = person
+             self.workflow.set_current_person(person)
              self._update_detail_view()
-             self.refresh_table()
-             asyncio.create_task(self._process_profile_background(person))
+             # Réclamé immédiatement : la replanification du préchargeur (la personne vient de
+             # quitter la file) ne doit pas annuler une extraction déjà en cours pour elle
+             prefetched = self.prefetcher.claim(person.url) if self.prefetcher else None
+             asyncio.create_task(self._process_profile_background(person, prefetched))
 
-    async def _process_profile_background(self, p: Personne):
-        """Charge la page et le profil en arrière-plan."""
+    async def _process_profile_background(self, p: Personne, prefetched=None):
+        """Charge la page et le profil en arrière-plan (données préchargées si disponibles)."""
         try:
+            infos = None
+            if prefetched is not None:
+                infos = await prefetched
+            if infos:
+                self.workflow.update_person_info(p, infos)
+                # La page visible suit la personne affichée (utilisée ensuite par "Relations...")
+                await self.browser.open_profile(p.url)
+                return
             # Utilisation du service abstrait pour récupérer les données
             infos = await self.browser.get_profile_data(p.url)
-            self.workflow.update_current_person_info(infos)
-
-            # Mise à jour finale de l'UI avec les nouvelles données
-            # On vérifie si c'est toujours la personne courante pour éviter des clignotements bizarres
-            # si l'utilisateur a cliqué ailleurs entre temps
-            if self.workflow.current_person == p:
-                 self._update_detail_view()
-            
-            self.refresh_table() # Mise à jour globale (titre, société, etc.)
+            # Mise à jour de la personne chargée (même si l'utilisateur a cliqué ailleurs entre temps) :
+            # le tableau et, si elle est toujours courante, le détail suivent via les événements du workflow
+            self.workflow.update_person_info(p, infos)
+        except SupersededError:
+            # L'utilisateur a sélectionné une autre personne entre temps : chargement abandonné
+            pass
         except Exception as e:
             print(f"Erreur background process pour {p.url}: {e}")
 
     def _on_interest_changed(self):
         is_checked = self.chk_interest.isChecked()
         self.workflow.set_current_person_decision(is_checked)
-        self.refresh_table()
 
     @qasync.asyncSlot()
     async def process_next(self):
@@ -337,5 +369,4 @@ class MainWindow(QMainWindow):
                                          nom=s['nom'], titre=s['titre'])
                 if res: count += 1
             
-            self.refresh_table()
             QMessageBox.information(self, "Ajout", f"{count} nouvelles relations ajoutées à la file.")
\ No newline at end of file
@@ -0,0 +1,116 @@
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush, QFont
+
+from app.core.services import WorkflowManager
+from app.core.models import Personne
+
+class PersonTableModel(QAbstractTableModel):
+    """Modèle du tableau des personnes, lu directement dans `workflow.all_persons`.
+
+    Aucun item n'est créé par ligne : textes, couleurs et polices sont calculés à la demande
+    dans `data()`, donc seules les lignes visibles sont évaluées par la vue.
+    """
+    HEADERS = ["Nom", "Titre", "Région", "Société", "Intérêt"]
+
+    def __init__(self, workflow: WorkflowManager, parent=None):
+        super().__init__(parent)
+        self.workflow = workflow
+        self._urls: List[str] = list(workflow.all_persons.keys()) # Ligne -> URL (ordre d'insertion)
+        self._rows: Dict[str, int] = {url: i for i, url in enumerate(self._urls)}
+
+        # Styles partagés par toutes les lignes
+        self._bg_default = QBrush(Qt.GlobalColor.white)
+        self._bg_interesting = QBrush(QColor("#D1E7DD")) # Vert clair
+        self._bg_rejected = QBrush(QColor("#F0F0F0"))    # Gris clair
+        self._bg_current = QBrush(QColor("#E0F7FA"))     # Cyan clair pour la sélection courante
+        self._fg_default = QBrush(Qt.GlobalColor.black)
+        self._fg_rejected = QBrush(QColor("gray"))
+        self._font_default = QFont()
+        self._font_current = QFont()
+        self._font_current.setBold(True)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._urls)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        p = self.workflow.all_persons.get(self._urls[index.row()])
+        if p is None:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            col = index.column()
+            if col == 0: return p.nom or ""
+            if col == 1: return p.titre or ""
+            if col == 2: return p.lieu or ""
+            if col == 3: return p.societe or ""
+            return "OUI" if p.interesting else "NON"
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # Gestion des couleurs par état (analysed / interesting)
+            if p.analyzed:
+                return self._bg_interesting if p.interesting else self._bg_rejected
+            # Mise en avant de la personne courante si la ligne n'a pas de couleur spécifique
+            return self._bg_current if p == self.workflow.current_person else self._bg_default
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._fg_rejected if p.analyzed and not p.interesting else self._fg_default
+
+        if role == Qt.ItemDataRole.FontRole:
+            return self._font_current if p == self.workflow.current_person else self._font_default
+
+        if role == Qt.ItemDataRole.UserRole:
+            return p.url
+
+        return None
+
+    def person_at(self, row: int) -> Optional[Personne]:
+        """Retourne la personne affichée à la ligne donnée."""
+        if 0 <= row < len(self._urls):
+            return self.workflow.all_persons.get(self._urls[row])
+        return None
+
+    def row_of(self, url: str) -> Optional[int]:
+        return self._rows.get(url)
+
+    def add_rows(self, urls: Iterable[str]) -> None:
+        """Insère en fin de tableau les personnes pas encore affichées (signal rowsInserted unique)."""
+        new_urls = [url for url in urls if url not in self._rows and url in self.workflow.all_persons]
+        if not new_urls:
+            return
+        first = len(self._urls)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_urls) - 1)
+        for url in new_urls:
+            self._rows[url] = len(self._urls)
+            self._urls.append(url)
+        self.endInsertRows()
+
+    def sync(self) -> None:
+        """Ajoute les personnes apparues dans le workflow depuis la dernière synchronisation.
+        `all_persons` ne fait que croître dans l'ordre d'insertion : seules les nouvelles URLs sont lues."""
+        if len(self.workflow.all_persons) > len(self._urls):
+            self.add_rows(islice(self.workflow.all_persons, len(self._urls), None))
+
+    def refresh_rows(self, urls: Iterable[str]) -> None:
+        """Signale la modification des lignes données (dataChanged ligne par ligne)."""
+        last_col = len(self.HEADERS) - 1
+        for url in set(urls):
+            row = self._rows.get(url)
+            if row is not None:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+
+    def refresh_all(self) -> None:
+        """Signale que toutes les lignes ont pu changer (un seul signal ; la vue ne repeint que le visible)."""
+        if self._urls:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._urls) - 1, len(self.HEADERS) - 1))
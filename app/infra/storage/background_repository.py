@@ -0,0 +1,129 @@
+import asyncio
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import replace
+from typing import Callable, List, Tuple
+from app.core.models import Personne
+from app.core.repository import PersonRepository
+
+class BackgroundRepository(PersonRepository):
+    """Décorateur de repository exécutant toutes les écritures sur un thread écrivain dédié.
+
+    Les méthodes d'écriture rendent la main immédiatement : l'opération est mise en file et
+    plusieurs écritures en attente pour la même URL sont fusionnées en une seule (la dernière gagne).
+    Les variantes `*_async` retournent des awaitables résolus une fois l'écriture appliquée.
+    """
+    _SAVE_ALL_KEY = "*"
+
+    def __init__(self, inner: PersonRepository):
+        self.inner = inner
+        self._cond = threading.Condition()
+        # Clé (URL, "*" ou barrière) -> (action, future). L'ordre d'insertion est l'ordre d'exécution.
+        self._pending: "OrderedDict[str, Tuple[Callable[[], None], Future]]" = OrderedDict()
+        self._barrier_ids = itertools.count()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="repository-writer", daemon=True)
+        self._thread.start()
+
+    def _submit(self, key: str, action: Callable[[], None]) -> Future:
+        """Met une opération en file, en fusionnant avec une opération en attente de même clé."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Repository fermé : écriture impossible.")
+            previous = self._pending.pop(key, None)
+            # On réutilise le future en attente : ceux qui l'attendent verront l'écriture fusionnée.
+            # La réinsertion place l'opération en fin de file, après un éventuel save_all plus récent.
+            if previous and not previous[1].cancelled():
+                future = previous[1]
+            else:
+                future = Future()
+            self._pending[key] = (action, future)
+            self._cond.notify()
+            return future
+
+    def _run(self) -> None:
+        """Boucle du thread écrivain : applique les opérations une par une, dans l'ordre."""
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return # Fermé et file vide
+                key, (action, future) = self._pending.popitem(last=False)
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(action())
+            except Exception as e:
+                print(f"Erreur écriture en arrière-plan ({key}): {e}")
+                future.set_exception(e)
+
+    def _submit_save(self, person: Personne) -> Future:
+        # Copie : l'UI peut continuer à modifier la personne pendant que l'écriture attend
+        snapshot = replace(person)
+        return self._submit(person.url, lambda: self.inner.save_person(snapshot))
+
+    def _submit_remove(self, person: Personne) -> Future:
+        snapshot = replace(person)
+        return self._submit(person.url, lambda: self.inner.remove_person(snapshot))
+
+    def _submit_record_state(self, person: Personne) -> Future:
+        snapshot = replace(person)
+        # Clé distincte : un simple suivi d'état ne doit pas remplacer un save/remove en attente
+        return self._submit(f"state:{person.url}", lambda: self.inner.record_state(snapshot))
+
+    def _submit_save_all(self, persons: List[Personne]) -> Future:
+        snapshot = [replace(p) for p in persons]
+        return self._submit(self._SAVE_ALL_KEY, lambda: self.inner.save_all(snapshot))
+
+    def _submit_barrier(self) -> Future:
+        return self._submit(f"__barrier_{next(self._barrier_ids)}", lambda: None)
+
+    def load_existing_persons(self) -> List[Personne]:
+        """Charge les personnes persistées, après application des écritures en attente."""
+        self.flush()
+        return self.inner.load_existing_persons()
+
+    def save_person(self, person: Personne) -> None:
+        self._submit_save(person)
+
+    def remove_person(self, person: Personne) -> None:
+        self._submit_remove(person)
+
+    def exists(self) -> bool:
+        return self.inner.exists()
+
+    def save_all(self, persons: List[Personne]) -> None:
+        self._submit_save_all(persons)
+
+    def record_state(self, person: Personne) -> None:
+        self._submit_record_state(person)
+
+    def flush(self) -> None:
+        """Bloque jusqu'à ce que toutes les écritures mises en file avant l'appel soient appliquées."""
+        self._submit_barrier().result()
+
+    async def save_person_async(self, person: Personne) -> None:
+        await asyncio.wrap_future(self._submit_save(person))
+
+    async def remove_person_async(self, person: Personne) -> None:
+        await asyncio.wrap_future(self._submit_remove(person))
+
+    async def save_all_async(self, persons: List[Personne]) -> None:
+        await asyncio.wrap_future(self._submit_save_all(persons))
+
+    async def flush_async(self) -> None:
+        await asyncio.wrap_future(self._submit_barrier())
+
+    def close(self) -> None:
+        """Vide la file, arrête le thread écrivain puis ferme le repository décoré."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        self.inner.close()
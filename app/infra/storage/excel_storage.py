@@ -1,16 +1,48 @@
 import pandas as pd
 import os
-from typing import List
+import json
+import mmap
+import pickle
+import time
+import threading
+from itertools import repeat
+from typing import List, Dict, Optional, Tuple
 from app.core.models import Personne
 from app.core.repository import PersonRepository
+from app.core.metrics import metrics
 
 class ExcelRepository(PersonRepository):
-    """Implémentation du repository utilisant un fichier Excel comme source de données."""
+    """Implémentation du repository utilisant un fichier Excel comme source de données.
+
+    En mode journal, chaque mutation est ajoutée à un fichier annexe (`<export>.journal.jsonl`)
+    au lieu de réécrire tout le classeur. Le fichier Excel n'est reconstruit (compaction) qu'à
+    partir d'un seuil de mutations, après une période d'inactivité ou à la fermeture.
+    """
     COLUMNS = ["Nom", "Titre", "Société", "Région", "Lien Linkedin", "Source"]
+    SNAPSHOT_VERSION = 1
     # COLUMNS_WIDTH = [40, 80, 30, 30, 50, 50]
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, journal: bool = False,
+                 compaction_threshold: int = 200, idle_delay: float = 30.0):
         self.file_path = file_path
+        self.journal_enabled = journal
+        self.journal_path = file_path + ".journal.jsonl"
+        # Journal en cours de compaction (conservé tant que le classeur n'est pas réécrit)
+        self.compacting_path = file_path + ".journal.compacting.jsonl"
+        # Copie binaire (colonnes) du classeur, pour éviter de re-parser le .xlsx au démarrage
+        self.snapshot_path = file_path + ".snapshot.pkl"
+        self.compaction_threshold = compaction_threshold
+        self.idle_delay = idle_delay
+
+        self._rows: Optional[Dict[str, Dict]] = None # URL -> ligne Excel (classeur + journal)
+        self._journal_size = 0
+        self._last_write = 0.0
+        self._retry_after = 0.0       # Rotation du journal en échec : pas de nouvel essai avant cette date
+        self._closed = False
+        self._cond = threading.Condition(threading.RLock())
+        self._compaction_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+
         self._ensure_file_exists()
 
     def _ensure_file_exists(self):
@@ -20,40 +52,112 @@ class ExcelRepository(PersonRepository):
             # Setup largeur colonnes via ExcelWriter si besoin, mais pour l'init simple:
             df.to_excel(self.file_path, index=False)
 
-    def load_existing_persons(self) -> List[Personne]:
-        """Charge tous les profils existants depuis le fichier Excel."""
+    @staticmethod
+    def _to_row(p: Personne) -> Dict:
+        return {
+            "Nom": p.nom,
+            "Titre": p.titre,
+            "Société": p.societe,
+            "Région": p.lieu,
+            "Lien Linkedin": p.url,
+            "Source": p.source_url
+        }
+
+    @staticmethod
+    def _to_person(row: Dict) -> Personne:
+        return Personne(
+            url=row["Lien Linkedin"],
+            nom=row.get("Nom"),
+            titre=row.get("Titre"),
+            societe=row.get("Société"),
+            lieu=row.get("Région"),
+            source_url=row.get("Source"),
+            analyzed=True,
+            interesting=True
+        )
+
+    def _read_columns(self) -> Dict[str, List]:
+        """Lit le contenu du classeur sous forme de colonnes (valeurs manquantes -> None).
+        Le snapshot binaire est utilisé tant que le classeur n'a pas été modifié à l'extérieur."""
         if not os.path.exists(self.file_path):
-            return []
-        
+            return {col: [] for col in self.COLUMNS}
+
+        columns = self._load_snapshot()
+        if columns is not None:
+            return columns
+
+        df = pd.read_excel(self.file_path)
+        # Vérification basique des colonnes pour éviter les crashs si fichier corrompu
+        if df.empty or not all(col in df.columns for col in self.COLUMNS):
+            return {col: [] for col in self.COLUMNS}
+
+        df = df[self.COLUMNS].astype(object)
+        df = df.where(pd.notna(df), None)
+        df = df[df["Lien Linkedin"].map(lambda url: isinstance(url, str))]
+
+        columns = {col: df[col].tolist() for col in self.COLUMNS}
+        self._write_snapshot(columns)
+        return columns
+
+    def _read_workbook(self) -> Dict[str, Dict]:
+        """Lit le classeur et retourne ses lignes indexées par URL."""
+        columns = self._read_columns()
+        rows = (dict(zip(self.COLUMNS, values)) for values in zip(*(columns[col] for col in self.COLUMNS)))
+        return {row["Lien Linkedin"]: row for row in rows}
+
+    def _persons_from_columns(self, columns: Dict[str, List]) -> List[Personne]:
+        """Conversion vectorisée colonnes -> Personne (sans passer par des lignes intermédiaires)."""
+        count = len(columns["Lien Linkedin"])
+        return list(map(Personne,
+                        columns["Lien Linkedin"], columns["Nom"], columns["Titre"],
+                        columns["Société"], columns["Région"], columns["Source"],
+                        repeat(True, count), repeat(True, count)))
+
+    # --- Snapshot binaire du classeur ---
+
+    def _workbook_signature(self) -> Tuple[int, int]:
+        st = os.stat(self.file_path)
+        return st.st_mtime_ns, st.st_size
+
+    def _load_snapshot(self) -> Optional[Dict[str, List]]:
+        """Charge le snapshot s'il correspond au classeur actuel (date de modification et taille)."""
+        if not os.path.exists(self.snapshot_path):
+            return None
         try:
-            df = pd.read_excel(self.file_path)
-            # Vérification basique des colonnes pour éviter les crashs si fichier corrompu
-            if df.empty or not all(col in df.columns for col in self.COLUMNS):
-                return []
-            
-            persons = []
-            for _, row in df.iterrows():
-                url = row.get("Lien Linkedin")
-                if pd.isna(url) or not isinstance(url, str):
-                    continue
-                
-                try:
-                    p = Personne(
-                        url=url,
-                        nom=row.get("Nom") if pd.notna(row.get("Nom")) else None,
-                        titre=row.get("Titre") if pd.notna(row.get("Titre")) else None,
-                        societe=row.get("Société") if pd.notna(row.get("Société")) else None,
-                        lieu=row.get("Région") if pd.notna(row.get("Région")) else None,
-                        source_url=row.get("Source") if pd.notna(row.get("Source")) else None,
-                        analyzed=True,
-                        interesting=True
-                    )
-                    persons.append(p)
-                except Exception as e:
-                    print(f"Erreur chargement ligne Excel: {e}")
-                    continue
-            return persons
+            with open(self.snapshot_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                snapshot = pickle.loads(mm)
+            if snapshot.get("version") != self.SNAPSHOT_VERSION:
+                return None
+            if tuple(snapshot["signature"]) != self._workbook_signature():
+                return None # Classeur modifié en dehors de l'application
+            return snapshot["columns"]
+        except Exception as e:
+            print(f"Snapshot Excel ignoré: {e}")
+            return None
 
+    def _write_snapshot(self, columns: Dict[str, List]) -> None:
+        """Écrit le snapshot colonne par colonne, associé à la signature du classeur."""
+        try:
+            snapshot = {
+                "version": self.SNAPSHOT_VERSION,
+                "signature": self._workbook_signature(),
+                "columns": columns
+            }
+            tmp_path = self.snapshot_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            print(f"Erreur écriture snapshot Excel: {e}")
+
+    def load_existing_persons(self) -> List[Personne]:
+        """Charge tous les profils existants depuis le fichier Excel."""
+        if self.journal_enabled:
+            with self._cond:
+                return [self._to_person(row) for row in self._state().values()]
+
+        try:
+            return self._persons_from_columns(self._read_columns())
         except Exception as e:
             print(f"Erreur lecture Excel: {e}")
             return []
@@ -63,41 +167,42 @@ class ExcelRepository(PersonRepository):
         if not p.interesting:
             return  # On ne sauvegarde que les intéressants
 
-        new_row = {
-            "Nom": p.nom,
-            "Titre": p.titre,
-            "Société": p.societe,
-            "Région": p.lieu,
-            "Lien Linkedin": p.url,
-            "Source": p.source_url
-        }
-        
+        if self.journal_enabled:
+            self._apply({"op": "save", "row": self._to_row(p)})
+            return
+
+        new_row = self._to_row(p)
+
         try:
             if os.path.exists(self.file_path):
                 df_existing = pd.read_excel(self.file_path)
             else:
                 df_existing = pd.DataFrame(columns=self.COLUMNS)
-                
+
             # Conversion en DataFrame pour la nouvelle ligne
             df_new = pd.DataFrame([new_row])
-            
+
             # Si l'URL existe déjà, on supprime l'ancienne entrée pour la remplacer
             if "Lien Linkedin" in df_existing.columns and not df_existing.empty:
                  if p.url in df_existing["Lien Linkedin"].values:
                      df_existing = df_existing[df_existing["Lien Linkedin"] != p.url]
-            
+
             # Concaténation
             df_final = pd.concat([df_existing, df_new], ignore_index=True)
-            
+
             # Sauvegarde
             with pd.ExcelWriter(self.file_path, engine='openpyxl', mode='w') as writer:
                 df_final.to_excel(writer, index=False)
-                
+
         except Exception as e:
             print(f"Erreur sauvegarde Excel: {e}")
 
     def remove_person(self, p: Personne) -> None:
         """Supprime une personne du fichier Excel."""
+        if self.journal_enabled:
+            self._apply({"op": "remove", "url": p.url})
+            return
+
         if not os.path.exists(self.file_path):
             return
 
@@ -115,23 +220,185 @@ class ExcelRepository(PersonRepository):
 
     def save_all(self, persons: List[Personne]) -> None:
         """Recrée le fichier Excel avec la liste complète des personnes fournies."""
-        data = []
-        for p in persons:
-            if not p.interesting:
-                continue
-                
-            data.append({
-                "Nom": p.nom,
-                "Titre": p.titre,
-                "Société": p.societe,
-                "Région": p.lieu,
-                "Lien Linkedin": p.url,
-                "Source": p.source_url
-            })
-            
-        df = pd.DataFrame(data, columns=self.COLUMNS)
+        rows = {p.url: self._to_row(p) for p in persons if p.interesting}
+
+        if self.journal_enabled:
+            with self._compaction_lock, self._cond:
+                self._rows = rows
+                try:
+                    self._write_workbook(list(rows.values()))
+                    # Le classeur réécrit contient tout : les journaux deviennent inutiles
+                    self._remove_journals()
+                except Exception as e:
+                    print(f"Erreur recréation Excel: {e}")
+            return
+
         try:
             # On écrase tout le fichier
-            df.to_excel(self.file_path, index=False)
+            self._write_workbook(list(rows.values()))
         except Exception as e:
             print(f"Erreur recréation Excel: {e}")
+
+    @metrics.timed("storage.excel_write")
+    def _write_workbook(self, rows: List[Dict]) -> None:
+        """Écrit le classeur dans un fichier temporaire puis le substitue atomiquement."""
+        df = pd.DataFrame(rows, columns=self.COLUMNS)
+        tmp_path = self.file_path + ".tmp.xlsx"
+        with pd.ExcelWriter(tmp_path, engine='openpyxl', mode='w') as writer:
+            df.to_excel(writer, index=False)
+        os.replace(tmp_path, self.file_path)
+        self._write_snapshot({col: [row[col] for row in rows] for col in self.COLUMNS})
+
+    # --- Mode journal ---
+
+    def _state(self) -> Dict[str, Dict]:
+        """Retourne l'état courant (classeur + journaux rejoués), chargé à la première utilisation."""
+        if self._rows is None:
+            try:
+                rows = self._read_workbook()
+            except Exception as e:
+                print(f"Erreur lecture Excel: {e}")
+                rows = {}
+            # Un journal "compacting" subsiste si l'application s'est arrêtée pendant une compaction
+            self._journal_size = self._replay(self.compacting_path, rows) + self._replay(self.journal_path, rows)
+            self._rows = rows
+            if self._journal_size:
+                self._last_write = time.monotonic()
+                self._ensure_compactor()
+        return self._rows
+
+    @staticmethod
+    def _replay(path: str, rows: Dict[str, Dict]) -> int:
+        """Rejoue un journal sur les lignes fournies. Retourne le nombre d'entrées appliquées."""
+        if not os.path.exists(path):
+            return 0
+
+        count = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Dernière ligne tronquée (arrêt brutal) : on l'ignore
+                    continue
+                if record.get("op") == "save":
+                    row = record["row"]
+                    rows[row["Lien Linkedin"]] = row
+                elif record.get("op") == "remove":
+                    rows.pop(record["url"], None)
+                count += 1
+        return count
+
+    def _apply(self, record: Dict) -> None:
+        """Applique une mutation en mémoire et l'ajoute au journal (O(1)).
+        Les écritures qui ne changent aucun champ sont ignorées."""
+        with self._cond:
+            rows = self._state()
+            if record["op"] == "save":
+                row = record["row"]
+                url = row["Lien Linkedin"]
+                if rows.get(url) == row:
+                    return
+                rows[url] = row
+            else:
+                if record["url"] not in rows:
+                    return
+                del rows[record["url"]]
+
+            try:
+                with open(self.journal_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            except Exception as e:
+                print(f"Erreur écriture journal Excel: {e}")
+                return
+
+            self._journal_size += 1
+            self._last_write = time.monotonic()
+            self._ensure_compactor()
+            self._cond.notify_all()
+
+    def _ensure_compactor(self) -> None:
+        """Démarre le thread de compaction en arrière-plan s'il ne tourne pas encore."""
+        if self._closed or (self._compactor and self._compactor.is_alive()):
+            return
+        self._compactor = threading.Thread(target=self._compaction_loop, name="excel-compaction", daemon=True)
+        self._compactor.start()
+
+    def _compaction_loop(self) -> None:
+        """Attend le seuil de mutations ou une période d'inactivité, puis compacte."""
+        while True:
+            with self._cond:
+                while not self._closed:
+                    backoff = self._retry_after - time.monotonic()
+                    if backoff > 0:
+                        self._cond.wait(backoff)
+                        continue
+                    if self._journal_size >= self.compaction_threshold:
+                        break
+                    if self._journal_size > 0:
+                        remaining = self._last_write + self.idle_delay - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                if self._closed:
+                    return
+            self.compact()
+
+    def compact(self) -> None:
+        """Reconstruit le fichier Excel à partir de l'état courant et vide le journal."""
+        if not self.journal_enabled:
+            return
+
+        with self._compaction_lock:
+            with self._cond:
+                if self._rows is None:
+                    return
+                if self._journal_size == 0 and not os.path.exists(self.compacting_path):
+                    return
+                rows = list(self._rows.values())
+                # Rotation du journal : les nouvelles mutations repartent dans un journal vide
+                try:
+                    self._rotate_journal()
+                except Exception as e:
+                    # Nouvel essai après `idle_delay` (sinon le seuil, toujours atteint, relance aussitôt)
+                    print(f"Erreur rotation journal Excel: {e}")
+                    self._retry_after = time.monotonic() + self.idle_delay
+                    return
+                self._journal_size = 0
+
+            # Réécriture hors verrou : les sauvegardes continuent pendant la compaction
+            try:
+                self._write_workbook(rows)
+                os.remove(self.compacting_path)
+            except Exception as e:
+                # Le journal "compacting" est conservé et sera rejoué au prochain chargement
+                print(f"Erreur compaction Excel: {e}")
+
+    def _rotate_journal(self) -> None:
+        if not os.path.exists(self.journal_path):
+            return
+        if os.path.exists(self.compacting_path):
+            # Compaction précédente inachevée : on concatène pour ne rien perdre
+            with open(self.journal_path, "r", encoding="utf-8") as src, \
+                    open(self.compacting_path, "a", encoding="utf-8") as dst:
+                dst.write(src.read())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.compacting_path)
+
+    def _remove_journals(self) -> None:
+        for path in (self.journal_path, self.compacting_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._journal_size = 0
+
+    def close(self) -> None:
+        """Arrête la compaction en arrière-plan et reconstruit le classeur si nécessaire."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._compactor:
+            self._compactor.join()
+        self.compact()
@@ -0,0 +1,56 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Iterator, Optional
+from app.core.profile_cache import canonical_url
+
+class HtmlSnapshotStore:
+    """Instantanés HTML compressés des pages de profil visitées (un fichier gzip JSON par URL).
+
+    Permet de réextraire les champs hors ligne quand un sélecteur du parser casse,
+    sans revisiter les profils ; le corpus sert aussi de banc d'essai du parser.
+    """
+    SUFFIX = ".json.gz"
+
+    def __init__(self, directory: str, compress_level: int = 6):
+        self.directory = directory
+        self.compress_level = compress_level
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, url: str) -> str:
+        digest = hashlib.sha1(canonical_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + self.SUFFIX)
+
+    def save(self, url: str, html: str) -> None:
+        """Enregistre (ou remplace) l'instantané de l'URL ; écriture atomique."""
+        record = {"url": url, "fetched_at": time.time(), "html": html}
+        path = self.path_for(url)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, \
+                    gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self.compress_level) as f:
+                f.write(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Erreur enregistrement instantané HTML pour {url}: {e}")
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        path = self.path_for(url)
+        return self.read(path) if os.path.exists(path) else None
+
+    @staticmethod
+    def read(path: str) -> Dict[str, Any]:
+        """Lit un instantané : {"url", "fetched_at", "html"}."""
+        with gzip.open(path, "rb") as f:
+            return json.loads(f.read().decode("utf-8"))
+
+    def paths(self) -> Iterator[str]:
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(self.SUFFIX):
+                yield entry.path
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.paths())
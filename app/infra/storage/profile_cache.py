@@ -0,0 +1,98 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from app.core.profile_cache import ProfileCache, canonical_url
+
+class SqliteProfileCache(ProfileCache):
+    """Cache persistant des profils extraits, dans une base SQLite.
+
+    Clé : URL canonique. Chaque entrée garde le dictionnaire extrait (JSON), l'heure d'extraction
+    (expiration après `ttl` secondes) et l'heure du dernier accès (éviction LRU au-delà de `max_entries`).
+    """
+    def __init__(self, db_path: str, ttl: float = 30 * 86400, max_entries: int = 5000,
+                 clock: Callable[[], float] = time.time):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS profiles (
+                    url TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_profiles_access ON profiles(last_access);
+            """)
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        key = canonical_url(url)
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute("SELECT data, fetched_at FROM profiles WHERE url = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            data, fetched_at = row
+            if now - fetched_at > self.ttl:
+                self._conn.execute("DELETE FROM profiles WHERE url = ?", (key,))
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE profiles SET last_access = ? WHERE url = ?", (now, key))
+            self.hits += 1
+        return json.loads(data)
+
+    def put(self, url: str, data: Dict[str, Any]) -> None:
+        now = self._clock()
+        try:
+            payload = json.dumps(data, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            print(f"Erreur mise en cache du profil {url}: {e}")
+            return
+        with self._lock:
+            self._conn.execute("""
+                INSERT INTO profiles (url, data, fetched_at, last_access) VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    data=excluded.data, fetched_at=excluded.fetched_at, last_access=excluded.last_access
+            """, (canonical_url(url), payload, now, now))
+            self._evict()
+
+    def _evict(self) -> None:
+        # Suppression des entrées les moins récemment utilisées au-delà de la taille maximale
+        count = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute("""
+                DELETE FROM profiles WHERE url IN (
+                    SELECT url FROM profiles ORDER BY last_access LIMIT ?
+                )
+            """, (excess,))
+            self.evictions += excess
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "expired": self.expired,
+                "evictions": self.evictions, "entries": len(self)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
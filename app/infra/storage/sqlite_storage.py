@@ -0,0 +1,115 @@
+import os
+import sqlite3
+import threading
+from typing import List
+from app.core.models import Personne
+from app.core.repository import PersonRepository
+from app.core.metrics import metrics
+
+class SqliteRepository(PersonRepository):
+    """Implémentation du repository utilisant une base SQLite (mode WAL).
+
+    Contrairement à l'export Excel, la base conserve toute la session : personnes en attente,
+    analysées mais rejetées, et l'URL source de chaque découverte. Chaque modification est une
+    mise à jour de ligne ; le fichier Excel n'est plus qu'un export à la demande.
+    """
+    _FIELDS = "url, nom, titre, societe, lieu, source_url, analyzed, interesting"
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # La connexion est partagée entre le thread IHM et le thread écrivain (protégée par _lock)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS persons (
+                    url TEXT PRIMARY KEY,
+                    nom TEXT,
+                    titre TEXT,
+                    societe TEXT,
+                    lieu TEXT,
+                    source_url TEXT,
+                    analyzed INTEGER NOT NULL DEFAULT 0,
+                    interesting INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_persons_state ON persons(analyzed, interesting);
+                CREATE INDEX IF NOT EXISTS idx_persons_source ON persons(source_url);
+            """)
+
+    @staticmethod
+    def _to_params(p: Personne) -> tuple:
+        return (p.url, p.nom, p.titre, p.societe, p.lieu, p.source_url, int(p.analyzed), int(p.interesting))
+
+    def load_existing_persons(self) -> List[Personne]:
+        """Charge toutes les personnes de la session, dans leur ordre de découverte."""
+        with self._lock:
+            rows = self._conn.execute(f"SELECT {self._FIELDS} FROM persons ORDER BY rowid").fetchall()
+        return [Personne(url, nom, titre, societe, lieu, source_url, bool(analyzed), bool(interesting))
+                for url, nom, titre, societe, lieu, source_url, analyzed, interesting in rows]
+
+    @metrics.timed("storage.sqlite_write")
+    def _upsert(self, p: Personne) -> None:
+        # ON CONFLICT ... DO UPDATE conserve le rowid, donc l'ordre de découverte
+        with self._lock:
+            self._conn.execute(f"""
+                INSERT INTO persons ({self._FIELDS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    nom=excluded.nom, titre=excluded.titre, societe=excluded.societe,
+                    lieu=excluded.lieu, source_url=excluded.source_url,
+                    analyzed=excluded.analyzed, interesting=excluded.interesting
+            """, self._to_params(p))
+
+    def save_person(self, person: Personne) -> None:
+        """Ajoute ou met à jour la ligne de la personne."""
+        self._upsert(person)
+
+    def remove_person(self, person: Personne) -> None:
+        """La session complète est conservée : la personne est seulement enregistrée comme non intéressante."""
+        self._upsert(person)
+
+    def record_state(self, person: Personne) -> None:
+        self._upsert(person)
+
+    def exists(self) -> bool:
+        """Vérifie si le fichier de base existe."""
+        return os.path.exists(self.db_path)
+
+    def save_all(self, persons: List[Personne]) -> None:
+        """Remplace le contenu de la base par la liste fournie (transaction unique)."""
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM persons")
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO persons ({self._FIELDS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self._to_params(p) for p in persons))
+                self._conn.execute("COMMIT")
+            except Exception as e:
+                self._conn.execute("ROLLBACK")
+                print(f"Erreur recréation SQLite: {e}")
+
+    def interesting_persons(self) -> List[Personne]:
+        """Retourne les personnes marquées intéressantes (index sur l'état)."""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._FIELDS} FROM persons WHERE analyzed = 1 AND interesting = 1 ORDER BY rowid"
+            ).fetchall()
+        return [Personne(*row[:6], analyzed=True, interesting=True) for row in rows]
+
+    def export_excel(self, file_path: str) -> None:
+        """Exporte les personnes intéressantes vers un fichier Excel (export à la demande)."""
+        # Import local : pandas/openpyxl ne sont nécessaires que pour l'export
+        from app.infra.storage.excel_storage import ExcelRepository
+        # Mode journal : save_all réécrit le classeur et purge un éventuel journal antérieur
+        excel = ExcelRepository(file_path, journal=True)
+        excel.save_all(self.interesting_persons())
+        excel.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
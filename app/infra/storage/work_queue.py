@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from app.core.profile_cache import canonical_url
+from app.core.work_queue import WorkItem, WorkQueue, WorkResult
+
+class SqliteWorkQueue(WorkQueue):
+    """File de travail partagée dans un fichier SQLite (mode WAL), sans service externe.
+
+    Chaque processus ouvre sa propre connexion. Les emprunts se font dans une transaction
+    `BEGIN IMMEDIATE` : deux workers ne peuvent pas obtenir la même URL. L'URL canonique est
+    la clé primaire de la table, ce qui dédoublonne les découvertes de tous les workers.
+    Le fichier sert aussi de point de reprise : relancer le crawl reprend la frontière telle quelle.
+    """
+    def __init__(self, db_path: str, lease_timeout: float = 120.0, clock: Callable[[], float] = time.time):
+        self.db_path = db_path
+        self.lease_timeout = lease_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # timeout : attente du verrou d'écriture tenu par un autre processus
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS frontier (
+                    url TEXT PRIMARY KEY,
+                    source_url TEXT,
+                    nom TEXT,
+                    titre TEXT,
+                    hops INTEGER NOT NULL DEFAULT 0,
+                    priority REAL NOT NULL DEFAULT 0,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    worker TEXT,
+                    lease_until REAL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    data TEXT,
+                    interesting INTEGER NOT NULL DEFAULT 0,
+                    completed_at REAL,
+                    exported INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_frontier_next ON frontier(status, priority DESC);
+                CREATE INDEX IF NOT EXISTS idx_frontier_results ON frontier(exported, completed_at);
+            """)
+
+    def add(self, items: Iterable[WorkItem]) -> int:
+        rows = [(canonical_url(i.url), canonical_url(i.source_url) if i.source_url else None,
+                 i.nom, i.titre, i.hops, i.priority) for i in items]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                new = 0
+                for row in rows:
+                    cursor = self._conn.execute("""
+                        INSERT OR IGNORE INTO frontier (url, source_url, nom, titre, hops, priority)
+                        VALUES (?, ?, ?, ?, ?, ?)""", row)
+                    if cursor.rowcount:
+                        new += 1
+                    else:
+                        # Déjà connue : une URL encore en attente profite d'un chemin plus court
+                        self._conn.execute("""
+                            UPDATE frontier SET hops = MIN(hops, ?), priority = MAX(priority, ?)
+                            WHERE url = ? AND status = 'pending' AND (hops > ? OR priority < ?)""",
+                                           (row[4], row[5], row[0], row[4], row[5]))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return new
+
+    def mark_known(self, urls: Iterable[str]) -> None:
+        with self._lock:
+            # Une URL encore en attente dans la file (crawl précédent) est aussi retirée du parcours
+            self._conn.executemany("""
+                INSERT INTO frontier (url, status, exported) VALUES (?, 'known', 1)
+                ON CONFLICT(url) DO UPDATE SET status = 'known', exported = 1 WHERE status = 'pending'""",
+                                   [(canonical_url(u),) for u in urls])
+
+    def lease(self, worker: str, max_processed: Optional[int] = None) -> Optional[WorkItem]:
+        now = self._clock()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._reclaim(now)
+                if max_processed is not None:
+                    (processed,) = self._conn.execute(
+                        "SELECT COUNT(*) FROM frontier WHERE status IN ('leased', 'done', 'failed')").fetchone()
+                    if processed >= max_processed:
+                        self._conn.execute("COMMIT")
+                        return None
+                row = self._conn.execute("""
+                    SELECT url, source_url, nom, titre, hops, priority, attempts FROM frontier
+                    WHERE status = 'pending' ORDER BY priority DESC, rowid LIMIT 1""").fetchone()
+                if row:
+                    self._conn.execute("""
+                        UPDATE frontier SET status = 'leased', worker = ?, lease_until = ?, attempts = attempts + 1
+                        WHERE url = ?""", (worker, now + self.lease_timeout, row[0]))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        url, source_url, nom, titre, hops, priority, attempts = row
+        return WorkItem(url, source_url, nom, titre, hops, priority, attempts + 1)
+
+    def complete(self, url: str, worker: str, data: Dict[str, Any], interesting: bool) -> bool:
+        with self._lock:
+            # Premier résultat retenu : un bail expiré puis repris peut produire un doublon de travail
+            cursor = self._conn.execute("""
+                UPDATE frontier SET status = 'done', worker = ?, lease_until = NULL, data = ?,
+                                    interesting = ?, completed_at = ?
+                WHERE url = ? AND status IN ('pending', 'leased')""",
+                                        (worker, json.dumps(data, ensure_ascii=False), int(interesting),
+                                         self._clock(), canonical_url(url)))
+        return cursor.rowcount > 0
+
+    def fail(self, url: str, worker: str, max_attempts: int = 1) -> None:
+        with self._lock:
+            self._conn.execute("""
+                UPDATE frontier SET
+                    status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    completed_at = CASE WHEN attempts >= ? THEN ? END,
+                    lease_until = NULL
+                WHERE url = ? AND status = 'leased' AND worker = ?""",
+                               (max_attempts, max_attempts, self._clock(), canonical_url(url), worker))
+
+    def renew(self, url: str, worker: str) -> None:
+        with self._lock:
+            self._conn.execute("UPDATE frontier SET lease_until = ? WHERE url = ? AND status = 'leased' AND worker = ?",
+                               (self._clock() + self.lease_timeout, canonical_url(url), worker))
+
+    def _reclaim(self, now: float) -> int:
+        return self._conn.execute("""
+            UPDATE frontier SET status = 'pending', worker = NULL, lease_until = NULL
+            WHERE status = 'leased' AND lease_until < ?""", (now,)).rowcount
+
+    def reclaim_expired(self) -> int:
+        with self._lock:
+            return self._reclaim(self._clock())
+
+    def results(self, limit: int = 500) -> List[WorkResult]:
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT url, source_url, nom, titre, data, interesting FROM frontier
+                WHERE exported = 0 AND status IN ('done', 'failed')
+                ORDER BY completed_at LIMIT ?""", (limit,)).fetchall()
+        return [WorkResult(url, source_url, nom, titre, json.loads(data) if data else None, bool(interesting))
+                for url, source_url, nom, titre, data, interesting in rows]
+
+    def acknowledge(self, urls: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.executemany("UPDATE frontier SET exported = 1 WHERE url = ?", [(u,) for u in urls])
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM frontier GROUP BY status").fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0, "failed": 0, "known": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,14 +1,34 @@
 from playwright.async_api import async_playwright
-import random
-import asyncio
+import time
+from app.core.rate_limiter import AdaptiveRateLimiter
+from app.core.metrics import metrics
+from app.scraper.page_pool import PagePool
+from app.scraper.routing import RoutingPolicy
+
+# URLs des pages de vérification / mur de connexion LinkedIn
+CHALLENGE_MARKERS = ("/checkpoint/", "/authwall", "/uas/login")
+# Codes HTTP de limitation de débit (999 : code propre à LinkedIn)
+THROTTLE_STATUSES = (429, 999)
+# Seules les requêtes LinkedIn sont enregistrées dans le fichier HAR
+HAR_URL_FILTER = "**/*linkedin.com/**"
 
 class LinkedInBrowser:
     """Contrôleur du navigateur Playwright pour l'automatisation LinkedIn."""
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, pool_size=2, page_recycle_after=50, routing: RoutingPolicy = None,
+                 limiter: AdaptiveRateLimiter = None, har_mode: str = "off", har_path: str = None):
         self.headless = headless
+        # Enregistrement ("record") ou rejeu hors ligne ("replay") des échanges LinkedIn dans un fichier HAR
+        self.har_mode = har_mode if har_path else "off"
+        self.har_path = har_path
+        # Toutes les navigations (page visible et pool) passent par ce limiteur global
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.pool_size = pool_size
+        self.page_recycle_after = page_recycle_after
+        self.routing = routing # Blocage des ressources lourdes : tout le contexte en headless, sinon pages du pool
         self.browser = None
         self.context = None
-        self.page = None
+        self.page = None   # Page visible par l'utilisateur
+        self.pool = None   # Pages secondaires pour le travail en arrière-plan
         self.playwright = None
         self.on_close_callback = None
 
@@ -22,9 +42,36 @@ class LinkedInBrowser:
         
         # Le viewport=None sans start-maximized permet de démarrer avec une fenêtre standard
         # mais redimensionnable dynamiquement par l'utilisateur
-        self.context = await self.browser.new_context(no_viewport=True)
+        if self.har_mode == "record":
+            self.context = await self.browser.new_context(no_viewport=True, record_har_path=self.har_path,
+                                                          record_har_url_filter=HAR_URL_FILTER)
+        else:
+            self.context = await self.browser.new_context(no_viewport=True)
+        if self.har_mode == "replay":
+            # Réponses servies depuis le HAR ; toute requête absente de l'enregistrement est annulée
+            await self.context.route_from_har(self.har_path, url=HAR_URL_FILTER, not_found="abort")
+        setup = None
+        if self.routing:
+            if self.headless:
+                await self.routing.apply(self.context)
+            else:
+                # La page visible reste complète pour l'utilisateur
+                setup = self.routing.apply
         
         self.page = await self.context.new_page()
+        self.pool = PagePool(self.context, size=self.pool_size, max_navigations=self.page_recycle_after,
+                             setup=setup)
+
+    @property
+    def replaying(self) -> bool:
+        return self.har_mode == "replay"
+
+    def _is_routed(self, page) -> bool:
+        return bool(self.routing) and (self.headless or page is not self.page)
+
+    def lease(self):
+        """Emprunte une page secondaire du pool (`async with browser.lease() as page:`)."""
+        return self.pool.lease()
 
     def set_on_close_callback(self, callback):
         self.on_close_callback = callback
@@ -36,7 +83,18 @@ class LinkedInBrowser:
 
     async def stop(self):
         """Ferme proprement les ressources Playwright."""
+        limiter = self.limiter.stats()
+        print(f"Rythme final : {limiter['interval']:.2f} s entre navigations "
+              f"({limiter['successes']} succès, {limiter['errors']} erreurs, {limiter['challenges']} vérifications)")
+        if self.routing and self.routing.navigations:
+            s = self.routing.summary()
+            print(f"Interception : {s['blocked_requests']} requêtes bloquées, "
+                  f"~{s['avg_blocked_bytes_per_navigation'] / 1024:.0f} Ko et "
+                  f"{s['avg_blocked_per_navigation']:.1f} requêtes économisés par navigation, "
+                  f"chargement moyen {s['avg_load_seconds']:.2f} s")
         try:
+            if self.pool:
+                await self.pool.close()
             if self.context:
                 await self.context.close()
             if self.browser:
@@ -48,6 +106,9 @@ class LinkedInBrowser:
 
     async def login_manual(self):
         """Ouvre la page de login et attend que l'utilisateur soit sur le feed."""
+        if self.replaying:
+            print("Mode rejeu HAR : connexion ignorée.")
+            return
         try:
             await self.page.goto("https://www.linkedin.com/login")
             print("Veuillez vous connecter manuellement dans la fenêtre du navigateur...")
@@ -64,18 +125,48 @@ class LinkedInBrowser:
              else:
                  raise e
 
-    async def go_to_profile(self, url: str):
-        """Navigue vers l'URL d'un profil et attend un court instant."""
-        await self.page.goto(url)
-        # Délai aléatoire "humain" demandé
-        await asyncio.sleep(random.uniform(1.5, 3.0))
+    async def navigate(self, url: str, page=None):
+        """Navigue vers une URL au rythme du limiteur, et lui signale latence, erreur ou vérification."""
+        page = page or self.page
+        if not self.replaying:
+            # Hors ligne, aucun rythme à respecter : on mesure le coût réel du chargement et de l'extraction
+            with metrics.timer("browser.rate_limit_wait"):
+                await self.limiter.acquire()
+        routed = self._is_routed(page)
+        if routed:
+            self.routing.begin_navigation(page, url)
+        start = time.monotonic()
+        try:
+            response = await page.goto(url)
+        except Exception:
+            self.limiter.record_error()
+            metrics.increment("browser.goto_errors")
+            raise
+        finally:
+            if routed:
+                self.routing.end_navigation(page)
+        metrics.observe("browser.goto", time.monotonic() - start)
+        if any(marker in page.url for marker in CHALLENGE_MARKERS) or \
+                (response is not None and response.status in THROTTLE_STATUSES):
+            self.limiter.record_challenge()
+        elif response is not None and response.status >= 400:
+            self.limiter.record_error()
+        else:
+            self.limiter.record_success(time.monotonic() - start)
+        return response
+
+    async def go_to_profile(self, url: str, page=None):
+        """Navigue vers l'URL d'un profil (page visible par défaut)."""
+        await self.navigate(url, page)
 
     async def open_show_all_modal(self):
         """Clique sur le bouton 'Show all' entouré en rouge."""
         selector = 'a[aria-label="Show all other similar profiles"]'
         # Correction: scroll_into_view_if_needed est une méthode de Locator, pas de Page
         await self.page.locator(selector).scroll_into_view_if_needed()
-        await asyncio.sleep(1)
+        # Le clic charge la liste depuis LinkedIn : il est rythmé comme une navigation
+        if not self.replaying:
+            await self.limiter.acquire()
         await self.page.click(selector)
         # Attendre que la modale apparaisse
         await self.page.wait_for_selector(".artdeco-modal")
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""Réextraction hors ligne des profils à partir des instantanés HTML (aucun accès réseau).
+
+Usage : python -m app.scraper.offline_parser data/snapshots [--workers 4] [--output profils.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from selectolax.lexbor import LexborHTMLParser
+
+from app.scraper import profile_selectors as sel
+from app.infra.storage.html_snapshots import HtmlSnapshotStore
+
+def _text(tree: LexborHTMLParser, selector: str) -> str:
+    node = tree.css_first(selector)
+    # Équivalent de inner_text : espaces et retours à la ligne normalisés
+    return " ".join(node.text(separator=" ").split()) if node is not None else ""
+
+def parse_html(html: str, url: str) -> Dict:
+    """Extrait les mêmes champs que `LinkedInParser.extract_main_profile`, depuis le HTML brut
+    (même format : champs trouvés, `url` et liste `missing`)."""
+    tree = LexborHTMLParser(html)
+    result: Dict = {}
+    for name, selector in sel.PROFILE_FIELDS.items():
+        text = _text(tree, selector)
+        if text:
+            result[name] = text
+    missing = [name for name in sel.PROFILE_FIELDS if name not in result]
+    result["url"] = url
+    result["missing"] = missing
+    return result
+
+def parse_snapshot(path: str) -> Optional[Dict]:
+    try:
+        snapshot = HtmlSnapshotStore.read(path)
+        return parse_html(snapshot["html"], snapshot["url"])
+    except Exception as e:
+        print(f"Erreur analyse de l'instantané {path}: {e}")
+        return None
+
+def reparse_all(directory: str, workers: Optional[int] = None) -> List[Dict]:
+    """Réanalyse tous les instantanés du répertoire sur un pool de processus."""
+    paths = list(HtmlSnapshotStore(directory).paths())
+    if workers == 1:
+        results = map(parse_snapshot, paths)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Lots de fichiers par tâche : limite le coût de communication entre processus
+            chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+            results = list(pool.map(parse_snapshot, paths, chunksize=chunksize))
+    return [r for r in results if r]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Réextraction des profils depuis les instantanés HTML")
+    parser.add_argument("directory", help="Répertoire des instantanés (snapshots.directory)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut : nb de CPU)")
+    parser.add_argument("--output", help="Fichier JSON de sortie")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    profiles = reparse_all(args.directory, args.workers)
+    elapsed = time.perf_counter() - start
+    rate = len(profiles) / elapsed if elapsed else 0.0
+    print(f"{len(profiles)} profils réanalysés en {elapsed:.2f} s ({rate:.0f} profils/s)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(profiles, f, ensure_ascii=False, indent=2)
+    else:
+        missing = sum(1 for p in profiles if "nom" in p["missing"] or "titre" in p["missing"])
+        if missing:
+            print(f"{missing} profils sans nom ou titre : sélecteurs à vérifier", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
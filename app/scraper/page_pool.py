@@ -0,0 +1,121 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+class PagePool:
+    """Pool de pages Playwright secondaires ouvertes sur le contexte partagé (même session LinkedIn).
+
+    Les pages sont empruntées via `lease()` et rendues automatiquement à la sortie du bloc.
+    Au plus `size` pages existent simultanément ; une page fermée, plantée ou ayant effectué
+    `max_navigations` navigations est fermée et remplacée au prochain emprunt (plafonne la mémoire).
+    Les emprunteurs en attente sont réveillés à chaque page rendue, place libérée ou fermeture du pool.
+    """
+    def __init__(self, context, size: int = 2, max_navigations: int = 50,
+                 setup: Optional[Callable[[Any], Awaitable[None]]] = None):
+        self.context = context
+        self.size = max(1, size)
+        self.max_navigations = max_navigations
+        self.setup = setup                       # Préparation de chaque nouvelle page (interception...)
+        self._idle: Deque[Any] = deque()         # Pages libres
+        self._available = asyncio.Condition()    # Page libre, place libérée ou pool fermé
+        self._pages: List[Any] = []              # Pages vivantes (libres ou empruntées)
+        self._navigations: Dict[int, int] = {}   # id(page) -> nombre de navigations
+        self._crashed: set = set()
+        self._creating = 0                       # Pages en cours d'ouverture (places réservées)
+        self._closed = False
+
+    @asynccontextmanager
+    async def lease(self):
+        """Emprunte une page saine du pool (attend qu'une page se libère si le pool est plein)."""
+        page = await self._acquire()
+        try:
+            yield page
+        finally:
+            await self._release(page)
+
+    async def _acquire(self):
+        while True:
+            async with self._available:
+                while not self._closed and not self._idle and len(self._pages) + self._creating >= self.size:
+                    await self._available.wait()
+                if self._closed:
+                    raise RuntimeError("Pool de pages fermé")
+                page = self._idle.popleft() if self._idle else None
+                if page is None:
+                    self._creating += 1              # Place réservée avant l'ouverture
+            if page is None:
+                return await self._new_page()
+            if self._is_healthy(page):
+                return page
+            await self._discard(page)
+
+    async def _new_page(self):
+        """Ouvre une page sur une place réservée (`_creating`), rendue au pool en cas d'échec."""
+        try:
+            page = await self.context.new_page()
+        except BaseException:
+            self._creating -= 1
+            await self._notify()
+            raise
+        self._creating -= 1
+        key = id(page)
+        self._pages.append(page)
+        self._navigations[key] = 0
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                self._navigations[key] = self._navigations.get(key, 0) + 1
+
+        page.on("framenavigated", on_navigated)
+        page.on("crash", lambda _: self._crashed.add(key))
+        if self.setup:
+            try:
+                await self.setup(page)
+            except BaseException:
+                await self._discard(page)
+                raise
+        return page
+
+    async def _notify(self):
+        async with self._available:
+            self._available.notify_all()
+
+    def _is_healthy(self, page) -> bool:
+        key = id(page)
+        return not page.is_closed() and key not in self._crashed \
+            and self._navigations.get(key, 0) < self.max_navigations
+
+    async def _release(self, page):
+        if self._closed:
+            await self._discard(page)
+        elif self._is_healthy(page):
+            self._idle.append(page)
+            await self._notify()
+        else:
+            # La place libérée réveille un emprunteur en attente, qui ouvre la page de remplacement
+            await self._discard(page)
+
+    async def _discard(self, page):
+        """Ferme une page usée ou défaillante et libère sa place dans le pool."""
+        key = id(page)
+        if page in self._pages:
+            self._pages.remove(page)
+        self._navigations.pop(key, None)
+        self._crashed.discard(key)
+        await self._notify()
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            print(f"Erreur lors de la fermeture d'une page du pool : {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"pages": len(self._pages), "idle": len(self._idle), "size": self.size}
+
+    async def close(self):
+        """Ferme toutes les pages libres ; les pages empruntées sont fermées à leur retour."""
+        self._closed = True
+        await self._notify()   # Les emprunteurs en attente échouent au lieu d'attendre indéfiniment
+        while self._idle:
+            await self._discard(self._idle.popleft())
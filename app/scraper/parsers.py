@@ -1,76 +1,185 @@
-from playwright.async_api import Page
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional
 import asyncio
+from app.scraper import profile_selectors as sel
+
+if TYPE_CHECKING:  # Annotations seulement : le parser reste importable (et testable) sans Playwright
+    from playwright.async_api import Page
 
 class LinkedInParser:
     """Utilitaires d'extraction de données depuis les pages LinkedIn."""
     @staticmethod
-    async def extract_main_profile(page: Page, url: str) -> Dict:
-        """Extrait les informations principales (nom, titre, société...) d'un profil."""
-        # Attente du chargement du bloc identité
-        await page.wait_for_selector("h1")
+    async def extract_main_profile(page: "Page", url: str, timeout: float = 5.0, field_timeout: float = 1.0) -> Dict:
+        """Extrait les informations principales (nom, titre, société...) d'un profil.
 
-        nom = await page.locator("h1").first.inner_text()
-        # Titre juste en dessous du nom
-        titre = await page.locator(".text-body-medium.break-words").first.inner_text()
+        Tous les champs sont lus en un seul `page.evaluate`. Seuls les champs absents sont ensuite
+        attendus, en parallèle et avec un délai de `field_timeout` secondes chacun. Ne lève pas
+        d'exception : le résultat ne contient que les champs trouvés, et `missing` liste les autres.
+        """
+        # Attente du chargement du bloc identité, bornée (page hors profil : on n'attend pas 30 s)
+        try:
+            await page.wait_for_selector(sel.NOM, timeout=timeout * 1000)
+        except Exception:
+            pass
 
-        # Société via aria-label (votre capture 4)
-        societe = ""
-        societe_loc = page.locator('button[aria-label^="Current company:"]')
-        if await societe_loc.count() > 0:
-            societe = (await societe_loc.inner_text()).strip()
+        try:
+            found = await page.evaluate(_EXTRACT_FIELDS_JS, sel.PROFILE_FIELDS)
+        except Exception as e:
+            print(f"Erreur extraction du profil {url}: {e}")
+            found = {}
 
-        # Lieu (votre capture 5)
-        lieu = await page.locator("span.text-body-small.inline.t-black--light.break-words").first.inner_text()
+        missing = [name for name in sel.PROFILE_FIELDS if name not in found]
+        # Rattrapage des champs rendus tardivement, seulement si la page est bien un profil
+        if missing and "nom" in found:
+            texts = await asyncio.gather(*(
+                LinkedInParser._wait_field_text(page, sel.PROFILE_FIELDS[name], field_timeout)
+                for name in missing))
+            for name, text in zip(list(missing), texts):
+                if text:
+                    found[name] = text
+                    missing.remove(name)
 
-        return {
-            "nom": nom.strip(),
-            "titre": titre.strip(),
-            "societe": societe,
-            "lieu": lieu.strip(),
-            "url": url
-        }
+        result = {name: found[name] for name in sel.PROFILE_FIELDS if name in found}
+        result["url"] = url
+        result["missing"] = missing
+        return result
 
     @staticmethod
-    async def extract_modal_suggestions(page: Page) -> List[Dict]:
-        """Scrape la liste des profils suggérés dans la modale 'People also viewed'."""
-        suggestions = []
+    async def _wait_field_text(page: "Page", selector: str, timeout: float) -> Optional[str]:
+        try:
+            locator = page.locator(selector).first
+            await locator.wait_for(state="attached", timeout=timeout * 1000)
+            return (await locator.inner_text(timeout=timeout * 1000)).strip() or None
+        except Exception:
+            return None
+
+    @staticmethod
+    async def extract_modal_suggestions(page: "Page", item_timeout: float = 1.0) -> List[Dict]:
+        """Scrape la liste des profils suggérés dans la modale 'People also viewed'.
+
+        Les items sont d'abord tous chargés (défilement jusqu'à stabilité du nombre d'items), puis
+        extraits en un seul aller-retour `page.evaluate`. L'extraction item par item ne sert plus
+        que de repli pour les items profil dont le texte n'a pas pu être lu, avec un délai de
+        `item_timeout` secondes par appel. Les items sans lien profil (société, "voir plus") sont ignorés.
+        """
         # On attend que la modale soit visible (votre trait jaune)
-        await page.wait_for_selector('div[data-test-modal]')
-
-        # Liste des items (votre trait bleu), on cible uniquement ce qui est dans la modale
-        items = page.locator("div[data-test-modal] li.artdeco-list__item")
-        count = await items.count()
-
-        for i in range(count):
-            item = items.nth(i)
-            try:
-                # On s'assure que l'élément est visible (scroll si besoin) pour déclencher le chargement (lazy load)
-                # On cible un élément interne (le lien) pour être sûr
-                await item.locator('a[data-field="browsemap_card_click"]').first.scroll_into_view_if_needed()
-                # Petite pause pour laisser le temps au rendu si nécessaire
-                await asyncio.sleep(0.1)
-
-                # Récupération de l'élément
-                link_el = item.locator('a[data-field="browsemap_card_click"]')
-                # Récupération de l'URL dans le premier sous élément
-                url = await link_el.first.get_attribute("href")
-                
-                # Récupération des texte dans le second sous élément
-                # Note: locator() n'est pas awaitable
-                text_el = link_el.nth(1).locator('span[aria-hidden="true"]')
-                # Le Nom est dans la premier span, et le titre dans le dernière
-                nom = await text_el.first.inner_text()
-                titre = await text_el.nth(-1).inner_text()
+        await page.wait_for_selector(sel.MODAL)
+        await LinkedInParser._load_all_modal_items(page)
 
+        items = None
+        try:
+            rows = await page.evaluate(_EXTRACT_MODAL_ITEMS_JS, [sel.MODAL_ITEM, sel.MODAL_LINK, sel.MODAL_TEXT])
+        except Exception as e:
+            # Lot illisible (navigation, contexte JS détruit...) : tous les items passent par le repli
+            print(f"Erreur extraction groupée des suggestions, repli item par item : {e}")
+            items = page.locator(sel.MODAL_ITEM)
+            rows = [{"index": i} for i in range(await items.count())]
+        suggestions = []
+        for row in rows:
+            if row.get("skip"):
+                continue
+            if row.get("url") and row.get("nom"):
                 suggestions.append({
-                    "nom": nom.strip(),
-                    "titre": titre.strip(),
-                    "url": url.split('?')[0] # Nettoyage des paramètres d'URL
+                    "nom": row["nom"].strip(),
+                    "titre": (row.get("titre") or "").strip(),
+                    "url": row["url"].split('?')[0] # Nettoyage des paramètres d'URL
                 })
-            except Exception as e:
-                # On ignore silencieusement les erreurs si ce n'est pas un profil valide ou si timeout
-                # print(f"Erreur extraction item {i}: {e}")
                 continue
-            
-        return suggestions
\ No newline at end of file
+            # Repli : item pas encore rendu ou structure inattendue
+            if items is None:
+                items = page.locator(sel.MODAL_ITEM)
+            suggestion = await LinkedInParser._extract_modal_item(items.nth(row["index"]), item_timeout)
+            if suggestion:
+                suggestions.append(suggestion)
+        return suggestions
+
+    @staticmethod
+    async def _load_all_modal_items(page: "Page", max_rounds: int = 20, settle: float = 0.3) -> int:
+        """Fait défiler la modale jusqu'au dernier item tant que de nouveaux items apparaissent (lazy load)."""
+        previous, stable, count = -1, 0, 0
+        for _ in range(max_rounds):
+            count = await page.evaluate(_SCROLL_TO_LAST_ITEM_JS, sel.MODAL_ITEM)
+            if count == previous:
+                stable += 1
+                if stable >= 2:
+                    break
+            else:
+                stable = 0
+            previous = count
+            await asyncio.sleep(settle)
+        return count
+
+    @staticmethod
+    async def _extract_modal_item(item, timeout: float = 1.0) -> Optional[Dict]:
+        """Extraction d'un seul item de la modale (chemin lent, utilisé en repli)."""
+        timeout_ms = timeout * 1000
+        try:
+            # Item sans lien profil + lien texte : rien à attendre (count() ne bloque pas)
+            if await item.locator(sel.MODAL_LINK).count() < 2:
+                return None
+            # On s'assure que l'élément est visible (scroll si besoin) pour déclencher le chargement (lazy load)
+            # On cible un élément interne (le lien) pour être sûr
+            await item.locator(sel.MODAL_LINK).first.scroll_into_view_if_needed(timeout=timeout_ms)
+            # Petite pause pour laisser le temps au rendu si nécessaire
+            await asyncio.sleep(0.1)
+
+            # Récupération de l'élément
+            link_el = item.locator(sel.MODAL_LINK)
+            # Récupération de l'URL dans le premier sous élément
+            url = await link_el.first.get_attribute("href", timeout=timeout_ms)
+
+            # Récupération des texte dans le second sous élément
+            # Note: locator() n'est pas awaitable
+            text_el = link_el.nth(1).locator(sel.MODAL_TEXT)
+            # Le Nom est dans la premier span, et le titre dans le dernière
+            nom = await text_el.first.inner_text(timeout=timeout_ms)
+            titre = await text_el.nth(-1).inner_text(timeout=timeout_ms)
+
+            return {
+                "nom": nom.strip(),
+                "titre": titre.strip(),
+                "url": url.split('?')[0] # Nettoyage des paramètres d'URL
+            }
+        except Exception:
+            # On ignore silencieusement les erreurs si ce n'est pas un profil valide ou si timeout
+            return None
+
+
+# Texte de chaque champ du profil (premier élément correspondant) ; les champs vides sont omis
+_EXTRACT_FIELDS_JS = """
+(selectors) => {
+    const found = {};
+    for (const [name, selector] of Object.entries(selectors)) {
+        const element = document.querySelector(selector);
+        const text = element ? element.innerText.trim() : "";
+        if (text) found[name] = text;
+    }
+    return found;
+}
+"""
+
+# Fait défiler jusqu'au dernier item de la liste et retourne le nombre d'items chargés
+_SCROLL_TO_LAST_ITEM_JS = """
+(itemSelector) => {
+    const items = document.querySelectorAll(itemSelector);
+    if (items.length) items[items.length - 1].scrollIntoView({block: "end"});
+    return items.length;
+}
+"""
+
+# Lecture de tous les items en une passe : index, URL (premier lien), nom et titre (spans du second lien).
+# Les items à moins de deux liens ne sont pas des profils (`skip`)
+_EXTRACT_MODAL_ITEMS_JS = """
+([itemSelector, linkSelector, textSelector]) => {
+    return Array.from(document.querySelectorAll(itemSelector), (item, index) => {
+        const links = item.querySelectorAll(linkSelector);
+        if (links.length < 2) return {index, skip: true};   // Pas un profil : pas de repli
+        const spans = links[1].querySelectorAll(textSelector);
+        return {
+            index,
+            url: links[0].getAttribute("href"),
+            nom: spans.length ? spans[0].innerText : null,
+            titre: spans.length ? spans[spans.length - 1].innerText : null
+        };
+    });
+}
+"""
@@ -0,0 +1,19 @@
+# Sélecteurs CSS du profil LinkedIn, partagés par le parser Playwright et le parser hors ligne.
+# Un sélecteur cassé se corrige ici, puis les instantanés HTML peuvent être réanalysés.
+
+NOM = "h1"
+# Titre juste en dessous du nom
+TITRE = ".text-body-medium.break-words"
+# Société via aria-label
+SOCIETE = 'button[aria-label^="Current company:"]'
+LIEU = "span.text-body-small.inline.t-black--light.break-words"
+
+# Modale "People also viewed"
+MODAL = "div[data-test-modal]"
+MODAL_ITEM = "div[data-test-modal] li.artdeco-list__item"
+# Le premier lien porte l'URL, le second les textes (nom dans le premier span, titre dans le dernier)
+MODAL_LINK = 'a[data-field="browsemap_card_click"]'
+MODAL_TEXT = 'span[aria-hidden="true"]'
+
+# Champs extraits d'une page de profil, dans l'ordre du résultat
+PROFILE_FIELDS = {"nom": NOM, "titre": TITRE, "societe": SOCIETE, "lieu": LIEU}
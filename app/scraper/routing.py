@@ -0,0 +1,112 @@
+import re
+import time
+from dataclasses import dataclass, field
+from fnmatch import translate
+from typing import Any, Dict, Iterable, List, Optional
+
+# Taille moyenne estimée d'une ressource bloquée (octets), par type Playwright
+DEFAULT_ESTIMATED_BYTES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 30_000,
+    "stylesheet": 20_000,
+    "script": 50_000,
+}
+FALLBACK_ESTIMATED_BYTES = 2_000
+
+@dataclass
+class NavigationStats:
+    """Requêtes bloquées / autorisées pendant le chargement d'une page."""
+    url: str
+    started: float = field(default_factory=time.perf_counter)
+    load_seconds: float = 0.0
+    allowed: int = 0
+    blocked: int = 0
+    blocked_bytes: int = 0   # Estimation (les requêtes annulées n'ont pas de taille connue)
+
+class RoutingPolicy:
+    """Politique d'interception des requêtes : annule les ressources inutiles au parsing
+    (par type de ressource et motif d'URL) et comptabilise le gain par navigation."""
+
+    def __init__(self, resource_types: Iterable[str] = (), url_patterns: Iterable[str] = (),
+                 estimated_bytes: Optional[Dict[str, int]] = None, history: int = 500):
+        self.resource_types = frozenset(resource_types)
+        patterns = list(url_patterns)
+        # Motifs glob réunis en une seule expression régulière
+        self._url_regex = re.compile("|".join(translate(p) for p in patterns)) if patterns else None
+        self.estimated_bytes = {**DEFAULT_ESTIMATED_BYTES, **(estimated_bytes or {})}
+        self.history = history
+        self.navigations: List[NavigationStats] = []
+        self._current: Dict[int, NavigationStats] = {}   # id(page) -> navigation en cours
+        self.total_allowed = 0
+        self.total_blocked = 0
+        self.total_blocked_bytes = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["RoutingPolicy"]:
+        """Construit la politique à partir de la section `browser.routing` (None si désactivée)."""
+        cfg = config.get('browser', {}).get('routing', {}) or {}
+        if not cfg.get('enabled', False):
+            return None
+        return cls(cfg.get('block_resource_types', []) or [],
+                   cfg.get('block_url_patterns', []) or [],
+                   cfg.get('estimated_bytes'))
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.resource_types:
+            return True
+        return bool(self._url_regex and self._url_regex.match(url))
+
+    async def apply(self, target) -> None:
+        """Installe l'interception sur un contexte ou une page Playwright."""
+        await target.route("**/*", self.handle)
+
+    async def handle(self, route, request) -> None:
+        resource_type = request.resource_type
+        navigation = self._navigation_of(request)
+        if self.should_block(resource_type, request.url):
+            estimate = self.estimated_bytes.get(resource_type, FALLBACK_ESTIMATED_BYTES)
+            self.total_blocked += 1
+            self.total_blocked_bytes += estimate
+            if navigation:
+                navigation.blocked += 1
+                navigation.blocked_bytes += estimate
+            await route.abort()
+        else:
+            self.total_allowed += 1
+            if navigation:
+                navigation.allowed += 1
+            # fallback : laisse la main aux autres gestionnaires (rejeu HAR) avant le réseau
+            await route.fallback()
+
+    def _navigation_of(self, request) -> Optional[NavigationStats]:
+        try:
+            return self._current.get(id(request.frame.page))
+        except Exception:
+            # Requêtes sans page associée (service worker...)
+            return None
+
+    def begin_navigation(self, page, url: str) -> None:
+        self._current[id(page)] = NavigationStats(url)
+
+    def end_navigation(self, page) -> Optional[NavigationStats]:
+        navigation = self._current.pop(id(page), None)
+        if navigation:
+            navigation.load_seconds = time.perf_counter() - navigation.started
+            self.navigations.append(navigation)
+            if len(self.navigations) > self.history:
+                del self.navigations[:len(self.navigations) - self.history]
+        return navigation
+
+    def summary(self) -> Dict[str, float]:
+        """Totaux et moyennes par navigation (requêtes, octets estimés économisés, temps de chargement)."""
+        count = len(self.navigations)
+        return {
+            "navigations": count,
+            "blocked_requests": self.total_blocked,
+            "allowed_requests": self.total_allowed,
+            "blocked_bytes": self.total_blocked_bytes,
+            "avg_blocked_per_navigation": sum(n.blocked for n in self.navigations) / count if count else 0.0,
+            "avg_blocked_bytes_per_navigation": sum(n.blocked_bytes for n in self.navigations) / count if count else 0.0,
+            "avg_load_seconds": sum(n.load_seconds for n in self.navigations) / count if count else 0.0,
+        }
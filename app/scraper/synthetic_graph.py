@@ -0,0 +1,156 @@
+import math
+import random
+import re
+import zlib
+from typing import Any, Dict, List, Optional
+
+FIRST_NAMES = ["Jean", "Marie", "Pierre", "Sophie", "Luc", "Camille", "Hélène", "Thomas", "Inès", "Karim",
+               "Julie", "Nicolas", "Claire", "Antoine", "Sarah", "Mehdi", "Emma", "Hugo", "Léa", "Olivier"]
+LAST_NAMES = ["Dupont", "Martin", "Bernard", "Dubois", "Lefèvre", "Moreau", "Girard", "Roux", "Faure",
+              "Blanc", "Garnier", "Chevalier", "Lambert", "Fontaine", "Mercier", "Bonnet", "Nguyen", "Perrin"]
+# Titres : fonction + domaine, avec une part de titres "seniors" correspondant aux mots-clés usuels
+SENIOR_ROLES = ["Directeur", "Directrice", "Head of", "Responsable", "Chef de service", "VP", "CTO", "CIO",
+                "Lead", "Manager"]
+OTHER_ROLES = ["Développeur", "Ingénieur", "Consultant", "Analyste", "Chargé de mission", "Assistant",
+               "Architecte", "Data Scientist", "Product Owner", "Technicien"]
+DOMAINS = ["Systèmes d'Information", "Data", "Achats", "Infrastructure", "Cybersécurité", "Marketing",
+           "Finance", "Ressources Humaines", "Logistique", "Produit", "Cloud", "Ventes"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises", "Hooli",
+             "Soylent", "Cyberdyne", "Vandelay", "Massive Dynamic", "Wonka"]
+REGIONS = ["Paris, Île-de-France", "Lyon, Auvergne-Rhône-Alpes", "Lille, Hauts-de-France",
+           "Nantes, Pays de la Loire", "Bordeaux, Nouvelle-Aquitaine", "Toulouse, Occitanie",
+           "Marseille, Provence-Alpes-Côte d'Azur", "Strasbourg, Grand Est"]
+
+URL_PREFIX = "https://www.linkedin.com/in/synthetic-"
+_URL_ID = re.compile(r"/in/synthetic-(\d+)")
+
+class Distribution:
+    """Loi de probabilité configurable (latences, degrés) : fixed, uniform, exponential, lognormal, pareto."""
+    def __init__(self, spec: Any = 0.0):
+        if isinstance(spec, (int, float)):
+            spec = {"distribution": "fixed", "value": spec}
+        self.kind = spec.get("distribution", "fixed")
+        self.spec = spec
+        self.minimum = spec.get("min")
+        self.maximum = spec.get("max")
+        if self.kind not in ("fixed", "uniform", "exponential", "lognormal", "pareto"):
+            raise ValueError(f"Loi inconnue : {self.kind}")
+
+    def sample(self, rng: random.Random) -> float:
+        s = self.spec
+        if self.kind == "fixed":
+            value = float(s.get("value", 0.0))
+        elif self.kind == "uniform":
+            value = rng.uniform(s.get("low", 0.0), s.get("high", 1.0))
+        elif self.kind == "exponential":
+            value = rng.expovariate(1.0 / s.get("mean", 1.0))
+        elif self.kind == "lognormal":
+            value = rng.lognormvariate(math.log(s.get("median", 1.0)), s.get("sigma", 0.5))
+        else:
+            # Loi de Pareto : beaucoup de petites valeurs, quelques très grandes (degrés d'un réseau social)
+            value = s.get("scale", 1.0) * rng.paretovariate(s.get("alpha", 2.0))
+        if self.minimum is not None:
+            value = max(self.minimum, value)
+        if self.maximum is not None:
+            value = min(self.maximum, value)
+        return value
+
+class SyntheticGraph:
+    """Graphe social synthétique déterministe, généré paresseusement nœud par nœud.
+
+    Chaque nœud (profil) est dérivé d'un générateur aléatoire propre, initialisé avec (graine, nœud) :
+    le graphe de 100k+ nœuds n'est jamais matérialisé et les mêmes paramètres donnent toujours
+    les mêmes profils et relations. La popularité des cibles est biaisée (`popularity_skew`) pour que
+    certains profils soient suggérés par de nombreux autres, comme sur LinkedIn.
+    """
+    def __init__(self, nodes: int = 1000, seed: int = 42, degree: Any = None,
+                 popularity_skew: float = 2.0, senior_ratio: float = 0.3):
+        self.nodes = max(2, nodes)
+        self.seed = seed
+        self.degree = Distribution(degree or {"distribution": "pareto", "alpha": 2.0, "scale": 5,
+                                              "min": 3, "max": 40})
+        self.popularity_skew = popularity_skew
+        self.senior_ratio = senior_ratio
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SyntheticGraph":
+        cfg = config.get('mock', {}) or {}
+        return cls(nodes=cfg.get('nodes', 1000), seed=cfg.get('seed', 42), degree=cfg.get('degree'),
+                   popularity_skew=cfg.get('popularity_skew', 2.0),
+                   senior_ratio=cfg.get('senior_ratio', 0.3))
+
+    def url(self, node: int) -> str:
+        return f"{URL_PREFIX}{node}"
+
+    def node_of(self, url: str) -> int:
+        """Nœud correspondant à une URL ; une URL étrangère au graphe est rattachée à un nœud stable."""
+        match = _URL_ID.search(url)
+        if match:
+            return int(match.group(1)) % self.nodes
+        return zlib.crc32(url.encode("utf-8")) % self.nodes
+
+    def _rng(self, node: int, salt: int) -> random.Random:
+        return random.Random((self.seed * 1_000_003 + node) * 4 + salt)
+
+    def profile(self, node: int) -> Dict[str, str]:
+        rng = self._rng(node, 0)
+        if rng.random() < self.senior_ratio:
+            titre = f"{rng.choice(SENIOR_ROLES)} {rng.choice(DOMAINS)}"
+        else:
+            titre = f"{rng.choice(OTHER_ROLES)} {rng.choice(DOMAINS)}"
+        return {
+            "nom": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "titre": titre,
+            "societe": rng.choice(COMPANIES),
+            "lieu": rng.choice(REGIONS),
+            "url": self.url(node),
+        }
+
+    def relations(self, node: int) -> List[int]:
+        """Voisins du nœud ("Autres profils consultés"), sans doublon ni le nœud lui-même."""
+        rng = self._rng(node, 1)
+        degree = int(round(self.degree.sample(rng)))
+        neighbours: Dict[int, None] = {}
+        attempts = 0
+        while len(neighbours) < degree and attempts < degree * 4:
+            attempts += 1
+            target = int(self.nodes * rng.random() ** self.popularity_skew)
+            if target != node:
+                neighbours[target] = None
+        return list(neighbours)
+
+    def suggestions(self, node: int) -> List[Dict[str, str]]:
+        result = []
+        for neighbour in self.relations(node):
+            p = self.profile(neighbour)
+            result.append({"nom": p["nom"], "titre": p["titre"], "url": p["url"]})
+        return result
+
+class FaultInjector:
+    """Latences, erreurs et expirations simulées, tirées d'un générateur initialisé (séquence reproductible)."""
+    def __init__(self, profile_latency: Any = 0.1, relations_latency: Any = 0.1, error_rate: float = 0.0,
+                 timeout_rate: float = 0.0, timeout: float = 5.0, seed: int = 42):
+        self.profile_latency = Distribution(profile_latency)
+        self.relations_latency = Distribution(relations_latency)
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FaultInjector":
+        cfg = config.get('mock', {}) or {}
+        return cls(profile_latency=cfg.get('profile_latency', 0.1),
+                   relations_latency=cfg.get('relations_latency', 0.1),
+                   error_rate=cfg.get('error_rate', 0.0), timeout_rate=cfg.get('timeout_rate', 0.0),
+                   timeout=cfg.get('timeout', 5.0), seed=cfg.get('seed', 42))
+
+    def draw(self, latency: Distribution) -> "tuple[float, Optional[str]]":
+        """Retourne (délai, incident) : incident vaut None, "error" ou "timeout"."""
+        roll = self.rng.random()
+        if roll < self.timeout_rate:
+            return self.timeout, "timeout"
+        delay = latency.sample(self.rng)
+        if roll < self.timeout_rate + self.error_rate:
+            return delay, "error"
+        return delay, None
@@ -0,0 +1,170 @@
+"""Microbenchmarks des chemins critiques : workflow, stockage (Excel, SQLite) et tableau principal.
+
+Usage : python -m benchmarks.bench_hotpaths [--sizes 1000 10000 100000] [--output benchmarks/results.json]
+
+Les résultats sont écrits en JSON ; le code de sortie est 1 si un seuil de
+benchmarks/thresholds.json est dépassé (régression de performance ou de complexité).
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, List
+
+from app.core.services import WorkflowManager
+from benchmarks.common import (MemoryRepository, make_population, measure, environment,
+                               check_thresholds, write_results)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BATCH = 1000  # Opérations par mesure pour les benchmarks à coût unitaire
+
+def _loaded_workflow(n: int) -> WorkflowManager:
+    workflow = WorkflowManager(MemoryRepository(make_population(n)))
+    workflow.load_initial_data()
+    return workflow
+
+# --- Workflow ---
+
+def bench_workflow(n: int) -> Dict[str, Dict]:
+    results = {}
+    fresh = make_population(BATCH, seed=7)
+
+    def add(workflow):
+        for p in fresh:
+            workflow.add_person(p.url, nom=p.nom, titre=p.titre)
+    results["workflow.add_person"] = measure(add, BATCH, setup=lambda: _loaded_workflow(n))
+
+    def next_and_mark(workflow):
+        for _ in range(BATCH):
+            p = workflow.get_next_person()
+            if p is None:
+                break
+            workflow.mark_analyzed(p)
+    results["workflow.get_next_person"] = measure(next_and_mark, BATCH, setup=lambda: _loaded_workflow(n))
+
+    workflow = _loaded_workflow(n)
+    results["workflow.has_pending_persons"] = measure(
+        lambda: [workflow.has_pending_persons() for _ in range(10 * BATCH)], 10 * BATCH)
+
+    population = make_population(n)
+    results["workflow.load_initial_data"] = measure(
+        lambda wf: wf.load_initial_data(), n,
+        setup=lambda: WorkflowManager(MemoryRepository(population)))
+    return results
+
+# --- Stockage ---
+
+def bench_excel(n: int, tmp: str) -> Dict[str, Dict]:
+    from app.infra.storage.excel_storage import ExcelRepository
+    results = {}
+    population = make_population(n, analyzed_ratio=1.0, interesting_ratio=1.0)
+    path = os.path.join(tmp, f"bench_{n}.xlsx")
+
+    def save_all(repo):
+        repo.save_all(population)
+        repo.close()
+    results["excel.save_all"] = measure(save_all, n, repeat=1,
+                                        setup=lambda: ExcelRepository(path, journal=True))
+
+    def load_cold(repo):
+        repo.load_existing_persons()
+
+    def cold_repo():
+        if os.path.exists(path + ".snapshot.pkl"):
+            os.remove(path + ".snapshot.pkl")
+        return ExcelRepository(path)
+    results["excel.load_existing_persons.cold"] = measure(load_cold, n, repeat=1, setup=cold_repo)
+    results["excel.load_existing_persons"] = measure(load_cold, n, setup=lambda: ExcelRepository(path))
+
+    updates = make_population(200, seed=11, analyzed_ratio=1.0, interesting_ratio=1.0)
+
+    def save_person(repo):
+        for p in updates:
+            repo.save_person(p)
+
+    def journal_repo():
+        repo = ExcelRepository(path, journal=True, compaction_threshold=10 ** 9, idle_delay=10 ** 9)
+        repo.load_existing_persons()
+        return repo
+    results["excel.save_person"] = measure(save_person, len(updates), setup=journal_repo)
+    return results
+
+def bench_sqlite(n: int, tmp: str) -> Dict[str, Dict]:
+    from app.infra.storage.sqlite_storage import SqliteRepository
+    results = {}
+    population = make_population(n)
+    repo = SqliteRepository(os.path.join(tmp, f"bench_{n}.db"))
+    results["sqlite.save_all"] = measure(lambda: repo.save_all(population), n, repeat=1)
+    results["sqlite.load_existing_persons"] = measure(repo.load_existing_persons, n)
+    updates = make_population(BATCH, seed=13)
+    results["sqlite.save_person"] = measure(lambda: [repo.save_person(p) for p in updates], BATCH)
+    repo.close()
+    return results
+
+# --- IHM ---
+
+def bench_gui(n: int) -> Dict[str, Dict]:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    from app.gui.main_window import MainWindow
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    window = MainWindow(_loaded_workflow(n), None, {})
+    window.show()
+    app.processEvents()
+
+    def refresh():
+        for _ in range(20):
+            window.refresh_table()
+            app.processEvents()
+    result = {"gui.refresh_table": measure(refresh, 20)}
+    window.close()
+    return result
+
+BENCHES: Dict[str, Callable] = {
+    "workflow": lambda n, tmp: bench_workflow(n),
+    "excel": bench_excel,
+    "sqlite": bench_sqlite,
+    "gui": lambda n, tmp: bench_gui(n),
+}
+
+def run(sizes: List[int], groups: List[str]) -> Dict[str, Dict[str, Dict]]:
+    results: Dict[str, Dict[str, Dict]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for group in groups:
+            for n in sizes:
+                try:
+                    measures = BENCHES[group](n, tmp)
+                except ImportError as e:
+                    print(f"{group} ignoré : dépendance manquante ({e.name})")
+                    break
+                for name, result in measures.items():
+                    results.setdefault(name, {})[str(n)] = result
+                    print(f"{name:<40} n={n:<7} {result['us_per_op']:>10.2f} µs/op  ({result['seconds']:.3f} s)")
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks des chemins critiques")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--groups", nargs="+", default=list(BENCHES), choices=list(BENCHES))
+    parser.add_argument("--output", default=os.path.join(HERE, "results.json"))
+    parser.add_argument("--thresholds", default=os.path.join(HERE, "thresholds.json"))
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.groups)
+    with open(args.thresholds, encoding="utf-8") as f:
+        thresholds = json.load(f)
+    failures = check_thresholds(results, thresholds)
+    write_results(args.output, {"environment": environment(), "sizes": args.sizes,
+                                "results": results, "failures": failures})
+    print(f"Résultats écrits dans {args.output}")
+
+    if failures:
+        print("\n!!! REGRESSIONS DE PERFORMANCE !!!", file=sys.stderr)
+        for failure in failures:
+            print(f"  - {failure}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
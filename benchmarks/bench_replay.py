@@ -0,0 +1,147 @@
+"""Benchmark hors ligne du chemin réel navigateur -> parser -> workflow, à partir d'un HAR enregistré.
+
+1. Enregistrer une session : `browser.har.mode: record` dans config.yaml, puis naviguer normalement.
+2. Rejouer : python -m benchmarks.bench_replay data/linkedin.har [--relations] [--limit 200]
+
+Les profils sont chargés par Playwright depuis le HAR (aucun accès réseau) et extraits par
+LinkedInParser ; les durées (chargement, extraction, total) sont écrites en JSON. Avec
+--expected, les champs extraits sont comparés à une référence (régressions du parser).
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import zipfile
+from collections import Counter
+from typing import Dict, List
+
+from app.core.metrics import metrics
+from app.core.profile_cache import canonical_url
+from app.core.services import WorkflowManager
+from benchmarks.common import MemoryRepository, environment, write_results
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROFILE_PATH = re.compile(r"^https://www\.linkedin\.com/in/[^/]+$")
+
+def load_har(path: str) -> Dict:
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            return json.loads(archive.read("har.har"))
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def profile_urls(har: Dict) -> List[str]:
+    """URLs des pages de profil enregistrées (documents HTML), dans l'ordre de visite.
+
+    Les URLs sont gardées telles qu'enregistrées : le rejeu ne sert que les URLs exactes du HAR.
+    La forme canonique sert seulement au dédoublonnage (première variante rencontrée conservée)."""
+    urls: Dict[str, str] = {}
+    for entry in har.get("log", {}).get("entries", []):
+        mime = entry.get("response", {}).get("content", {}).get("mimeType", "")
+        if entry.get("request", {}).get("method") != "GET" or not mime.startswith("text/html"):
+            continue
+        url = entry["request"]["url"]
+        key = canonical_url(url)
+        if PROFILE_PATH.match(key) and key not in urls:
+            urls[key] = url
+    return list(urls.values())
+
+async def replay(har_path: str, urls: List[str], relations: bool) -> Dict:
+    # Import différé : les fonctions pures du module restent importables (et testables) sans Playwright
+    from app.core.browser_service import RealBrowserService
+    service = RealBrowserService(headless=True, pool_size=1, har_mode="replay", har_path=har_path)
+    workflow = WorkflowManager(MemoryRepository())
+    profiles: Dict[str, Dict] = {}
+    missing = Counter()
+    failures = 0
+    suggestions = 0
+
+    await service.start()
+    try:
+        await service.login_manual()
+        for url in urls:
+            try:
+                with metrics.timer("replay.profile_total"):
+                    data = await service.get_profile_data(url)
+            except Exception as e:
+                print(f"Erreur rejeu {url}: {e}")
+                failures += 1
+                continue
+            person = workflow.add_person(url) or workflow.all_persons[url.split("?")[0]]
+            workflow.update_person_info(person, data)
+            missing.update(data.get("missing", []))
+            profiles[canonical_url(url)] = {k: v for k, v in data.items() if k != "missing"}
+
+            if relations:
+                try:
+                    with metrics.timer("replay.relations_total"):
+                        found = await service.get_relations()
+                except Exception as e:
+                    print(f"Erreur rejeu des relations de {url}: {e}")
+                    continue
+                for s in found:
+                    workflow.add_person(s["url"], source_url=url, nom=s["nom"], titre=s["titre"])
+                suggestions += len(found)
+    finally:
+        await service.stop()
+
+    return {"profiles": profiles, "failures": failures, "missing_fields": dict(missing),
+            "suggestions": suggestions, "workflow_size": len(workflow.all_persons)}
+
+def compare(profiles: Dict[str, Dict], expected: Dict[str, Dict]) -> List[str]:
+    """Différences champ par champ avec la référence (profils absents inclus).
+    Les URLs sont comparées sous leur forme canonique."""
+    profiles = {canonical_url(url): data for url, data in profiles.items()}
+    diffs = []
+    for url, reference in expected.items():
+        actual = profiles.get(canonical_url(url))
+        if actual is None:
+            diffs.append(f"{url} : profil non extrait")
+            continue
+        for field, value in reference.items():
+            if actual.get(field) != value:
+                diffs.append(f"{url} [{field}] : {actual.get(field)!r} au lieu de {value!r}")
+    return diffs
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Rejeu hors ligne d'un HAR à travers le parser et le workflow")
+    parser.add_argument("har", help="Fichier HAR enregistré (browser.har.mode: record)")
+    parser.add_argument("--limit", type=int, default=None, help="Nombre maximal de profils rejoués")
+    parser.add_argument("--relations", action="store_true", help="Rejoue aussi les modales de relations")
+    parser.add_argument("--output", default=os.path.join(HERE, "results_replay.json"))
+    parser.add_argument("--expected", help="Référence JSON des profils attendus (comparaison)")
+    parser.add_argument("--save-expected", help="Écrit les profils extraits comme nouvelle référence")
+    args = parser.parse_args(argv)
+
+    urls = profile_urls(load_har(args.har))[:args.limit]
+    print(f"{len(urls)} profils à rejouer depuis {args.har}")
+    outcome = asyncio.run(replay(args.har, urls, args.relations))
+
+    timers = metrics.snapshot()["timers"]
+    for name in ("browser.goto", "parser.profile", "parser.relations", "replay.profile_total"):
+        if name in timers:
+            t = timers[name]
+            print(f"{name:<24} n={t['count']:<5} p50 {t['p50'] * 1000:7.1f} ms  p90 {t['p90'] * 1000:7.1f} ms")
+
+    diffs = []
+    if args.expected:
+        with open(args.expected, encoding="utf-8") as f:
+            diffs = compare(outcome["profiles"], json.load(f))
+    if args.save_expected:
+        write_results(args.save_expected, outcome["profiles"])
+
+    write_results(args.output, {"environment": environment(), "har": args.har, "timers": timers,
+                                **{k: v for k, v in outcome.items() if k != "profiles"},
+                                "regressions": diffs})
+    print(f"Résultats écrits dans {args.output}")
+    if diffs:
+        print("\n!!! REGRESSIONS DU PARSER !!!", file=sys.stderr)
+        for diff in diffs:
+            print(f"  - {diff}", file=sys.stderr)
+        return 1
+    return 1 if outcome["failures"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Outils communs des benchmarks : populations synthétiques, chronométrage, seuils de régression."""
+import json
+import platform
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.models import Personne
+from app.core.repository import PersonRepository
+
+FIRST_NAMES = ["Jean", "Marie", "Pierre", "Sophie", "Luc", "Camille", "Hélène", "Thomas", "Inès", "Karim"]
+LAST_NAMES = ["Dupont", "Martin", "Bernard", "Dubois", "Lefèvre", "Moreau", "Girard", "Roux", "Faure", "Blanc"]
+TITLES = ["Directeur des Systèmes d'Information", "CTO", "Développeur Python", "Head of Data",
+          "Responsable Achats", "Chef de projet", "Consultant", "VP Engineering", "Lead Developer",
+          "Ingénieur DevOps", "Product Manager", "Data Scientist"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+REGIONS = ["Paris, France", "Lyon, France", "Lille, France", "Nantes, France", "Bordeaux, France"]
+
+def make_population(n: int, seed: int = 42, interesting_ratio: float = 0.2,
+                    analyzed_ratio: float = 0.5) -> List[Personne]:
+    """Génère n personnes déterministes (URLs uniques), une partie déjà analysée / intéressante."""
+    rng = random.Random(seed)
+    persons = []
+    for i in range(n):
+        analyzed = rng.random() < analyzed_ratio
+        persons.append(Personne(
+            url=f"https://www.linkedin.com/in/bench-{seed}-{i}",
+            nom=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            titre=rng.choice(TITLES),
+            societe=rng.choice(COMPANIES),
+            lieu=rng.choice(REGIONS),
+            source_url=f"https://www.linkedin.com/in/bench-{seed}-{rng.randrange(max(1, i))}" if i else None,
+            analyzed=analyzed,
+            interesting=analyzed and rng.random() < interesting_ratio / analyzed_ratio,
+        ))
+    return persons
+
+class MemoryRepository(PersonRepository):
+    """Repository en mémoire : isole le coût du workflow de celui du stockage."""
+    def __init__(self, persons: Optional[List[Personne]] = None):
+        self.persons = {p.url: p for p in persons or []}
+
+    def load_existing_persons(self) -> List[Personne]:
+        return list(self.persons.values())
+
+    def save_person(self, person: Personne) -> None:
+        self.persons[person.url] = person
+
+    def remove_person(self, person: Personne) -> None:
+        self.persons.pop(person.url, None)
+
+    def exists(self) -> bool:
+        return True
+
+    def save_all(self, persons: List[Personne]) -> None:
+        self.persons = {p.url: p for p in persons}
+
+def measure(func: Callable[[], Any], ops: int, repeat: int = 3,
+            setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """Chronomètre `func` (qui exécute `ops` opérations) ; garde le meilleur de `repeat` essais.
+    `setup`, appelé avant chaque essai hors chronométrage, retourne l'argument passé à `func`."""
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        best = min(best, time.perf_counter() - start)
+    return {"ops": ops, "seconds": best, "us_per_op": best / max(1, ops) * 1e6}
+
+def environment() -> Dict[str, str]:
+    return {"python": sys.version.split()[0], "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+def check_thresholds(results: Dict[str, Dict[str, Dict[str, float]]],
+                     thresholds: Dict[str, Any]) -> List[str]:
+    """Compare les résultats ({bench: {taille: mesure}}) aux seuils ; retourne les violations.
+
+    - `max_us_per_op` : coût maximal par opération, quelle que soit la taille ;
+    - `max_scaling` : rapport maximal entre le coût par opération à la plus grande et à la plus
+      petite taille (un coût par opération O(n) fait exploser ce rapport : x100 de 1k à 100k).
+    """
+    failures = []
+    default_scaling = thresholds.get("default_max_scaling")
+    for bench, by_size in results.items():
+        if not by_size:
+            continue
+        limit = thresholds.get("max_us_per_op", {}).get(bench)
+        for size, result in by_size.items():
+            if limit is not None and result["us_per_op"] > limit:
+                failures.append(f"{bench} [{size}] : {result['us_per_op']:.1f} µs/op > {limit} µs/op")
+        scaling = thresholds.get("max_scaling", {}).get(bench, default_scaling)
+        sizes = sorted(by_size, key=int)
+        if scaling is not None and len(sizes) > 1:
+            smallest, largest = by_size[sizes[0]]["us_per_op"], by_size[sizes[-1]]["us_per_op"]
+            ratio = largest / smallest if smallest > 0 else 0.0
+            if ratio > scaling:
+                failures.append(f"{bench} : coût par opération x{ratio:.1f} entre {sizes[0]} et {sizes[-1]} "
+                                f"(> x{scaling}, complexité dégradée ?)")
+    return failures
+
+def write_results(path: str, payload: Dict[str, Any]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,185 @@
+"""Exploration automatique sans IHM.
+
+    python crawl.py https://www.linkedin.com/in/quelquun [autres URLs...] [--max-persons 500] [--max-depth 2]
+
+Sans URL, les URLs de départ viennent de `crawl.seeds`. Le crawl reprend depuis `crawl.checkpoint_path`
+s'il existe (--restart pour repartir de zéro). Ctrl+C arrête proprement : la reprise repart du dernier
+profil terminé.
+
+Avec --workers N (N > 1), N processus, chacun avec son navigateur, se partagent une file SQLite
+(`crawl.queue_path`) ; le processus principal reporte leurs résultats dans le stockage. Le débit de
+navigation `delays` est réparti entre les workers (un seul compte LinkedIn) : le total ne change pas.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import time
+import yaml
+
+from app.bootstrap import build_storage, build_browser_service
+from app.core.crawler import BatchCrawler, QueueWorker, prime_queue, report_results
+from app.core.frontier import HopDistanceScorer, build_scorers
+from app.core.matcher import KeywordMatcher
+from app.core.metrics import metrics
+from app.core.repository import PersonRepository
+from app.core.services import WorkflowManager
+from app.core.work_queue import WorkItem
+from app.infra.storage.sqlite_storage import SqliteRepository
+from app.infra.storage.work_queue import SqliteWorkQueue
+
+def build_crawl_scorers(config, strategy: str):
+    """"bfs" : distance au départ seule (à distance égale, ordre de découverte) ; "priority" : scheduler.weights."""
+    if strategy == "bfs":
+        return [(HopDistanceScorer(), 1.0)]
+    return build_scorers(config)
+
+async def run_crawl(config, repo: PersonRepository, args) -> None:
+    crawl_cfg = config.get('crawl', {}) or {}
+    workflow = WorkflowManager(repo, scorers=build_crawl_scorers(config, args.strategy or crawl_cfg.get('strategy', 'bfs')))
+    workflow.load_initial_data()
+
+    browser = build_browser_service(config, headless=crawl_cfg.get('headless', config['settings']['headless']),
+                                    defer_navigation=True)
+    crawler = BatchCrawler(workflow, browser, KeywordMatcher.from_config(config),
+                           max_persons=args.max_persons or config['settings'].get('max_persons', 100),
+                           max_depth=args.max_depth if args.max_depth is not None else crawl_cfg.get('max_depth'),
+                           checkpoint_path=crawl_cfg.get('checkpoint_path', 'data/crawl_checkpoint.json'),
+                           checkpoint_every=crawl_cfg.get('checkpoint_every', 10),
+                           retries=crawl_cfg.get('retries', 1))
+    if args.restart and os.path.exists(crawler.checkpoint_path):
+        os.remove(crawler.checkpoint_path)
+    crawler.resume()
+    crawler.add_seeds(args.seeds or crawl_cfg.get('seeds', []) or [])
+
+    await browser.start()
+    try:
+        await browser.login_manual()
+        stats = await crawler.run()
+        print(f"Crawl terminé : {stats.visited} profils visités, {stats.interesting} intéressants, "
+              f"{stats.failures} échecs, {stats.discovered} nouvelles URLs ({stats.rate_per_hour():.0f} profils/h)")
+    finally:
+        await browser.stop()
+
+def open_queue(config) -> SqliteWorkQueue:
+    crawl_cfg = config.get('crawl', {}) or {}
+    return SqliteWorkQueue(crawl_cfg.get('queue_path', 'data/crawl_queue.db'),
+                           lease_timeout=crawl_cfg.get('lease_timeout', 120))
+
+async def run_worker_async(config, worker: str, workers: int, max_persons: int, max_depth, strategy: str) -> None:
+    crawl_cfg = config.get('crawl', {}) or {}
+    # "bfs" : distance au départ seule ; "priority" : poids mots-clés et distance de scheduler.weights
+    weights = {'hops': 1.0}
+    if strategy == "priority":
+        weights = config.get('scheduler', {}).get('weights', {}) or {}
+    queue = open_queue(config)
+    browser = build_browser_service(config, headless=crawl_cfg.get('headless', config['settings']['headless']),
+                                    workers=workers, defer_navigation=True)
+    crawler = QueueWorker(queue, browser, KeywordMatcher.from_config(config), worker,
+                          max_persons=max_persons, max_depth=max_depth,
+                          keyword_weight=weights.get('keywords', 0.0), hop_weight=weights.get('hops', 0.0),
+                          retries=crawl_cfg.get('retries', 1))
+    await browser.start()
+    try:
+        await browser.login_manual()
+        stats = await crawler.run()
+        print(f"[{worker}] terminé : {stats.visited} profils, {stats.failures} échecs "
+              f"({stats.rate_per_hour():.0f} profils/h)")
+    finally:
+        await browser.stop()
+        queue.close()
+
+def run_worker(config, worker: str, workers: int, max_persons: int, max_depth, strategy: str) -> None:
+    """Point d'entrée d'un processus worker (navigateur et connexion SQLite propres)."""
+    try:
+        asyncio.run(run_worker_async(config, worker, workers, max_persons, max_depth, strategy))
+    except KeyboardInterrupt:
+        pass
+
+def run_workers(config, repo: PersonRepository, args, workers: int) -> None:
+    """Lance les workers et reporte leurs résultats dans le stockage au fil de l'eau."""
+    crawl_cfg = config.get('crawl', {}) or {}
+    queue = open_queue(config)
+    if args.restart:
+        queue.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(queue.db_path + suffix):
+                os.remove(queue.db_path + suffix)
+        queue = open_queue(config)
+
+    workflow = WorkflowManager(repo)
+    workflow.load_initial_data()
+    # Avant les URLs de départ : les profils déjà analysés ne sont ni revisités ni requalifiés
+    index = prime_queue(queue, workflow)
+    queue.add(WorkItem(url) for url in args.seeds or crawl_cfg.get('seeds', []) or [])
+    max_persons = args.max_persons or config['settings'].get('max_persons', 100)
+    max_depth = args.max_depth if args.max_depth is not None else crawl_cfg.get('max_depth')
+    strategy = args.strategy or crawl_cfg.get('strategy', 'bfs')
+
+    # spawn : pas d'état hérité (boucle asyncio, connexions SQLite) dans les processus Playwright
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=run_worker, name=f"worker-{i}",
+                                 args=(config, f"worker-{i}", workers, max_persons, max_depth, strategy))
+                 for i in range(1, workers + 1)]
+    started = time.monotonic()
+    for process in processes:
+        process.start()
+    try:
+        while any(p.is_alive() for p in processes):
+            time.sleep(1.0)
+            report_results(queue, workflow, index)
+    finally:
+        for process in processes:
+            process.join()
+        report_results(queue, workflow, index)
+        counts = queue.stats()
+        elapsed = time.monotonic() - started
+        print(f"Crawl terminé ({workers} workers) : {counts['done']} profils, {counts['failed']} échecs, "
+              f"{counts['pending']} en attente ({counts['done'] * 3600 / elapsed:.0f} profils/h)")
+        queue.close()
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Exploration automatique des relations LinkedIn, sans IHM")
+    parser.add_argument("seeds", nargs="*", help="URLs de profils de départ (défaut : crawl.seeds)")
+    parser.add_argument("--max-persons", type=int, help="Profils à visiter (défaut : settings.max_persons)")
+    parser.add_argument("--max-depth", type=int, help="Sauts maximaux depuis le départ (défaut : crawl.max_depth)")
+    parser.add_argument("--strategy", choices=["bfs", "priority"], help="Ordre d'exploration (défaut : crawl.strategy)")
+    parser.add_argument("--restart", action="store_true", help="Ignore le point de reprise existant")
+    parser.add_argument("--workers", type=int, help="Processus crawler en parallèle (défaut : crawl.workers) ; "
+                             "le débit `delays` est partagé entre eux, pas multiplié")
+    parser.add_argument("--config", default="config.yaml")
+    args = parser.parse_args(argv)
+
+    with open(args.config, "r") as f:
+        config = yaml.safe_load(f)
+    metrics_cfg = config.get('metrics', {})
+    metrics.enabled = metrics_cfg.get('enabled', True)
+
+    # Pas de thread d'écriture ici : les décisions sont persistées au fil de l'eau, sans IHM à préserver
+    storage = build_storage(config)
+    workers = args.workers or (config.get('crawl', {}) or {}).get('workers', 1)
+    try:
+        if workers > 1:
+            run_workers(config, storage, args, workers)
+        else:
+            asyncio.run(run_crawl(config, storage, args))
+    except KeyboardInterrupt:
+        print("Crawl interrompu : reprise possible depuis le point de reprise.")
+    except Exception as e:
+        print(f"Le crawl s'est arrêté : {e}")
+        return 1
+    finally:
+        try:
+            storage.flush()
+            if isinstance(storage, SqliteRepository):
+                storage.export_excel(config['settings']['export_path'])
+        except Exception as e:
+            print(f"Erreur lors de l'écriture des données en attente : {e}")
+        storage.close()
+        if metrics.enabled and metrics_cfg.get('dump_path'):
+            metrics.dump(metrics_cfg['dump_path'])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
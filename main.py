@@ -4,44 +4,53 @@ import yaml
 import qasync
 from PyQt6.QtWidgets import QApplication
 
-from app.core.browser_service import RealBrowserService, MockBrowserService
+from app.core.browser_service import ScheduledBrowserService
 from app.gui.main_window import MainWindow
 
+from app.bootstrap import build_storage, build_browser_service
 from app.core.services import WorkflowManager
-from app.infra.storage.excel_storage import ExcelRepository
+from app.core.frontier import build_scorers
+from app.core.prefetch import ProfilePrefetcher
+from app.core.metrics import metrics
+from app.core.repository import PersonRepository
+from app.infra.storage.sqlite_storage import SqliteRepository
+from app.infra.storage.background_repository import BackgroundRepository
 
-async def run_app():
+async def run_app(config, repo: PersonRepository):
     """
-    Initialise la configuration, le repository, le workflow et l'IHM.
+    Initialise le workflow et l'IHM à partir de la configuration et du repository.
     """
-    # Chargement config
-    with open("config.yaml", "r") as f:
-        config = yaml.safe_load(f)
-
-    # Initialisation de la couche Persistence & Métier
-    excel_path = config['settings']['export_path']
-    repo = ExcelRepository(excel_path)
-    workflow = WorkflowManager(repo)
+    # Initialisation de la couche Métier (priorisation de la file selon scheduler.weights)
+    workflow = WorkflowManager(repo, scorers=build_scorers(config))
     
-    # Chargement des données existantes (Liste "Analysé intéressante")
+    # Chargement des données existantes (session précédente ou liste "Analysé intéressante")
     workflow.load_initial_data()
 
     # Initialisation technique (Browser Service)
-    if config['settings'].get('mock', False):
-        print("Démarrage en mode MOCK")
-        browser_service = MockBrowserService()
-    else:
-        print("Démarrage en mode PLAYWRIGHT")
-        browser_service = RealBrowserService(headless=config['settings']['headless'])
+    browser_service = build_browser_service(config)
+
+    # Clics rapides : seul le dernier profil demandé est chargé sur la page visible
+    browser_service = ScheduledBrowserService(browser_service)
 
-    await browser_service.start()
+    with metrics.timer("app.browser_start"):
+        await browser_service.start()
     
     try:
         # Connexion (manuelle ou mock)
-        await browser_service.login_manual()
+        with metrics.timer("app.login_wait"):
+            await browser_service.login_manual()
+
+        # Préchargement des prochains profils de la file pendant l'analyse de la personne courante
+        prefetcher = None
+        prefetch_cfg = config.get('prefetch', {})
+        if prefetch_cfg.get('enabled', False):
+            prefetcher = ProfilePrefetcher(workflow, browser_service,
+                                           depth=prefetch_cfg.get('depth', 3),
+                                           concurrency=prefetch_cfg.get('concurrency', 2))
+            prefetcher.reschedule()
 
         # Initialisation IHM
-        window = MainWindow(workflow, browser_service, config)
+        window = MainWindow(workflow, browser_service, config, prefetcher=prefetcher)
         
         # Si le navigateur est fermé, on ferme l'application (la fenêtre principale)
         browser_service.set_on_close_callback(window.close)
@@ -62,12 +71,29 @@ if __name__ == "__main__":
         asyncio.set_event_loop(loop)
         
         window = None
+
+        # Chargement config
+        with open("config.yaml", "r") as f:
+            config = yaml.safe_load(f)
+
+        metrics_cfg = config.get('metrics', {})
+        metrics.enabled = metrics_cfg.get('enabled', True)
+        if metrics.enabled and metrics_cfg.get('prometheus_port'):
+            metrics.serve(int(metrics_cfg['prometheus_port']))
+
+        # Initialisation de la couche Persistence
+        storage = build_storage(config)
+        repo = storage
+        if config.get('storage', {}).get('background_writer', False):
+            # Les écritures partent sur un thread dédié : l'IHM ne bloque plus sur pandas/openpyxl
+            repo = BackgroundRepository(storage)
         
         with loop:
             try:
                 # On lance l'initialisation asynchrone (attente de start browser, login...)
                 # On récupère la fenêtre pour éviter qu'elle soit garbage collected
-                window = loop.run_until_complete(run_app())
+                with metrics.timer("app.startup"):
+                    window = loop.run_until_complete(run_app(config, repo))
                 
                 # Une fois l'init terminée, on lance la boucle d'événements Qt infinie
                 loop.run_forever()
@@ -75,12 +101,29 @@ if __name__ == "__main__":
                 print(f"L'application s'est arrêtée : {e}")
             finally:
                 # Nettoyage propre à la sortie, même en cas d'erreur
+                if window and window.prefetcher:
+                    window.prefetcher.stop()
                 if window and window.browser:
                      print("Arrêt du navigateur lié à la fermeture de l'application...")
                      try:
                         loop.run_until_complete(window.browser.stop())
                      except Exception:
                          pass
+
+                # Barrière : on attend que les écritures en file soient appliquées, puis
+                # reconstruction du fichier Excel à partir du journal des mutations
+                try:
+                    loop.run_until_complete(repo.flush_async())
+                    if isinstance(storage, SqliteRepository):
+                        # Export Excel des profils intéressants à partir de la base
+                        storage.export_excel(config['settings']['export_path'])
+                except Exception as e:
+                    print(f"Erreur lors de l'écriture des données en attente : {e}")
+                repo.close()
+
+                if metrics.enabled and metrics_cfg.get('dump_path'):
+                    metrics.dump(metrics_cfg['dump_path'])
+                metrics.close()
                 
                 # S'assurer que toutes les tâches asynchrones sont terminées
                 # Cela évite "Task was destroyed but it is pending"
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import unittest
+from app.core.models import Personne
+from app.core.repository import PersonRepository
+from app.infra.storage.background_repository import BackgroundRepository
+
+class RecordingRepository(PersonRepository):
+    """Repository en mémoire qui trace les appels et peut être bloqué pour simuler une écriture lente."""
+    def __init__(self):
+        self.saved_persons = {}
+        self.calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.closed = False
+
+    def load_existing_persons(self):
+        return list(self.saved_persons.values())
+
+    def save_person(self, person):
+        self.gate.wait()
+        self.calls.append(("save", person.url, person.nom))
+        self.saved_persons[person.url] = person
+
+    def remove_person(self, person):
+        self.gate.wait()
+        self.calls.append(("remove", person.url))
+        self.saved_persons.pop(person.url, None)
+
+    def exists(self):
+        return True
+
+    def save_all(self, persons):
+        self.gate.wait()
+        self.calls.append(("save_all", len(persons)))
+        self.saved_persons = {p.url: p for p in persons if p.interesting}
+
+    def close(self):
+        self.closed = True
+
+class TestBackgroundRepository(unittest.TestCase):
+    def setUp(self):
+        self.inner = RecordingRepository()
+        self.repo = BackgroundRepository(self.inner)
+
+    def tearDown(self):
+        self.inner.gate.set()
+        self.repo.close()
+
+    def test_writes_are_coalesced_per_url(self):
+        # Le thread écrivain est occupé : les écritures suivantes s'accumulent
+        self.inner.gate.clear()
+        self.repo.save_person(Personne(url="busy", interesting=True))
+
+        p = Personne(url="u1", nom="v1", interesting=True)
+        self.repo.save_person(p)
+        p.nom = "v2"
+        self.repo.save_person(p)
+        p.nom = "v3"
+        self.repo.save_person(p)
+
+        self.inner.gate.set()
+        self.repo.flush()
+        self.assertEqual(self.inner.calls, [("save", "busy", None), ("save", "u1", "v3")])
+
+    def test_write_snapshot_is_isolated_from_later_mutations(self):
+        self.inner.gate.clear()
+        p = Personne(url="u1", nom="avant", interesting=True)
+        self.repo.save_person(p)
+        p.nom = "après"
+        self.inner.gate.set()
+        self.repo.flush()
+        self.assertEqual(self.inner.saved_persons["u1"].nom, "avant")
+
+    def test_write_after_save_all_is_applied_last(self):
+        self.inner.gate.clear()
+        self.repo.save_person(Personne(url="busy", interesting=True))
+        p = Personne(url="u1", nom="v1", interesting=True)
+        self.repo.save_person(p)
+        self.repo.save_all([Personne(url="u1", nom="v1", interesting=True)])
+        p.nom = "v2"
+        self.repo.save_person(p)
+
+        self.inner.gate.set()
+        self.repo.flush()
+        self.assertEqual(self.inner.calls[-2:], [("save_all", 1), ("save", "u1", "v2")])
+        self.assertEqual(self.inner.saved_persons["u1"].nom, "v2")
+
+    def test_async_api_awaits_completion(self):
+        p = Personne(url="u1", interesting=True)
+
+        async def scenario():
+            await self.repo.save_person_async(p)
+            self.assertIn("u1", self.inner.saved_persons)
+            await self.repo.remove_person_async(p)
+            await self.repo.flush_async()
+
+        asyncio.run(scenario())
+        self.assertNotIn("u1", self.inner.saved_persons)
+
+    def test_close_drains_queue(self):
+        self.inner.gate.clear()
+        self.repo.save_person(Personne(url="u1", interesting=True))
+        self.inner.gate.set()
+        self.repo.close()
+        self.assertIn("u1", self.inner.saved_persons)
+        self.assertTrue(self.inner.closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from benchmarks.bench_replay import compare, profile_urls
+
+def entry(url, method="GET", mime="text/html; charset=utf-8"):
+    return {"request": {"method": method, "url": url},
+            "response": {"content": {"mimeType": mime}}}
+
+HAR = {"log": {"entries": [
+    entry("https://www.linkedin.com/in/Jean-Dupont/"),
+    entry("https://www.linkedin.com/in/jean-dupont?trk=pymk"),          # Même profil, autre variante
+    entry("https://www.linkedin.com/in/marie/?miniProfileUrn=abc"),
+    entry("https://www.linkedin.com/in/marie/details/experience/"),     # Sous-page, pas un profil
+    entry("https://www.linkedin.com/company/acme/"),
+    entry("https://www.linkedin.com/in/paul/", mime="application/json"),
+    entry("https://www.linkedin.com/in/luc/", method="POST"),
+]}}
+
+class TestBenchReplay(unittest.TestCase):
+    def test_profile_urls_keep_recorded_form(self):
+        # Le rejeu ne sert que les URLs exactes du HAR : la forme canonique ne sert qu'au dédoublonnage
+        self.assertEqual(profile_urls(HAR), ["https://www.linkedin.com/in/Jean-Dupont/",
+                                             "https://www.linkedin.com/in/marie/?miniProfileUrn=abc"])
+
+    def test_profile_urls_empty_har(self):
+        self.assertEqual(profile_urls({}), [])
+
+    def test_compare(self):
+        expected = {"https://www.linkedin.com/in/jean-dupont": {"nom": "Jean Dupont", "titre": "CTO"},
+                    "https://www.linkedin.com/in/marie": {"nom": "Marie Martin"}}
+        profiles = {"https://www.linkedin.com/in/jean-dupont": {"nom": "Jean Dupont", "titre": "CTO",
+                                                                "url": "https://www.linkedin.com/in/Jean-Dupont/"}}
+        self.assertEqual(compare(profiles, expected), ["https://www.linkedin.com/in/marie : profil non extrait"])
+
+        profiles["https://www.linkedin.com/in/Marie/"] = {"nom": "Marie"}
+        self.assertEqual(compare(profiles, expected),
+                         ["https://www.linkedin.com/in/marie [nom] : 'Marie' au lieu de 'Marie Martin'"])
+
+        profiles["https://www.linkedin.com/in/Marie/"]["nom"] = "Marie Martin"
+        self.assertEqual(compare(profiles, expected), [])
+
+if __name__ == "__main__":
+    unittest.main()
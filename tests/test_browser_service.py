@@ -0,0 +1,76 @@
+import unittest
+from app.core.metrics import metrics
+from app.core.profile_cache import ProfileCache
+
+try:
+    from app.core.browser_service import CachingBrowserService
+except ImportError:  # Playwright non installé
+    CachingBrowserService = None
+
+class DictCache(ProfileCache):
+    def __init__(self, profiles=None):
+        self.profiles = dict(profiles or {})
+
+    def get(self, url):
+        return self.profiles.get(url)
+
+    def put(self, url, data):
+        self.profiles[url] = data
+
+class RecordingBrowser:
+    """Service navigateur factice : journalise les navigations de la page visible."""
+    def __init__(self):
+        self.calls = []
+
+    async def get_profile_data(self, url):
+        self.calls.append(("get_profile_data", url))
+        return {"nom": url.upper(), "url": url}
+
+    async def open_profile(self, url):
+        self.calls.append(("open_profile", url))
+
+    async def get_relations(self):
+        self.calls.append(("get_relations", None))
+        return []
+
+CACHED = {"nom": "Jean Dupont", "url": "a"}
+
+@unittest.skipIf(CachingBrowserService is None, "playwright non installé")
+class TestCachingBrowserService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.inner = RecordingBrowser()
+        self.counters = dict(metrics.snapshot()["counters"])
+
+    def counted(self, name):
+        return metrics.snapshot()["counters"].get(name, 0) - self.counters.get(name, 0)
+
+    async def test_hit_opens_visible_page(self):
+        service = CachingBrowserService(self.inner, DictCache({"a": CACHED}))
+        self.assertEqual(await service.get_profile_data("a"), CACHED)
+        # La page visible suit la personne sélectionnée, sans nouvelle extraction
+        self.assertEqual(self.inner.calls, [("open_profile", "a")])
+        await service.get_relations()
+        self.assertEqual(self.inner.calls, [("open_profile", "a"), ("get_relations", None)])
+
+    async def test_deferred_navigation_until_relations(self):
+        service = CachingBrowserService(self.inner, DictCache({"a": CACHED}), defer_navigation=True)
+        self.assertEqual(await service.get_profile_data("a"), CACHED)
+        self.assertEqual(await service.get_profile_data("b"), {"nom": "B", "url": "b"})
+        self.assertEqual(await service.get_profile_data("a"), CACHED)
+        self.assertEqual(self.inner.calls, [("get_profile_data", "b")])
+        # Relations demandées : la page rattrape le dernier profil servi par le cache, une seule fois
+        await service.get_relations()
+        await service.get_relations()
+        self.assertEqual(self.inner.calls, [("get_profile_data", "b"), ("open_profile", "a"),
+                                            ("get_relations", None), ("get_relations", None)])
+        self.assertEqual((self.counted("cache.hits"), self.counted("cache.misses")), (2, 1))
+
+    async def test_navigation_cancels_deferred_profile(self):
+        service = CachingBrowserService(self.inner, DictCache({"a": CACHED}), defer_navigation=True)
+        await service.get_profile_data("a")
+        await service.open_profile("c")
+        await service.get_relations()
+        self.assertEqual(self.inner.calls, [("open_profile", "c"), ("get_relations", None)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from app.core.crawler import BatchCrawler
+from app.core.frontier import HopDistanceScorer
+from app.core.matcher import KeywordMatcher
+from app.core.services import WorkflowManager
+from app.scraper.synthetic_graph import SyntheticGraph
+from tests.test_workflow import MockRepository
+
+class GraphBrowser:
+    """Navigateur factice parcourant le graphe synthétique (page courante = dernier profil chargé)."""
+    def __init__(self, graph, broken=()):
+        self.graph = graph
+        self.broken = set(broken)
+        self.current = None
+        self.calls = []
+
+    async def get_profile_data(self, url):
+        self.calls.append(url)
+        await asyncio.sleep(0)
+        if url in self.broken:
+            raise RuntimeError("page introuvable")
+        self.current = self.graph.node_of(url)
+        return self.graph.profile(self.current)
+
+    async def get_relations(self):
+        return self.graph.suggestions(self.current)
+
+class TestBatchCrawler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.graph = SyntheticGraph(nodes=5000, seed=3)
+        self.matcher = KeywordMatcher(["Directeur", "Head of", "CTO", "Manager"])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.tmp.name, "crawl.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_crawler(self, repo, max_persons, checkpoint=None, **kwargs):
+        workflow = WorkflowManager(repo, scorers=[(HopDistanceScorer(), 1.0)])
+        workflow.load_initial_data()
+        crawler = BatchCrawler(workflow, GraphBrowser(self.graph, kwargs.pop("broken", ())), self.matcher,
+                               max_persons=max_persons, checkpoint_path=checkpoint, **kwargs)
+        crawler.resume()
+        crawler.add_seeds([self.graph.url(1)])
+        return crawler
+
+    async def test_breadth_first_and_streamed_qualification(self):
+        repo = MockRepository()
+        crawler = self.make_crawler(repo, 30)
+        stats = await crawler.run()
+
+        self.assertEqual(stats.visited, 30)
+        visited = crawler.browser.calls
+        hops = [crawler.workflow.hops[url] for url in visited]
+        self.assertEqual(hops, sorted(hops))
+        interesting = {url for url in visited if self.matcher.matches(self.graph.profile(self.graph.node_of(url))["titre"])}
+        self.assertTrue(interesting)
+        self.assertEqual(set(repo.saved_persons), interesting)
+        self.assertEqual(crawler.workflow.counters.analyzed, 30)
+
+    async def test_max_depth(self):
+        crawler = self.make_crawler(MockRepository(), 100, max_depth=1)
+        await crawler.run()
+        self.assertTrue(all(crawler.workflow.hops[url] <= 1 for url in crawler.browser.calls))
+        self.assertFalse(crawler.workflow.has_pending_persons())
+
+    async def test_resume_matches_uninterrupted_run(self):
+        reference = self.make_crawler(MockRepository(), 25)
+        await reference.run()
+
+        repo = MockRepository()
+        first = self.make_crawler(repo, 10, self.checkpoint, checkpoint_every=3)
+        await first.run()
+        second = self.make_crawler(repo, 25, self.checkpoint)
+        self.assertEqual(second.stats.visited, 10)
+        await second.run()
+
+        self.assertEqual(first.browser.calls + second.browser.calls, reference.browser.calls)
+        self.assertEqual(second._decisions, reference._decisions)
+
+    async def test_failed_profile_is_retried_then_skipped(self):
+        seed = self.graph.url(1)
+        crawler = self.make_crawler(MockRepository(), 1, retries=2, broken={seed})
+        stats = await crawler.run()
+        self.assertEqual(crawler.browser.calls, [seed] * 3)
+        self.assertEqual(stats.failures, 1)
+        self.assertTrue(crawler.workflow.all_persons[seed].analyzed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,183 @@
+import json
+import os
+import pickle
+import tempfile
+import time
+import unittest
+from unittest import mock
+from app.core.models import Personne
+
+try:
+    from app.infra.storage.excel_storage import ExcelRepository
+except ImportError:  # pandas / openpyxl non installés
+    ExcelRepository = None
+
+def person(i: int, titre: str = "CTO") -> Personne:
+    return Personne(url=f"https://www.linkedin.com/in/p{i}", nom=f"P{i}", titre=titre,
+                    analyzed=True, interesting=True)
+
+def wait_until(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+@unittest.skipIf(ExcelRepository is None, "pandas non installé")
+class TestExcelJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "export.xlsx")
+        self.repos = []
+
+    def tearDown(self):
+        for repo in self.repos:
+            repo.close()
+        self.tmp.cleanup()
+
+    def open(self, **kwargs) -> "ExcelRepository":
+        options = {"journal": True, "compaction_threshold": 1000, "idle_delay": 3600}
+        options.update(kwargs)
+        repo = ExcelRepository(self.path, **options)
+        self.repos.append(repo)
+        return repo
+
+    def workbook_urls(self):
+        return sorted(p.url for p in ExcelRepository(self.path).load_existing_persons())
+
+    def journal_lines(self, repo):
+        if not os.path.exists(repo.journal_path):
+            return []
+        with open(repo.journal_path, encoding="utf-8") as f:
+            return f.readlines()
+
+    def test_noop_write_is_not_journaled(self):
+        repo = self.open()
+        repo.save_person(person(1))
+        repo.save_person(person(1))
+        repo.remove_person(person(2))   # Absente : rien à supprimer
+        self.assertEqual(len(self.journal_lines(repo)), 1)
+        repo.save_person(person(1, titre="CIO"))
+        self.assertEqual(len(self.journal_lines(repo)), 2)
+
+    def test_compaction_at_threshold(self):
+        repo = self.open(compaction_threshold=3)
+        for i in range(3):
+            repo.save_person(person(i))
+        self.assertTrue(wait_until(lambda: not os.path.exists(repo.journal_path)
+                                   and not os.path.exists(repo.compacting_path)))
+        self.assertEqual(self.workbook_urls(), [person(i).url for i in range(3)])
+
+    def test_compaction_when_idle(self):
+        repo = self.open(idle_delay=0.1)
+        repo.save_person(person(1))
+        self.assertTrue(wait_until(lambda: not os.path.exists(repo.journal_path)
+                                   and not os.path.exists(repo.compacting_path)))
+        self.assertEqual(self.workbook_urls(), [person(1).url])
+
+    def test_failed_rotation_backs_off(self):
+        repo = self.open(compaction_threshold=1, idle_delay=0.5)
+        rotate = repo._rotate_journal
+        with mock.patch.object(repo, "_rotate_journal", side_effect=OSError("disque plein")) as failing, \
+                mock.patch("builtins.print"):
+            repo.save_person(person(1))
+            self.assertTrue(wait_until(lambda: failing.call_count >= 1))
+            time.sleep(0.2)
+            # Seuil toujours atteint, mais pas de nouvel essai avant `idle_delay`
+            self.assertEqual(failing.call_count, 1)
+            failing.side_effect = rotate
+            self.assertTrue(wait_until(lambda: not os.path.exists(repo.journal_path)
+                                       and not os.path.exists(repo.compacting_path)))
+        self.assertEqual(failing.call_count, 2)
+        self.assertEqual(self.workbook_urls(), [person(1).url])
+
+    def test_replay_after_crash(self):
+        self.open().save_all([person(1), person(2)])
+        # Arrêt brutal pendant une compaction, puis pendant l'écriture d'une ligne du journal
+        with open(self.path + ".journal.compacting.jsonl", "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "save", "row": ExcelRepository._to_row(person(3))}) + "\n")
+            f.write(json.dumps({"op": "remove", "url": person(1).url}) + "\n")
+        with open(self.path + ".journal.jsonl", "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "save", "row": ExcelRepository._to_row(person(4))}) + "\n")
+            f.write('{"op": "save", "row": {"Nom": "tron')
+
+        repo = self.open()
+        self.assertEqual(sorted(p.url for p in repo.load_existing_persons()),
+                         [person(i).url for i in (2, 3, 4)])
+        repo.close()
+        self.assertFalse(os.path.exists(repo.journal_path))
+        self.assertFalse(os.path.exists(repo.compacting_path))
+        self.assertEqual(self.workbook_urls(), [person(i).url for i in (2, 3, 4)])
+
+    def test_close_compacts(self):
+        repo = self.open()
+        repo.save_person(person(1))
+        self.assertEqual(self.workbook_urls(), [])
+        repo.close()
+        self.assertFalse(os.path.exists(repo.journal_path))
+        self.assertEqual(self.workbook_urls(), [person(1).url])
+
+    def test_save_all_removes_both_journals(self):
+        repo = self.open()
+        repo.save_person(person(1))
+        with open(repo.compacting_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "save", "row": ExcelRepository._to_row(person(9))}) + "\n")
+        repo.save_all([person(2)])
+        self.assertFalse(os.path.exists(repo.journal_path))
+        self.assertFalse(os.path.exists(repo.compacting_path))
+        self.assertEqual(self.workbook_urls(), [person(2).url])
+
+@unittest.skipIf(ExcelRepository is None, "pandas non installé")
+class TestExcelSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "export.xlsx")
+        ExcelRepository(self.path).save_all([person(1), person(2)])
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load_urls(self):
+        return sorted(p.url for p in ExcelRepository(self.path).load_existing_persons())
+
+    def test_second_load_uses_snapshot(self):
+        self.assertTrue(os.path.exists(self.path + ".snapshot.pkl"))
+        with mock.patch("app.infra.storage.excel_storage.pd.read_excel", side_effect=AssertionError) as read:
+            self.assertEqual(self.load_urls(), [person(1).url, person(2).url])
+        read.assert_not_called()
+
+    def test_external_edit_invalidates_snapshot(self):
+        import pandas as pd
+        # Modification hors de l'application : nouveau contenu, nouvelle taille et nouvelle date
+        df = pd.DataFrame([ExcelRepository._to_row(person(i)) for i in (1, 2, 3)], columns=ExcelRepository.COLUMNS)
+        df.to_excel(self.path, index=False)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+        self.assertEqual(self.load_urls(), [person(i).url for i in (1, 2, 3)])
+        # Le snapshot est réécrit pour le nouveau classeur
+        with mock.patch("app.infra.storage.excel_storage.pd.read_excel", side_effect=AssertionError):
+            self.assertEqual(self.load_urls(), [person(i).url for i in (1, 2, 3)])
+
+    def test_touched_workbook_is_read_again(self):
+        import pandas as pd
+        # Même taille, date de modification différente (classeur réenregistré à l'identique)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+        with mock.patch("app.infra.storage.excel_storage.pd.read_excel", wraps=pd.read_excel) as read:
+            self.assertEqual(self.load_urls(), [person(1).url, person(2).url])
+        read.assert_called_once()
+
+    def test_corrupt_snapshot_falls_back_to_workbook(self):
+        with open(self.path + ".snapshot.pkl", "wb") as f:
+            f.write(b"not a pickle")
+        self.assertEqual(self.load_urls(), [person(1).url, person(2).url])
+
+    def test_wrong_version_snapshot_falls_back_to_workbook(self):
+        with open(self.path + ".snapshot.pkl", "wb") as f:
+            pickle.dump({"version": ExcelRepository.SNAPSHOT_VERSION + 1, "signature": (0, 0),
+                         "columns": {}}, f)
+        self.assertEqual(self.load_urls(), [person(1).url, person(2).url])
+
+if __name__ == "__main__":
+    unittest.main()
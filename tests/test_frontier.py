@@ -0,0 +1,80 @@
+import unittest
+from app.core.frontier import Frontier, KeywordScorer, HopDistanceScorer, SourceCountScorer, build_scorers
+from app.core.services import WorkflowManager
+from app.core.matcher import KeywordMatcher
+from tests.test_workflow import MockRepository
+
+class TestFrontier(unittest.TestCase):
+    def test_fifo_when_scores_are_equal(self):
+        f = Frontier()
+        for url in ["a", "b", "c"]:
+            f.push(url)
+        self.assertEqual(f.peek(), "a")
+        self.assertEqual(f.peek_many(10), ["a", "b", "c"])
+
+    def test_update_and_remove(self):
+        f = Frontier()
+        f.push("a", 1.0)
+        f.push("b", 2.0)
+        f.push("c", 0.0)
+        self.assertEqual(f.peek(), "b")
+
+        f.push("c", 5.0)
+        self.assertEqual(f.peek_many(3), ["c", "b", "a"])
+        f.remove("c")
+        self.assertEqual(len(f), 2)
+        self.assertEqual(f.pop(), "b")
+        self.assertEqual(f.pop(), "a")
+        self.assertIsNone(f.pop())
+
+    def test_peek_many_matches_sorted_order(self):
+        f = Frontier()
+        for i in range(500):
+            f.push(f"u{i}", float((i * 37) % 11))
+        for i in range(0, 500, 3):
+            f.remove(f"u{i}")
+        for i in range(1, 500, 7):
+            f.push(f"u{i}", float(i % 5))
+
+        expected = [url for _, url in sorted(((-f.score(url), int(url[1:])), url) for url in f._entries)]
+        self.assertEqual(f.peek_many(50), expected[:50])
+
+class TestPriorityWorkflow(unittest.TestCase):
+    def setUp(self):
+        scorers = [(KeywordScorer(KeywordMatcher(["CTO"])), 10.0), (HopDistanceScorer(), 1.0), (SourceCountScorer(), 2.0)]
+        self.workflow = WorkflowManager(MockRepository(), scorers=scorers)
+
+    def test_keyword_profile_jumps_the_queue(self):
+        seed = self.workflow.add_person("seed")
+        self.workflow.add_person("dev", source_url=seed.url, titre="Développeur")
+        self.workflow.add_person("cto", source_url=seed.url, titre="CTO chez Corp")
+        self.workflow.mark_analyzed(seed)
+        self.assertEqual(self.workflow.get_next_person().url, "cto")
+
+    def test_re_suggestion_increases_score(self):
+        seed = self.workflow.add_person("seed")
+        self.workflow.mark_analyzed(seed)
+        self.workflow.add_person("a", source_url="seed")
+        self.workflow.add_person("b", source_url="seed")
+        self.assertEqual(self.workflow.get_next_person().url, "a")
+
+        # "b" est suggéré par une seconde source : il passe devant
+        self.assertIsNone(self.workflow.add_person("b", source_url="other"))
+        self.assertEqual(self.workflow.sources["b"], {"seed", "other"})
+        self.assertEqual(self.workflow.get_next_person().url, "b")
+        self.assertEqual([p.url for p in self.workflow.peek_pending(2)], ["b", "a"])
+
+    def test_hop_distance(self):
+        self.workflow.add_person("seed")
+        self.workflow.add_person("n1", source_url="seed")
+        self.workflow.add_person("n2", source_url="n1")
+        self.assertEqual(self.workflow.hops, {"seed": 0, "n1": 1, "n2": 2})
+
+    def test_build_scorers_from_config(self):
+        config = {"filters": {"keywords": ["CTO"]}, "scheduler": {"weights": {"keywords": 2, "hops": 0, "unknown": 1}}}
+        scorers = build_scorers(config)
+        self.assertEqual(len(scorers), 1)
+        self.assertIsInstance(scorers[0][0], KeywordScorer)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from app.infra.storage.html_snapshots import HtmlSnapshotStore
+
+try:
+    from app.scraper.offline_parser import parse_html, reparse_all
+except ImportError:  # selectolax non installé
+    parse_html = None
+
+PROFILE_HTML = """
+<html><body>
+  <h1>  Jean
+        Dupont </h1>
+  <div class="text-body-medium break-words">Directeur des Systèmes d'Information</div>
+  <button aria-label="Current company: Acme. Click to skip to experience card">Acme</button>
+  <span class="text-body-small inline t-black--light break-words">Lyon, France</span>
+</body></html>
+"""
+
+class TestHtmlSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = HtmlSnapshotStore(os.path.join(self.tmp.name, "snapshots"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_save_and_load(self):
+        url = "https://www.linkedin.com/in/jean-dupont/"
+        self.store.save(url, PROFILE_HTML)
+        self.store.save(url + "?trk=x", PROFILE_HTML)  # Même URL canonique : remplacement
+        self.assertEqual(len(self.store), 1)
+        self.assertEqual(self.store.load("https://www.linkedin.com/in/jean-dupont")["html"], PROFILE_HTML)
+        self.assertIsNone(self.store.load("https://www.linkedin.com/in/inconnu"))
+
+    @unittest.skipIf(parse_html is None, "selectolax non installé")
+    def test_offline_reparse(self):
+        self.assertEqual(parse_html(PROFILE_HTML, "u"), {
+            "nom": "Jean Dupont", "titre": "Directeur des Systèmes d'Information",
+            "societe": "Acme", "lieu": "Lyon, France", "url": "u", "missing": []})
+        self.assertEqual(parse_html("<html><body><p>Page introuvable</p></body></html>", "u")["missing"],
+                         ["nom", "titre", "societe", "lieu"])
+
+        for i in range(3):
+            self.store.save(f"https://www.linkedin.com/in/p{i}", PROFILE_HTML)
+        profiles = reparse_all(self.store.directory, workers=2)
+        self.assertEqual(sorted(p["url"] for p in profiles),
+                         [f"https://www.linkedin.com/in/p{i}" for i in range(3)])
@@ -0,0 +1,40 @@
+import unittest
+from app.core.matcher import KeywordMatcher, fold
+
+class TestKeywordMatcher(unittest.TestCase):
+    def setUp(self):
+        self.matcher = KeywordMatcher(["Directeur", "CTO", "Lead", "Head of", "Responsable Réseau"])
+
+    def test_fold(self):
+        self.assertEqual(fold("Énergie ÉLECTRIQUE"), "energie electrique")
+
+    def test_accents_and_case_are_ignored(self):
+        self.assertTrue(self.matcher.matches("directeur général"))
+        self.assertTrue(self.matcher.matches("RESPONSABLE RESEAU Île-de-France"))
+        self.assertFalse(self.matcher.matches(None))
+
+    def test_word_boundaries(self):
+        self.assertFalse(self.matcher.matches("Team Leader"))
+        self.assertFalse(self.matcher.matches("Doctorant"))
+        self.assertTrue(self.matcher.matches("Tech Lead / CTO"))
+        self.assertEqual(self.matcher.score("Tech Lead / CTO"), 2)
+
+    def test_batch_api_matches_single_calls(self):
+        titles = ["CTO", "Développeur", None, "Head of Data", "Lead dev\nCTO", "CTO", "Directrice"]
+        expected = [self.matcher.score(t) for t in titles]
+        fresh = KeywordMatcher(self.matcher.keywords)
+        self.assertEqual(fresh.score_many(titles), expected)
+        self.assertEqual(fresh.match_many(titles), [bool(n) for n in expected])
+
+    def test_cache_is_bounded(self):
+        matcher = KeywordMatcher(["CTO"], cache_size=3)
+        for i in range(10):
+            matcher.matches(f"CTO {i}")
+        self.assertEqual(len(matcher._cache), 3)
+
+    def test_shared_instance_from_config(self):
+        config = {"filters": {"keywords": ["CTO", "VP"]}}
+        self.assertIs(KeywordMatcher.from_config(config), KeywordMatcher.from_config(dict(config)))
+
+if __name__ == '__main__':
+    unittest.main()
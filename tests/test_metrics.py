@@ -0,0 +1,66 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+import urllib.request
+from app.core.metrics import MetricsRegistry
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.registry = MetricsRegistry(window=100, clock=self.clock)
+
+    def test_timers_and_percentiles(self):
+        for i in range(1, 101):
+            with self.registry.timer("browser.goto"):
+                self.clock.now += i / 100
+        timer = self.registry.snapshot()["timers"]["browser.goto"]
+        self.assertEqual(timer["count"], 100)
+        self.assertAlmostEqual(timer["p50"], 0.5, delta=0.011)
+        self.assertAlmostEqual(timer["p99"], 0.99, delta=0.011)
+        self.assertAlmostEqual(timer["max"], 1.0)
+
+    def test_timed_decorator_and_throughput(self):
+        @self.registry.timed("parser.profile")
+        async def parse():
+            self.clock.now += 0.2
+            return "ok"
+
+        self.assertEqual(asyncio.run(parse()), "ok")
+        self.assertEqual(self.registry.histograms["parser.profile"].count, 1)
+
+        for _ in range(30):
+            self.registry.increment("profiles.analyzed")
+        self.clock.now = 1800.0  # 30 profils en une demi-heure
+        self.assertAlmostEqual(self.registry.per_hour("profiles.analyzed"), 60.0)
+        self.assertIn("60 profils/h", self.registry.status_line())
+
+    def test_exports(self):
+        self.registry.observe("storage.excel_write", 0.3)
+        self.registry.increment("cache.hits", 2)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = os.path.join(tmp, "metrics.json")
+            csv_path = os.path.join(tmp, "metrics.csv")
+            self.registry.dump(json_path)
+            self.registry.dump(csv_path)
+            with open(json_path) as f:
+                self.assertEqual(json.load(f)["counters"], {"cache.hits": 2})
+            with open(csv_path) as f:
+                self.assertTrue(f.readline().startswith("name,count"))
+
+        self.registry.serve(0)
+        try:
+            port = self.registry._server.server_address[1]
+            body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+        finally:
+            self.registry.close()
+        self.assertIn('linkedin_explorer_storage_excel_write_seconds{quantile="0.5"} 0.3', body)
+        self.assertIn("linkedin_explorer_cache_hits_total 2", body)
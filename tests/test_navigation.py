@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from app.core.navigation import NavigationScheduler, SupersededError
+
+class TestNavigationScheduler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.scheduler = NavigationScheduler()
+        self.calls = []
+
+    def operation(self, url, delay=0.01):
+        async def run():
+            self.calls.append(url)
+            await asyncio.sleep(delay)
+            return url.upper()
+        return run
+
+    async def test_latest_wins(self):
+        first = asyncio.ensure_future(self.scheduler.load("a", self.operation("a")))
+        second = asyncio.ensure_future(self.scheduler.load("b", self.operation("b")))
+        third = asyncio.ensure_future(self.scheduler.load("c", self.operation("c")))
+        results = await asyncio.gather(first, second, third, return_exceptions=True)
+
+        self.assertIsInstance(results[0], SupersededError)
+        self.assertIsInstance(results[1], SupersededError)
+        self.assertEqual(results[2], "C")
+        # Seul le dernier chargement a atteint la page
+        self.assertEqual(self.calls, ["c"])
+
+    async def test_same_url_is_deduplicated(self):
+        results = await asyncio.gather(self.scheduler.load("a", self.operation("a")),
+                                       self.scheduler.load("a", self.operation("a")),
+                                       self.scheduler.share("x", self.operation("x")),
+                                       self.scheduler.share("x", self.operation("x")))
+        self.assertEqual(results, ["A", "A", "X", "X"])
+        self.assertEqual(sorted(self.calls), ["a", "x"])
+
+    async def test_run_is_serialized_and_not_cancelled(self):
+        load = asyncio.ensure_future(self.scheduler.load("a", self.operation("a", 0.02)))
+        await asyncio.sleep(0)
+        relations = asyncio.ensure_future(self.scheduler.run(self.operation("relations")))
+        self.assertEqual(await load, "A")
+        self.assertEqual(await relations, "RELATIONS")
+        self.assertEqual(self.calls, ["a", "relations"])
+
+        # Une URL remplacée puis redemandée est rechargée
+        stale = asyncio.ensure_future(self.scheduler.load("a", self.operation("a")))
+        await asyncio.sleep(0)
+        await self.scheduler.load("b", self.operation("b"))
+        with self.assertRaises(SupersededError):
+            await stale
+        self.assertEqual(await self.scheduler.load("a", self.operation("a")), "A")
+
+    async def test_operation_is_cancelled_with_its_last_waiter(self):
+        log = []
+
+        async def navigate():
+            log.append("start")
+            try:
+                await asyncio.sleep(1)
+                log.append("navigated-done")
+            except asyncio.CancelledError:
+                log.append("cancelled")
+                raise
+
+        first = asyncio.ensure_future(self.scheduler.share("a", navigate))
+        second = asyncio.ensure_future(self.scheduler.share("a", navigate))
+        await asyncio.sleep(0.01)
+        # Un appelant restant : l'opération partagée continue
+        first.cancel()
+        await asyncio.sleep(0.01)
+        self.assertEqual(log, ["start"])
+        # Dernier appelant annulé : l'opération l'est aussi, avant que l'appelant ne rende la main
+        second.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await second
+        self.assertEqual(log, ["start", "cancelled"])
+        # Une nouvelle demande relance l'opération
+        self.assertEqual(await self.scheduler.share("a", self.operation("a")), "A")
+
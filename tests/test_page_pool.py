@@ -0,0 +1,103 @@
+import asyncio
+import unittest
+from app.scraper.page_pool import PagePool
+
+class FakePage:
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = {}
+        self.closed = False
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return self.closed
+
+    async def goto(self, url):
+        await asyncio.sleep(0)
+        self.handlers["framenavigated"](self.main_frame)
+
+    async def close(self):
+        self.closed = True
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    async def new_page(self):
+        await asyncio.sleep(0)
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+class FailingContext(FakeContext):
+    """Contexte dont l'ouverture de page échoue au-delà de `limit` pages (navigateur planté)."""
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+
+    async def new_page(self):
+        if len(self.pages) >= self.limit:
+            await asyncio.sleep(0)
+            raise RuntimeError("Target closed")
+        return await super().new_page()
+
+class TestPagePool(unittest.IsolatedAsyncioTestCase):
+    async def test_size_is_bounded_and_pages_are_reused(self):
+        context = FakeContext()
+        pool = PagePool(context, size=2)
+        in_use = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal in_use, peak
+            async with pool.lease() as page:
+                in_use += 1
+                peak = max(peak, in_use)
+                await page.goto(f"https://example.com/{i}")
+                in_use -= 1
+
+        await asyncio.gather(*(work(i) for i in range(6)))
+        self.assertEqual(peak, 2)
+        self.assertEqual(len(context.pages), 2)
+        await pool.close()
+        self.assertTrue(all(p.closed for p in context.pages))
+
+    async def test_recycling_and_health_check(self):
+        context = FakeContext()
+        pool = PagePool(context, size=1, max_navigations=2)
+        async with pool.lease() as first:
+            await first.goto("a")
+            await first.goto("b")
+        # Page usée : fermée et remplacée
+        self.assertTrue(first.closed)
+        async with pool.lease() as second:
+            self.assertIsNot(second, first)
+            second.closed = True  # Fermée de l'extérieur
+        async with pool.lease() as third:
+            self.assertFalse(third.closed)
+        self.assertEqual(pool.stats()["pages"], 1)
+
+    async def test_waiter_is_woken_when_replacement_fails(self):
+        pool = PagePool(FailingContext(limit=1), size=1, max_navigations=1)
+        async with pool.lease() as page:
+            waiter = asyncio.ensure_future(pool.lease().__aenter__())
+            await asyncio.sleep(0.01)
+            self.assertFalse(waiter.done())
+            await page.goto("a")
+        # Page usée jetée, remplacement impossible : l'emprunteur en attente reçoit l'erreur
+        with self.assertRaises(RuntimeError):
+            await asyncio.wait_for(waiter, 1)
+        self.assertEqual(pool.stats(), {"pages": 0, "idle": 0, "size": 1})
+
+    async def test_close_wakes_waiters(self):
+        pool = PagePool(FakeContext(), size=1)
+        async with pool.lease() as page:
+            waiter = asyncio.ensure_future(pool.lease().__aenter__())
+            await asyncio.sleep(0.01)
+            await pool.close()
+            with self.assertRaisesRegex(RuntimeError, "fermé"):
+                await asyncio.wait_for(waiter, 1)
+        self.assertTrue(page.closed)
+
@@ -0,0 +1,197 @@
+import asyncio
+import unittest
+from unittest import mock
+from app.scraper import parsers
+from app.scraper import profile_selectors as sel
+from app.scraper.parsers import LinkedInParser
+
+class FakeElement:
+    def __init__(self, text=None, attrs=None, children=None):
+        self.text = text
+        self.attrs = attrs or {}
+        self.children = children or {}
+
+class FakeLocator:
+    """Sous-ensemble de l'API Locator de Playwright utilisé par le parser.
+
+    Chaque appel bloquant est journalisé dans `log` : (méthode, délai en ms, élément trouvé)."""
+    def __init__(self, elements, appear_after=None, log=None):
+        self.elements = elements
+        self.appear_after = appear_after   # Délai avant que l'élément soit attaché (None : jamais)
+        self.log = log if log is not None else []
+
+    def _derive(self, elements, appear_after=None):
+        return FakeLocator(elements, appear_after, self.log)
+
+    @property
+    def first(self):
+        return self._derive(self.elements[:1], self.appear_after)
+
+    def nth(self, index):
+        return self._derive(self.elements[index:][:1], self.appear_after)
+
+    def locator(self, selector):
+        return self._derive([c for e in self.elements for c in e.children.get(selector, [])])
+
+    async def count(self):
+        return len(self.elements)
+
+    async def _resolve(self, method, timeout):
+        # Comme Playwright : un élément absent est attendu jusqu'au délai, puis TimeoutError
+        self.log.append((method, timeout, bool(self.elements)))
+        if not self.elements:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(f"Timeout {timeout} ms")
+        return self.elements[0]
+
+    async def wait_for(self, state="visible", timeout=30000):
+        self.log.append(("wait_for", timeout, self.appear_after is not None))
+        if self.appear_after is None or self.appear_after * 1000 > timeout:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(f"Timeout {timeout} ms")
+        await asyncio.sleep(self.appear_after)
+
+    async def scroll_into_view_if_needed(self, timeout=30000):
+        await self._resolve("scroll_into_view_if_needed", timeout)
+
+    async def get_attribute(self, name, timeout=30000):
+        return (await self._resolve("get_attribute", timeout)).attrs.get(name)
+
+    async def inner_text(self, timeout=30000):
+        return (await self._resolve("inner_text", timeout)).text
+
+def modal_item(url, nom, titre):
+    spans = [FakeElement(nom), FakeElement("· 2e"), FakeElement(titre)]
+    return FakeElement(children={sel.MODAL_LINK: [FakeElement(attrs={"href": url}),
+                                                  FakeElement(children={sel.MODAL_TEXT: spans})]})
+
+def company_item(url):
+    """Item sans profil (société, "voir plus") : un seul lien."""
+    return FakeElement(children={sel.MODAL_LINK: [FakeElement(attrs={"href": url})]})
+
+class ModalPage:
+    def __init__(self, items, rows=None):
+        self.items = items
+        self.rows = rows             # Résultat du lot ; None : le lot lève une exception
+        self.log = []
+
+    async def wait_for_selector(self, selector, timeout=30000):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        if script == parsers._SCROLL_TO_LAST_ITEM_JS:
+            return len(self.items)
+        if self.rows is None:
+            raise RuntimeError("Execution context was destroyed")
+        return self.rows
+
+    def locator(self, selector):
+        assert selector == sel.MODAL_ITEM
+        return FakeLocator(self.items, log=self.log)
+
+class ProfilePage:
+    """Page de profil : `present` est lu par le lot, `late` apparaît après un délai (secondes)."""
+    def __init__(self, present, late=None):
+        self.present = present
+        self.late = late or {}
+        self.waited = []
+        self.selector_timeouts = []
+        self.log = []
+
+    async def wait_for_selector(self, selector, timeout=30000):
+        self.selector_timeouts.append(timeout)
+        if "nom" not in self.present:
+            await asyncio.sleep(timeout / 1000)
+            raise TimeoutError(f"Timeout {timeout} ms")
+
+    async def evaluate(self, script, selectors):
+        return dict(self.present)
+
+    def locator(self, selector):
+        name = next(n for n, s in sel.PROFILE_FIELDS.items() if s == selector)
+        self.waited.append(name)
+        return FakeLocator([FakeElement(self.late.get(name))], self.late.get(name) and 0.05, self.log)
+
+async def no_sleep(delay):
+    pass
+
+SUGGESTIONS = [
+    {"nom": "Jean Dupont", "titre": "Directeur SI", "url": "https://www.linkedin.com/in/jean"},
+    {"nom": "Marie Martin", "titre": "CTO", "url": "https://www.linkedin.com/in/marie"},
+]
+
+class TestModalSuggestions(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.items = [modal_item(s["url"] + "?trk=pymk", s["nom"], s["titre"]) for s in SUGGESTIONS]
+        patcher = mock.patch.object(parsers.asyncio, "sleep", no_sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_batch_rows(self):
+        rows = [{"index": i, "url": s["url"] + "?trk=pymk", "nom": f" {s['nom']} ", "titre": s["titre"]}
+                for i, s in enumerate(SUGGESTIONS)]
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(ModalPage(self.items, rows)), SUGGESTIONS)
+
+    async def test_incomplete_row_uses_item_fallback(self):
+        rows = [{"index": 0, "url": SUGGESTIONS[0]["url"], "nom": "Jean Dupont", "titre": "Directeur SI"},
+                {"index": 1}]
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(ModalPage(self.items, rows)), SUGGESTIONS)
+
+    async def test_failed_batch_falls_back_per_item(self):
+        page = ModalPage(self.items)
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(page), SUGGESTIONS)
+        self.assertTrue(page.log)
+        self.assertTrue(all(timeout == 1000 for _, timeout, _ in page.log))
+
+    async def test_non_profile_item_is_not_waited_for(self):
+        items = self.items + [company_item("https://www.linkedin.com/company/acme")]
+        rows = [{"index": i, "url": s["url"], "nom": s["nom"], "titre": s["titre"]}
+                for i, s in enumerate(SUGGESTIONS)] + [{"index": 2, "skip": True}]
+        page = ModalPage(items, rows)
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(page), SUGGESTIONS)
+        self.assertEqual(page.log, [])
+        # Sans le lot, l'item est écarté sur le nombre de liens, sans attendre un élément absent
+        page = ModalPage(items)
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(page), SUGGESTIONS)
+        self.assertTrue(all(found for _, _, found in page.log), page.log)
+
+    async def test_missing_text_waits_item_timeout(self):
+        item = FakeElement(children={sel.MODAL_LINK: [FakeElement(attrs={"href": SUGGESTIONS[0]["url"]}),
+                                                      FakeElement()]})
+        page = ModalPage([item], [{"index": 0, "url": SUGGESTIONS[0]["url"]}])
+        self.assertEqual(await LinkedInParser.extract_modal_suggestions(page, item_timeout=0.5), [])
+        self.assertIn(("inner_text", 500, False), page.log)
+        self.assertTrue(all(timeout == 500 for _, timeout, _ in page.log))
+
+class TestMainProfile(unittest.IsolatedAsyncioTestCase):
+    URL = "https://www.linkedin.com/in/jean"
+    FIELDS = {"nom": "Jean Dupont", "titre": "Directeur SI", "societe": "Acme", "lieu": "Lyon"}
+
+    async def extract(self, page, **budget):
+        return await LinkedInParser.extract_main_profile(page, self.URL, **budget)
+
+    async def test_name_never_appears(self):
+        page = ProfilePage({})
+        result = await self.extract(page, timeout=0.1, field_timeout=1.0)
+        self.assertEqual(result, {"url": self.URL, "missing": ["nom", "titre", "societe", "lieu"]})
+        self.assertEqual(page.selector_timeouts, [100])
+        self.assertEqual(page.waited, [])   # Pas de profil : pas d'attente champ par champ
+
+    async def test_missing_field_is_bounded(self):
+        present = {k: v for k, v in self.FIELDS.items() if k not in ("societe", "lieu")}
+        page = ProfilePage(present, late={"societe": "Acme"})
+        result = await self.extract(page, timeout=1.0, field_timeout=0.2)
+        self.assertEqual(result, {**present, "societe": "Acme", "url": self.URL, "missing": ["lieu"]})
+        self.assertEqual(page.waited, ["societe", "lieu"])
+        # Champs attendus en parallèle (les deux attentes débutent avant toute lecture),
+        # chacune bornée par field_timeout
+        self.assertEqual(page.log, [("wait_for", 200, True), ("wait_for", 200, False), ("inner_text", 200, True)])
+
+    async def test_all_fields_present(self):
+        page = ProfilePage(self.FIELDS)
+        result = await self.extract(page)
+        self.assertEqual(result, {**self.FIELDS, "url": self.URL, "missing": []})
+        self.assertEqual(page.waited, [])
+
+if __name__ == "__main__":
+    unittest.main()
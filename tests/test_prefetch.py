@@ -0,0 +1,53 @@
+import asyncio
+import unittest
+from app.core.prefetch import ProfilePrefetcher
+from app.core.services import WorkflowManager
+from tests.test_workflow import MockRepository
+
+class SlowBrowser:
+    """Extraction bloquée jusqu'à libération explicite, pour observer la concurrence."""
+    def __init__(self):
+        self.started = []
+        self.release = asyncio.Event()
+
+    async def fetch_profile_data(self, url):
+        self.started.append(url)
+        await self.release.wait()
+        return {"nom": url.upper(), "url": url}
+
+class TestPrefetcher(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.workflow = WorkflowManager(MockRepository())
+        for url in ["a", "b", "c", "d"]:
+            self.workflow.add_person(url)
+        self.browser = SlowBrowser()
+        self.prefetcher = ProfilePrefetcher(self.workflow, self.browser, depth=3, concurrency=2)
+
+    async def asyncTearDown(self):
+        self.prefetcher.stop()
+
+    async def test_bounded_concurrency_and_cache(self):
+        self.prefetcher.reschedule()
+        await asyncio.sleep(0)
+        self.assertEqual(self.browser.started, ["a", "b"])
+
+        self.browser.release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertEqual(self.browser.started, ["a", "b", "c"])
+        self.assertTrue(self.prefetcher.is_ready("c"))
+        self.assertEqual((await self.prefetcher.claim("a"))["nom"], "A")
+        self.assertIsNone(self.prefetcher.claim("a"))
+
+    async def test_leaving_top_n_cancels_prefetch(self):
+        self.prefetcher.reschedule()
+        await asyncio.sleep(0)
+        # "a" est réclamé (sélectionné) : il n'est pas annulé quand il quitte la file
+        claimed = self.prefetcher.claim("a")
+        self.workflow.mark_analyzed(self.workflow.all_persons["a"])
+        self.workflow.mark_analyzed(self.workflow.all_persons["c"])
+        await asyncio.sleep(0)
+        self.assertEqual(set(self.prefetcher._tasks), {"b", "d"})
+
+        self.browser.release.set()
+        self.assertEqual((await claimed)["url"], "a")
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from app.core.profile_cache import canonical_url
+from app.infra.storage.profile_cache import SqliteProfileCache
+
+class TestProfileCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.now = 1000.0
+        self.cache = SqliteProfileCache(os.path.join(self.tmp.name, "cache.db"), ttl=60, max_entries=2,
+                                        clock=lambda: self.now)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_canonical_url(self):
+        self.assertEqual(canonical_url("http://linkedin.com/in/Jean-Dupont/?trk=abc#x"),
+                         "https://www.linkedin.com/in/jean-dupont")
+        self.assertEqual(canonical_url("https://fr.linkedin.com/in/jean-dupont"),
+                         "https://www.linkedin.com/in/jean-dupont")
+
+    def test_hit_miss_and_ttl(self):
+        self.assertIsNone(self.cache.get("https://www.linkedin.com/in/a"))
+        self.cache.put("https://www.linkedin.com/in/a/", {"nom": "Émile"})
+        self.assertEqual(self.cache.get("https://www.linkedin.com/in/a?x=1"), {"nom": "Émile"})
+
+        self.now += 61
+        self.assertIsNone(self.cache.get("https://www.linkedin.com/in/a"))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expired"]), (1, 2, 1))
+
+    def test_lru_eviction(self):
+        self.cache.put("https://www.linkedin.com/in/a", {"nom": "A"})
+        self.now += 1
+        self.cache.put("https://www.linkedin.com/in/b", {"nom": "B"})
+        self.now += 1
+        self.cache.get("https://www.linkedin.com/in/a")  # "a" devient le plus récent
+        self.now += 1
+        self.cache.put("https://www.linkedin.com/in/c", {"nom": "C"})
+
+        self.assertIsNone(self.cache.get("https://www.linkedin.com/in/b"))
+        self.assertIsNotNone(self.cache.get("https://www.linkedin.com/in/a"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+        self.assertEqual(len(self.cache), 2)
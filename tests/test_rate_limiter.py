@@ -0,0 +1,59 @@
+import random
+import unittest
+from app.core.rate_limiter import AdaptiveRateLimiter
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+class TestAdaptiveRateLimiter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.time = FakeTime()
+        self.limiter = AdaptiveRateLimiter(min_interval=1.0, max_interval=4.0, jitter=0.0,
+                                           additive_step=0.25, challenge_pause=60,
+                                           clock=self.time.clock, sleep=self.time.sleep, rng=random.Random(0))
+
+    def test_from_config_reads_delays(self):
+        limiter = AdaptiveRateLimiter.from_config({"delays": {"min_wait": 2, "max_wait": 5}})
+        self.assertEqual((limiter.min_interval, limiter.max_interval, limiter.interval), (2.0, 5.0, 5.0))
+
+    def test_from_config_shares_rate_between_workers(self):
+        limiter = AdaptiveRateLimiter.from_config({"delays": {"min_wait": 2, "max_wait": 5}}, workers=3)
+        self.assertEqual((limiter.min_interval, limiter.max_interval), (6.0, 15.0))
+
+    async def test_token_bucket_paces_navigations(self):
+        await self.limiter.acquire()           # Jeton initial : pas d'attente
+        await self.limiter.acquire()
+        await self.limiter.acquire()
+        self.assertEqual(self.time.sleeps, [4.0, 4.0])
+
+    async def test_aimd_adaptation_stays_in_bounds(self):
+        for _ in range(10):
+            self.limiter.record_success(0.5)
+        self.assertAlmostEqual(self.limiter.interval, 1.0)  # Plafonné à min_interval
+
+        self.limiter.record_error()
+        self.assertAlmostEqual(self.limiter.interval, 2.0)
+        self.limiter.record_success(10.0)                     # Réponse lente : ralentissement
+        self.assertGreater(self.limiter.interval, 2.0)
+
+        for _ in range(10):
+            self.limiter.record_error()
+        self.assertAlmostEqual(self.limiter.interval, 4.0)  # Plancher à max_interval
+
+    async def test_challenge_pauses_everyone(self):
+        await self.limiter.acquire()
+        self.limiter.record_challenge()
+        await self.limiter.acquire()
+        self.assertEqual(self.time.now, 60.0)
+        await self.limiter.acquire()                          # Reprise au rythme le plus lent
+        self.assertEqual(self.time.now, 64.0)
+        self.assertEqual(self.limiter.stats()["challenges"], 1)
@@ -0,0 +1,49 @@
+import unittest
+from types import SimpleNamespace
+from app.scraper.routing import RoutingPolicy
+
+class FakeRoute:
+    def __init__(self):
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "abort"
+
+    async def fallback(self):
+        self.outcome = "continue"
+
+class TestRoutingPolicy(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.policy = RoutingPolicy(["image", "font"], ["*doubleclick.net*", "*/li/track*"],
+                                    estimated_bytes={"image": 1000})
+
+    def test_from_config(self):
+        self.assertIsNone(RoutingPolicy.from_config({}))
+        policy = RoutingPolicy.from_config({"browser": {"routing": {"enabled": True,
+                                                                    "block_resource_types": ["media"]}}})
+        self.assertTrue(policy.should_block("media", "https://x/video.mp4"))
+        self.assertFalse(policy.should_block("document", "https://www.linkedin.com/in/a"))
+
+    async def test_blocks_and_records_per_navigation(self):
+        page = object()
+        requests = [
+            ("document", "https://www.linkedin.com/in/a"),
+            ("image", "https://media.licdn.com/photo.jpg"),
+            ("image", "https://media.licdn.com/banner.jpg"),
+            ("script", "https://ad.doubleclick.net/tag.js"),
+            ("xhr", "https://www.linkedin.com/li/track?x=1"),
+            ("script", "https://static.licdn.com/app.js"),
+        ]
+        self.policy.begin_navigation(page, "https://www.linkedin.com/in/a")
+        outcomes = []
+        for resource_type, url in requests:
+            route = FakeRoute()
+            request = SimpleNamespace(resource_type=resource_type, url=url, frame=SimpleNamespace(page=page))
+            await self.policy.handle(route, request)
+            outcomes.append(route.outcome)
+        navigation = self.policy.end_navigation(page)
+
+        self.assertEqual(outcomes, ["continue", "abort", "abort", "abort", "abort", "continue"])
+        self.assertEqual((navigation.blocked, navigation.allowed), (4, 2))
+        self.assertEqual(navigation.blocked_bytes, 2 * 1000 + 50_000 + 2_000)
+        self.assertEqual(self.policy.summary()["navigations"], 1)
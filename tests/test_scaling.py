@@ -0,0 +1,107 @@
+import math
+import os
+import unittest
+from benchmarks.common import check_thresholds, make_population, measure, MemoryRepository
+from app.core.services import WorkflowManager
+
+class CountingScore(float):
+    """Score comptant les comparaisons faites par la file de priorité."""
+    comparisons = 0
+
+    def _count(self, op, other):
+        CountingScore.comparisons += 1
+        return op(float(self), float(other))
+
+    def __lt__(self, other):
+        return self._count(float.__lt__, other)
+
+    def __eq__(self, other):
+        return self._count(float.__eq__, other)
+
+    __hash__ = float.__hash__
+
+    def __neg__(self):
+        return CountingScore(-float(self))
+
+    def __add__(self, other):
+        return CountingScore(float(self) + other)
+
+    def __mul__(self, other):
+        return CountingScore(float(self) * other)
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+class CountingScorer:
+    """Scorer déterministe comptant ses appels (un recalcul de toute la file serait visible)."""
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, person, workflow) -> float:
+        self.calls += 1
+        return CountingScore(int(person.url.rsplit("-", 1)[-1]) % 97)
+
+class TestScaling(unittest.TestCase):
+    """Garde-fou de complexité : le nombre d'opérations par appel ne doit pas croître avec la taille de la file."""
+    SMALL, LARGE = 1000, 20000
+    OPS = 500
+
+    def _per_op(self, n: int, operation) -> tuple:
+        scorer = CountingScorer()
+        workflow = WorkflowManager(MemoryRepository(make_population(n)), scorers=[(scorer, 1.0)])
+        workflow.load_initial_data()
+        scorer.calls, CountingScore.comparisons = 0, 0
+        operation(workflow)
+        return CountingScore.comparisons / self.OPS, scorer.calls / self.OPS
+
+    def _assert_logarithmic(self, operation):
+        (small_cmp, small_calls), (large_cmp, large_calls) = \
+            self._per_op(self.SMALL, operation), self._per_op(self.LARGE, operation)
+        # x20 de population : un coût O(log n) croît d'environ log(20000)/log(1000) ≈ 1.4, un coût O(n) de 20
+        bound = 2 * math.log(self.LARGE) / math.log(self.SMALL)
+        self.assertLess(large_cmp / small_cmp, bound, f"{small_cmp:.1f} -> {large_cmp:.1f} comparaisons/op")
+        self.assertLessEqual(large_calls, 1, f"{large_calls:.1f} calculs de score/op")
+        self.assertEqual(small_calls, large_calls)
+
+    def test_add_person_is_logarithmic(self):
+        fresh = make_population(self.OPS, seed=3)
+        self._assert_logarithmic(lambda wf: [wf.add_person(p.url, titre=p.titre) for p in fresh])
+
+    def test_next_person_is_logarithmic(self):
+        def next_and_mark(workflow):
+            for _ in range(self.OPS):
+                workflow.mark_analyzed(workflow.get_next_person())
+        self._assert_logarithmic(next_and_mark)
+
+    def test_threshold_check_reports_quadratic_growth(self):
+        results = {"bench": {"1000": {"us_per_op": 1.0}, "100000": {"us_per_op": 100.0}}}
+        self.assertEqual(len(check_thresholds(results, {"default_max_scaling": 6})), 1)
+        self.assertEqual(len(check_thresholds(results, {"max_us_per_op": {"bench": 10}})), 1)
+        self.assertEqual(check_thresholds(results, {"max_scaling": {"bench": 200}}), [])
+
+@unittest.skipUnless(os.environ.get("RUN_TIMING_TESTS"), "mesures de temps : RUN_TIMING_TESTS=1 pour les lancer")
+class TestScalingTiming(unittest.TestCase):
+    """Même garde-fou en temps réel ; sensible à la charge de la machine, donc hors de la suite par défaut."""
+    SMALL, LARGE = 1000, 20000
+
+    def _per_op(self, n: int, operation) -> float:
+        def setup():
+            workflow = WorkflowManager(MemoryRepository(make_population(n)))
+            workflow.load_initial_data()
+            return workflow
+        return measure(operation, 500, repeat=5, setup=setup)["us_per_op"]
+
+    def _assert_flat(self, operation):
+        small, large = self._per_op(self.SMALL, operation), self._per_op(self.LARGE, operation)
+        # x20 de population : un coût O(n) par opération donnerait un rapport proche de 20
+        self.assertLess(large / small, 5, f"{small:.2f} µs/op -> {large:.2f} µs/op")
+
+    def test_add_person_is_flat(self):
+        fresh = make_population(500, seed=3)
+        self._assert_flat(lambda wf: [wf.add_person(p.url, titre=p.titre) for p in fresh])
+
+    def test_next_person_is_flat(self):
+        def next_and_mark(workflow):
+            for _ in range(500):
+                workflow.mark_analyzed(workflow.get_next_person())
+        self._assert_flat(next_and_mark)
@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+from app.core.models import Personne
+from app.core.services import WorkflowManager
+from app.infra.storage.sqlite_storage import SqliteRepository
+
+class TestSqliteRepository(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "session.db")
+        self.repo = SqliteRepository(self.db_path)
+
+    def tearDown(self):
+        self.repo.close()
+        self.tmp_dir.cleanup()
+
+    def test_wal_mode(self):
+        mode = self.repo._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_row_level_update_keeps_discovery_order(self):
+        self.repo.save_person(Personne(url="u1", nom="A"))
+        self.repo.save_person(Personne(url="u2", nom="B"))
+        self.repo.save_person(Personne(url="u1", nom="A2", analyzed=True, interesting=True))
+
+        loaded = self.repo.load_existing_persons()
+        self.assertEqual([p.url for p in loaded], ["u1", "u2"])
+        self.assertEqual(loaded[0].nom, "A2")
+        self.assertTrue(loaded[0].interesting)
+
+    def test_remove_keeps_rejected_person(self):
+        p = Personne(url="u1", analyzed=True, interesting=True)
+        self.repo.save_person(p)
+        p.interesting = False
+        self.repo.remove_person(p)
+
+        loaded = self.repo.load_existing_persons()
+        self.assertEqual(len(loaded), 1)
+        self.assertTrue(loaded[0].analyzed)
+        self.assertFalse(loaded[0].interesting)
+        self.assertEqual(self.repo.interesting_persons(), [])
+
+    def test_save_all_replaces_content(self):
+        self.repo.save_person(Personne(url="old"))
+        self.repo.save_all([Personne(url="u1"), Personne(url="u2", interesting=True, analyzed=True)])
+        self.assertEqual([p.url for p in self.repo.load_existing_persons()], ["u1", "u2"])
+        self.assertEqual([p.url for p in self.repo.interesting_persons()], ["u2"])
+
+    def test_workflow_session_is_restored(self):
+        workflow = WorkflowManager(self.repo)
+        seed = workflow.add_person("https://www.linkedin.com/in/seed")
+        workflow.add_person("https://www.linkedin.com/in/pending", source_url=seed.url)
+        workflow.mark_analyzed(seed)
+        workflow.current_person = seed
+        workflow.set_current_person_decision(False)
+
+        restored = WorkflowManager(SqliteRepository(self.db_path))
+        restored.load_initial_data()
+        self.assertEqual(len(restored.all_persons), 2)
+        self.assertTrue(restored.all_persons[seed.url].analyzed)
+        self.assertFalse(restored.all_persons[seed.url].interesting)
+        pending = restored.get_next_person()
+        self.assertEqual(pending.url, "https://www.linkedin.com/in/pending")
+        self.assertEqual(pending.source_url, seed.url)
+        restored.repository.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import random
+import unittest
+from app.scraper.synthetic_graph import SyntheticGraph, FaultInjector, Distribution
+
+class TestSyntheticGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = SyntheticGraph(nodes=100000, seed=7)
+
+    def test_deterministic(self):
+        other = SyntheticGraph(nodes=100000, seed=7)
+        for node in (0, 1, 99999, 12345):
+            self.assertEqual(self.graph.profile(node), other.profile(node))
+            self.assertEqual(self.graph.suggestions(node), other.suggestions(node))
+        self.assertNotEqual(SyntheticGraph(nodes=100000, seed=8).profile(12345), self.graph.profile(12345))
+
+    def test_relations_shape(self):
+        degrees = []
+        seen = {}
+        for node in range(2000):
+            neighbours = self.graph.relations(node)
+            self.assertNotIn(node, neighbours)
+            self.assertEqual(len(neighbours), len(set(neighbours)))
+            degrees.append(len(neighbours))
+            for n in neighbours:
+                seen[n] = seen.get(n, 0) + 1
+        self.assertGreaterEqual(min(degrees), 3)
+        self.assertLessEqual(max(degrees), 40)
+        # Popularité biaisée : des profils sont suggérés plusieurs fois (doublons à dédoublonner)
+        self.assertGreater(max(seen.values()), 5)
+
+    def test_url_mapping(self):
+        self.assertEqual(self.graph.node_of(self.graph.url(42)), 42)
+        node = self.graph.node_of("https://www.linkedin.com/in/jean-dupont/")
+        self.assertEqual(node, self.graph.node_of("https://www.linkedin.com/in/jean-dupont/"))
+
+    def test_fault_injection_rates(self):
+        faults = FaultInjector(profile_latency={"distribution": "lognormal", "median": 0.5, "sigma": 0.3},
+                               error_rate=0.1, timeout_rate=0.05, timeout=3, seed=1)
+        draws = [faults.draw(faults.profile_latency) for _ in range(10000)]
+        errors = sum(1 for _, incident in draws if incident == "error")
+        timeouts = sum(1 for delay, incident in draws if incident == "timeout" and delay == 3)
+        self.assertAlmostEqual(errors / 10000, 0.1, delta=0.015)
+        self.assertAlmostEqual(timeouts / 10000, 0.05, delta=0.01)
+
+    def test_distribution_bounds(self):
+        rng = random.Random(0)
+        d = Distribution({"distribution": "exponential", "mean": 1.0, "max": 2.0})
+        self.assertTrue(all(0 <= d.sample(rng) <= 2.0 for _ in range(1000)))
+        self.assertEqual(Distribution(0.25).sample(rng), 0.25)
+        with self.assertRaises(ValueError):
+            Distribution({"distribution": "gauss"})
@@ -0,0 +1,166 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import unittest
+from app.core.crawler import QueueWorker, prime_queue, report_results
+from app.core.matcher import KeywordMatcher
+from app.core.models import Personne
+from app.core.services import WorkflowManager
+from app.core.work_queue import WorkItem
+from app.infra.storage.work_queue import SqliteWorkQueue
+from app.scraper.synthetic_graph import SyntheticGraph
+from tests.test_crawler import GraphBrowser
+from tests.test_workflow import MockRepository
+
+URL = "https://www.linkedin.com/in/p{}"
+
+def drain(db_path, worker, done):
+    """Worker de test (processus séparé) : traite les URLs jusqu'à épuisement de la file."""
+    queue = SqliteWorkQueue(db_path)
+    while True:
+        item = queue.lease(worker)
+        if item is None:
+            break
+        if queue.complete(item.url, worker, {"nom": item.url}, False):
+            done.put(item.url)
+    queue.close()
+
+class TestSqliteWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "queue.db")
+        self.now = 1000.0
+        self.queue = SqliteWorkQueue(self.path, lease_timeout=60, clock=lambda: self.now)
+
+    def tearDown(self):
+        self.queue.close()
+        self.tmp.cleanup()
+
+    def test_dedup_and_priority_order(self):
+        self.assertEqual(self.queue.add([WorkItem(URL.format(1), hops=1, priority=-1),
+                                         WorkItem(URL.format(2), hops=1, priority=-1),
+                                         WorkItem(URL.format(3) + "/?trk=x", hops=2, priority=-2)]), 3)
+        # Doublon (variante d'URL) : pas de nouvelle entrée, mais un chemin plus court est retenu
+        self.assertEqual(self.queue.add([WorkItem(URL.format(3) + "/", hops=0, priority=0)]), 0)
+        leased = [self.queue.lease("w").url for _ in range(3)]
+        self.assertEqual(leased, [URL.format(3), URL.format(1), URL.format(2)])
+        self.assertIsNone(self.queue.lease("w"))
+
+    def test_expired_lease_is_reclaimed(self):
+        self.queue.add([WorkItem(URL.format(1))])
+        self.assertEqual(self.queue.lease("crashed").url, URL.format(1))
+        self.assertIsNone(self.queue.lease("other"))
+        self.now += 61
+        item = self.queue.lease("other")
+        self.assertEqual((item.url, item.attempts), (URL.format(1), 2))
+        self.assertTrue(self.queue.complete(item.url, "other", {"nom": "A"}, True))
+        # Résultat tardif du worker "planté" : ignoré
+        self.assertFalse(self.queue.complete(item.url, "crashed", {"nom": "B"}, False))
+        [result] = self.queue.results()
+        self.assertEqual((result.data, result.interesting), ({"nom": "A"}, True))
+        self.queue.acknowledge([result.url])
+        self.assertEqual(self.queue.results(), [])
+
+    def test_fail_retries_then_gives_up(self):
+        self.queue.add([WorkItem(URL.format(1))])
+        for _ in range(2):
+            item = self.queue.lease("w")
+            self.queue.fail(item.url, "w", max_attempts=2)
+        self.assertIsNone(self.queue.lease("w"))
+        self.assertEqual(self.queue.stats()["failed"], 1)
+        self.assertIsNone(self.queue.results()[0].data)
+
+    def test_budget_counts_leased_urls(self):
+        self.queue.add([WorkItem(URL.format(i)) for i in range(5)])
+        self.assertIsNotNone(self.queue.lease("a", max_processed=2))
+        self.assertIsNotNone(self.queue.lease("b", max_processed=2))
+        self.assertIsNone(self.queue.lease("c", max_processed=2))
+
+    def test_concurrent_processes_process_each_url_once(self):
+        self.queue.add([WorkItem(URL.format(i)) for i in range(300)])
+        context = multiprocessing.get_context("spawn")
+        done = context.Queue()
+        workers = [context.Process(target=drain, args=(self.path, f"w{i}", done)) for i in range(3)]
+        for w in workers:
+            w.start()
+        urls = [done.get(timeout=60) for _ in range(300)]
+        for w in workers:
+            w.join(timeout=60)
+        self.assertEqual(sorted(urls), sorted(URL.format(i) for i in range(300)))
+        self.assertEqual(self.queue.stats()["done"], 300)
+
+class DictBrowser:
+    """Navigateur factice sur un petit graphe explicite : URL -> (profil, suggestions)."""
+    def __init__(self, pages):
+        self.pages = pages
+        self.current = None
+        self.calls = []
+
+    async def get_profile_data(self, url):
+        self.calls.append(url)
+        self.current = url
+        return dict(self.pages[url][0], url=url)
+
+    async def get_relations(self):
+        return self.pages[self.current][1]
+
+class TestQueueWorker(unittest.IsolatedAsyncioTestCase):
+    async def test_stored_persons_are_not_recrawled_or_duplicated(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            seed, known, new = URL.format("seed"), "https://www.linkedin.com/in/Known/", URL.format("new")
+            repo = MockRepository()
+            # Décision manuelle (IHM) : rejeté malgré un titre correspondant aux mots-clés
+            repo.save_person(Personne(url=known, nom="K", titre="CTO", analyzed=True, interesting=False))
+            workflow = WorkflowManager(repo)
+            workflow.load_initial_data()
+
+            queue = SqliteWorkQueue(os.path.join(tmp, "queue.db"))
+            index = prime_queue(queue, workflow)
+            queue.add([WorkItem(seed)])
+            browser = DictBrowser({
+                seed: ({"nom": "S", "titre": "Directeur"},
+                       [{"url": "https://www.linkedin.com/in/known", "nom": "K", "titre": "CTO"},
+                        {"url": new + "/", "nom": "N", "titre": "Manager"}]),
+                new: ({"nom": "N", "titre": "Manager"}, []),
+            })
+            await QueueWorker(queue, browser, KeywordMatcher(["CTO", "Manager", "Directeur"]), "w",
+                              max_persons=10, poll_interval=0.01).run()
+            self.assertEqual(browser.calls, [seed, new])
+
+            self.assertEqual(report_results(queue, workflow, index), 2)
+            self.assertEqual(sorted(workflow.all_persons), sorted([known, seed, new]))
+            self.assertFalse(workflow.all_persons[known].interesting)
+            self.assertEqual(workflow.all_persons[new].source_url, seed)
+            self.assertEqual(sorted(repo.saved_persons), sorted([known, seed, new]))
+            self.assertEqual(queue.stats()["known"], 1)
+            queue.close()
+
+
+    async def test_workers_share_frontier_and_report(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "queue.db")
+            graph = SyntheticGraph(nodes=5000, seed=3)
+            matcher = KeywordMatcher(["Directeur", "Head of", "CTO", "Manager"])
+            queues = [SqliteWorkQueue(path) for _ in range(3)]
+            queues[0].add([WorkItem(graph.url(1))])
+            workers = [QueueWorker(q, GraphBrowser(graph), matcher, f"w{i}", max_persons=40, poll_interval=0.01)
+                       for i, q in enumerate(queues)]
+            await asyncio.gather(*(w.run() for w in workers))
+
+            calls = [url for w in workers for url in w.browser.calls]
+            self.assertEqual(len(calls), 40)
+            self.assertEqual(len(set(calls)), 40)
+            self.assertTrue(all(w.stats.visited for w in workers))
+
+            repo = MockRepository()
+            workflow = WorkflowManager(repo)
+            self.assertEqual(report_results(queues[0], workflow), 40)
+            self.assertEqual(workflow.counters.analyzed, 40)
+            self.assertTrue(repo.saved_persons)
+            self.assertTrue(all(matcher.matches(p.titre) for p in repo.saved_persons.values()))
+            for q in queues:
+                q.close()
+
+if __name__ == "__main__":
+    unittest.main()
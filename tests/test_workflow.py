@@ -3,6 +3,7 @@ from collections import deque
 from app.core.models import Personne
 from app.core.services import WorkflowManager
 from app.core.repository import PersonRepository
+from app.core.events import ChangeKind
 
 class MockRepository(PersonRepository):
     def __init__(self):
@@ -18,6 +19,12 @@ class MockRepository(PersonRepository):
         if person.url in self.saved_persons:
             del self.saved_persons[person.url]
 
+    def exists(self):
+        return True
+
+    def save_all(self, persons):
+        self.saved_persons = {p.url: p for p in persons if p.interesting}
+
 class TestWorkflow(unittest.TestCase):
     def setUp(self):
         self.repo = MockRepository()
@@ -26,12 +33,12 @@ class TestWorkflow(unittest.TestCase):
     def test_add_person_deduplication(self):
         p1 = self.workflow.add_person("https://www.linkedin.com/in/user1")
         self.assertIsNotNone(p1)
-        self.assertEqual(len(self.workflow.queue), 1)
+        self.assertEqual(len(self.workflow.all_persons), 1)
         
         # Test doublon
         p2 = self.workflow.add_person("https://www.linkedin.com/in/user1")
         self.assertIsNone(p2)
-        self.assertEqual(len(self.workflow.queue), 1)
+        self.assertEqual(len(self.workflow.all_persons), 1)
 
     def test_workflow_steps(self):
         p = self.workflow.add_person("https://www.linkedin.com/in/user2", "ref_url")
@@ -89,5 +96,51 @@ class TestWorkflow(unittest.TestCase):
         self.assertEqual(p.nom, "Jean")
         self.assertEqual(p.titre, "Dev")
 
+    def test_pending_index_and_counters(self):
+        p1 = self.workflow.add_person("https://www.linkedin.com/in/a")
+        p2 = self.workflow.add_person("https://www.linkedin.com/in/b")
+        self.assertEqual(self.workflow.counters.total, 2)
+        self.assertEqual(self.workflow.counters.pending, 2)
+        self.assertTrue(self.workflow.has_pending_persons())
+
+        # Sélection directe (clic dans le tableau) : la personne quitte la file
+        self.workflow.mark_analyzed(p1)
+        self.assertEqual(self.workflow.get_next_person(), p2)
+        self.assertEqual(self.workflow.counters.pending, 1)
+        self.assertEqual(self.workflow.counters.analyzed, 1)
+
+        self.workflow.set_current_person_decision(True)
+        self.assertFalse(self.workflow.has_pending_persons())
+        self.assertIsNone(self.workflow.get_next_person())
+        self.assertEqual(self.workflow.counters.interesting, 1)
+
+        self.workflow.set_current_person_decision(False)
+        self.assertEqual(self.workflow.counters.interesting, 0)
+        self.assertEqual(self.workflow.counters.analyzed, 2)
+
+    def test_load_initial_data_counters(self):
+        self.repo.saved_persons["u1"] = Personne(url="u1", analyzed=True, interesting=True)
+        self.workflow.load_initial_data()
+        self.assertEqual(self.workflow.counters.total, 1)
+        self.assertEqual(self.workflow.counters.interesting, 1)
+        self.assertEqual(self.workflow.counters.pending, 0)
+
+    def test_change_events(self):
+        events = []
+        self.workflow.events.subscribe(events.append)
+
+        p = self.workflow.add_person("https://www.linkedin.com/in/user5")
+        self.workflow.get_next_person()
+        self.workflow.update_current_person_info({"titre": "CTO"})
+        self.workflow.set_current_person_decision(True)
+        self.workflow.set_current_person_decision(True) # Aucun changement : pas d'événement
+
+        self.assertEqual([(e.kind, e.urls) for e in events], [
+            (ChangeKind.PERSON_ADDED, (p.url,)),
+            (ChangeKind.CURRENT_CHANGED, (p.url,)),
+            (ChangeKind.FIELDS_UPDATED, (p.url,)),
+            (ChangeKind.DECISION_CHANGED, (p.url,)),
+        ])
+
 if __name__ == '__main__':
     unittest.main()